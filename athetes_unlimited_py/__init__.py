@@ -2,14 +2,228 @@
 #
 #  Imports
 #
-#  In the future, this will be explicitly imported.
+#  Submodules (and the packages they depend on, like pandas, requests
+#  and pyarrow) are only imported the first time one of their functions
+#  is used, so `import athetes_unlimited_py` stays cheap (PEP 562).
 #
 ##############################################################################
 
-from athetes_unlimited_py.basketball import *
-from athetes_unlimited_py.lacrosse import *
-from athetes_unlimited_py.softball import *
-from athetes_unlimited_py.aux_softball import *
-from athetes_unlimited_py.volleyball import *
+import importlib
+from typing import TYPE_CHECKING
 
-from athetes_unlimited_py.utils import *
+# Every public name of the package, and the submodule it is found in.
+_AU_SUBMODULE_ATTRS = {
+    "basketball": (
+        "get_au_basketball_season",
+        "get_au_basketball_season_id",
+        "get_au_basketball_game_stats",
+        "get_au_basketball_pbp",
+        "get_au_basketball_season_pbp",
+        "get_au_basketball_season_box",
+        "iter_au_basketball_season_pbp",
+        "iter_au_basketball_season_box",
+        "get_au_basketball_season_player_box",
+        "get_au_basketball_season_team_box",
+        "get_au_basketball_season_player_stats",
+        "get_au_basketball_season_team_stats",
+    ),
+    "lacrosse": (
+        "get_au_lacrosse_season",
+        "get_au_lacrosse_season_id",
+        "get_au_lacrosse_game_stats",
+        "get_au_lacrosse_pbp",
+        "get_au_lacrosse_season_pbp",
+        "get_au_lacrosse_season_box",
+        "iter_au_lacrosse_season_pbp",
+        "iter_au_lacrosse_season_box",
+        "get_au_lacrosse_season_player_box",
+        "get_au_lacrosse_season_team_box",
+        "get_au_lacrosse_season_player_stats",
+        "get_au_lacrosse_season_team_stats",
+    ),
+    "softball": (
+        "get_au_softball_season",
+        "get_au_softball_season_id",
+        "get_au_softball_game_stats",
+        "get_au_softball_pbp",
+        "get_au_softball_season_pbp",
+        "get_au_softball_season_box",
+        "iter_au_softball_season_pbp",
+        "iter_au_softball_season_box",
+        "get_au_softball_season_player_box",
+        "get_au_softball_season_team_box",
+        "get_au_softball_season_player_stats",
+        "get_au_softball_season_team_stats",
+        "au_softball_innings_to_outs",
+        "au_softball_outs_to_innings",
+    ),
+    "aux_softball": (
+        "get_aux_softball_season_id",
+        "get_aux_softball_season_pbp",
+        "get_aux_softball_season_box",
+        "iter_aux_softball_season_pbp",
+        "iter_aux_softball_season_box",
+        "get_aux_softball_season_player_box",
+        "get_aux_softball_season_team_box",
+        "get_aux_softball_season_player_stats",
+        "get_aux_softball_season_team_stats",
+    ),
+    "volleyball": (
+        "get_au_volleyball_season",
+        "get_au_volleyball_season_id",
+        "get_au_volleyball_game_stats",
+        "get_au_volleyball_pbp",
+        "get_au_volleyball_season_pbp",
+        "get_au_volleyball_season_box",
+        "iter_au_volleyball_season_pbp",
+        "iter_au_volleyball_season_box",
+        "get_au_volleyball_season_player_box",
+        "get_au_volleyball_season_team_box",
+        "get_au_volleyball_season_player_stats",
+        "get_au_volleyball_season_team_stats",
+    ),
+    "cache": (
+        "configure_au_cache",
+        "get_au_cache_dir",
+        "clear_au_cache",
+    ),
+    "client": (
+        "AU_PROXY_URL",
+        "AU_USER_AGENT",
+        "AU_RETRY_STATUS_CODES",
+        "configure_au_client",
+        "get_au_session",
+        "set_au_session",
+        "get_au_response",
+        "get_au_json",
+        "get_au_season_catalog",
+        "refresh_au_season_catalog",
+    ),
+    "decode": (
+        "AU_JSON_BACKENDS",
+        "configure_au_json",
+        "get_au_json_backend",
+        "au_json_loads",
+    ),
+    "loader": (
+        "AU_LOAD_DATASETS",
+        "get_au_load_plan",
+        "load_au_seasons",
+    ),
+    "metrics": (
+        "AUMetricsRegistry",
+        "configure_au_metrics",
+        "get_au_metrics",
+        "write_au_metrics",
+    ),
+    "progress": (
+        "AUProgress",
+        "AUTqdmProgress",
+        "set_au_progress",
+        "get_au_progress",
+    ),
+    "replay": (
+        "AU_REPLAY_MODES",
+        "configure_au_replay",
+        "get_au_replay_mode",
+        "au_payload_path",
+    ),
+    "reparse": (
+        "reparse_au_season_box",
+        "reparse_au_season_pbp",
+    ),
+    "schemas": (
+        "AU_SCHEMAS",
+        "get_au_schema",
+        "get_au_dtypes",
+        "au_to_arrow",
+        "au_to_compact",
+        "au_to_parquet",
+    ),
+    "season": (
+        "AU_SEASON_SPORTS",
+        "AUSeason",
+        "get_au_season",
+        "clear_au_seasons",
+        "register_au_season",
+        "refresh_au_season_ids",
+        "get_au_unmapped_season_ids",
+        "get_au_season_ids",
+        "get_au_season_id",
+        "get_au_season_year",
+    ),
+    "server": (
+        "AU_STAND_IN_ERROR_STATUSES",
+        "AUStandInServer",
+        "start_au_stand_in_server",
+    ),
+    "sync": (
+        "AU_SYNC_DATASETS",
+        "get_au_sync_manifest",
+        "sync_au_season_box",
+        "sync_au_season_pbp",
+    ),
+    "utils": (
+        "AU_OUTPUTS",
+        "raise_html_status_code",
+        "au_imap_games",
+        "au_map_games",
+        "au_chunk_games",
+        "au_chunk_game_pairs",
+        "au_concat_games",
+        "au_concat_game_pairs",
+        "au_select_game_stats",
+        "au_parse_game_roster",
+    ),
+}
+
+_AU_ATTR_SUBMODULES = {
+    name: submodule
+    for submodule, names in _AU_SUBMODULE_ATTRS.items()
+    for name in names
+}
+
+__all__ = list(_AU_ATTR_SUBMODULES)
+
+
+def __getattr__(name: str):
+    """
+    Imports the submodule `name` is found in the first time `name` is used.
+    """
+    if name in _AU_SUBMODULE_ATTRS or name == "aio":
+        return importlib.import_module(f"{__name__}.{name}")
+
+    submodule = _AU_ATTR_SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    # Saved, so that `__getattr__()` isn't called again for `name`.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__) | set(_AU_SUBMODULE_ATTRS) | {"aio"})
+
+
+if TYPE_CHECKING:
+    from athetes_unlimited_py.basketball import *
+    from athetes_unlimited_py.lacrosse import *
+    from athetes_unlimited_py.softball import *
+    from athetes_unlimited_py.aux_softball import *
+    from athetes_unlimited_py.volleyball import *
+
+    from athetes_unlimited_py.cache import *
+    from athetes_unlimited_py.client import *
+    from athetes_unlimited_py.decode import *
+    from athetes_unlimited_py.loader import *
+    from athetes_unlimited_py.metrics import *
+    from athetes_unlimited_py.progress import *
+    from athetes_unlimited_py.replay import *
+    from athetes_unlimited_py.reparse import *
+    from athetes_unlimited_py.schemas import *
+    from athetes_unlimited_py.season import *
+    from athetes_unlimited_py.server import *
+    from athetes_unlimited_py.sync import *
+    from athetes_unlimited_py.utils import *
@@ -0,0 +1,1428 @@
+"""
+Async (`asyncio`) versions of the `get_au_*` functions.
+
+Every function in this module has the same name, arguments and output
+as its sync counterpart, but is a coroutine,
+and downloads data without blocking the event loop.
+Parsing is shared with the sync functions, so both return identical data.
+
+Requires `aiohttp`, which can be installed with:
+
+    pip install athletes_unlimited_py[aio]
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pandas as pd
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError(
+        '`athetes_unlimited_py.aio` requires `aiohttp`.\n' +
+        'You can install it with `pip install athletes_unlimited_py[aio]`.'
+    ) from e
+
+from athetes_unlimited_py import client, metrics, replay
+from athetes_unlimited_py.cache import _read_au_cache, _write_au_cache
+from athetes_unlimited_py.decode import au_json_loads
+from athetes_unlimited_py.metrics import _au_measure
+from athetes_unlimited_py.progress import _au_game_fetched, get_au_progress
+from athetes_unlimited_py.basketball import (
+    _au_basketball_game_stats_request,
+    _au_basketball_pbp_request,
+    _au_basketball_season_player_stats_from_box,
+    _au_basketball_season_team_stats_from_box,
+    _parse_au_basketball_game_stats,
+    _parse_au_basketball_pbp,
+    get_au_basketball_season_id,
+)
+from athetes_unlimited_py.lacrosse import (
+    _au_lacrosse_game_stats_request,
+    _au_lacrosse_pbp_request,
+    _au_lacrosse_season_player_stats_from_box,
+    _au_lacrosse_season_team_stats_from_box,
+    _parse_au_lacrosse_game_stats,
+    _parse_au_lacrosse_pbp,
+    get_au_lacrosse_season,
+    get_au_lacrosse_season_id,
+)
+from athetes_unlimited_py.softball import (
+    _au_softball_box_from_rows,
+    _au_softball_game_stats_request,
+    _au_softball_pbp_request,
+    _au_softball_season_player_stats_from_box,
+    _au_softball_season_team_stats_from_box,
+    _flatten_au_softball_game_stats,
+    _parse_au_softball_game_stats,
+    _parse_au_softball_pbp,
+    get_au_softball_season,
+    get_au_softball_season_id,
+)
+from athetes_unlimited_py.aux_softball import (
+    _aux_softball_season_player_stats_from_box,
+    _aux_softball_season_team_stats_from_box,
+    get_aux_softball_season_id,
+)
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_game_pbp_output,
+    _au_game_stats_output,
+    _au_season_output,
+    au_concat_game_pairs,
+    au_concat_games,
+    raise_html_status_code,
+)
+from athetes_unlimited_py.volleyball import (
+    _au_volleyball_game_stats_request,
+    _au_volleyball_pbp_request,
+    _au_volleyball_season_player_stats_from_box,
+    _au_volleyball_season_team_stats_from_box,
+    _parse_au_volleyball_game_stats,
+    _parse_au_volleyball_pbp,
+    get_au_volleyball_season,
+    get_au_volleyball_season_id,
+)
+
+##############################################################################
+##
+# Async HTTP client
+##
+##############################################################################
+
+
+def build_au_aio_session() -> aiohttp.ClientSession:
+    """
+    Builds an `aiohttp.ClientSession` using the same pool size,
+    timeouts and `User-Agent` as the shared sync client
+    (see `configure_au_client()`).
+
+    Must be called from inside a running event loop.
+    The caller is responsible for closing the session.
+    """
+    settings = client._au_client_settings
+    timeout = settings["timeout"]
+
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        client_timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout,
+            sock_read=read_timeout
+        )
+    else:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=settings["pool_size"]),
+        headers={"User-Agent": settings["user_agent"]},
+        timeout=client_timeout
+    )
+
+
+@asynccontextmanager
+async def _au_aio_session(session: aiohttp.ClientSession = None):
+    """
+    Yields `session` if one was given,
+    otherwise yields a new session that is closed on exit.
+    """
+    if session is not None:
+        yield session
+        return
+
+    session = build_au_aio_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_au_json(
+        request: str,
+        cache_buster: bool = True,
+        cache_key: tuple = None,
+        session: aiohttp.ClientSession = None) -> dict:
+    """
+    Sends a GET request to the auprosports.com API proxy,
+    and returns the parsed JSON body of the response.
+
+    Parameters
+    ----------
+    `request` (str, mandatory):
+        The API path passed to the proxy,
+        e.g. `/api/play-by-play/softball/v1/event/14/game/1`.
+
+    `cache_buster` (bool, optional) = True:
+        If set to `True`, the `k` key the website uses to bust caches
+        will be appended to `request`.
+
+    `cache_key` (tuple, optional) = None:
+        A `(sport, endpoint, season_id, game)` tuple identifying this response.
+        If set, and the on-disk cache is turned on (see `configure_au_cache()`),
+        the response will be read from, and saved to, the cache.
+        Record/replay (see `configure_au_replay()`) works the same way
+        as in the sync client.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to send this request with.
+        If not set, a new session is opened and closed for this request.
+
+    Returns
+    ----------
+    A dict containing the JSON of this response.
+    If the response has a bad HTTP status code, an exception will be raised.
+    """
+    replay_mode = replay._au_replay_settings["mode"]
+
+    # Payload and cache files are read and written in worker threads,
+    # so that the event loop isn't blocked.
+    if replay_mode == "replay":
+        return await asyncio.to_thread(replay._read_au_replay, request)
+
+    cached_entry, is_fresh = await asyncio.to_thread(_read_au_cache, cache_key)
+
+    if is_fresh == True:
+        if metrics._au_metrics is not None:
+            metrics._au_record_cache_hit(request)
+        if replay_mode == "record":
+            await asyncio.to_thread(
+                replay._write_au_replay, request, cached_entry["data"])
+        return cached_entry["data"]
+
+    url = client._build_au_url(request, cache_buster=cache_buster)
+
+    async with _au_aio_session(session) as s:
+        json_data = await _get_au_json_with_retries(s, url, request)
+
+    await asyncio.to_thread(_write_au_cache, cache_key, json_data, cached_entry)
+
+    if replay_mode == "record":
+        await asyncio.to_thread(replay._write_au_replay, request, json_data)
+    return json_data
+
+
+async def _get_au_json_with_retries(
+        session: aiohttp.ClientSession,
+        url: str,
+        request: str = "") -> dict:
+    """
+    Sends a GET request, using the same rate limiter and retry policy
+    as the sync client (see `configure_au_client()`),
+    and returns the parsed JSON body of the response.
+    `request` is the API path of `url`, used to tag metrics.
+    """
+    attempt = 0
+
+    while True:
+        await asyncio.sleep(client._au_rate_limit_delay())
+        started_at = time.perf_counter()
+
+        try:
+            async with session.get(url) as response:
+                is_done = response.status not in client.AU_RETRY_STATUS_CODES or \
+                    attempt >= client._au_client_settings["max_retries"]
+
+                if is_done == True:
+                    body = await response.read()
+                else:
+                    body = None
+
+                if metrics._au_metrics is not None:
+                    metrics._au_record_request(
+                        request,
+                        response.status,
+                        time.perf_counter() - started_at,
+                        num_bytes=response.content_length or (
+                            len(body) if body is not None else 0),
+                        retried=not is_done
+                    )
+
+                if is_done == True:
+                    raise_html_status_code(response.status)
+
+                    if metrics._au_metrics is None:
+                        return au_json_loads(body)
+
+                    started_at = time.perf_counter()
+                    json_data = au_json_loads(body)
+                    metrics._au_record_decode(
+                        request, time.perf_counter() - started_at)
+                    return json_data
+
+                delay = client._au_retry_delay(
+                    attempt, response.headers.get("Retry-After"))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if metrics._au_metrics is not None:
+                metrics._au_record_request(
+                    request,
+                    type(e).__name__,
+                    time.perf_counter() - started_at,
+                    retried=attempt < client._au_client_settings["max_retries"]
+                )
+
+            if attempt >= client._au_client_settings["max_retries"]:
+                raise
+            delay = client._au_retry_delay(attempt)
+
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def _au_gather_games(
+        get_game,
+        games,
+        max_concurrency: int,
+        sport: str = None,
+        season: int = None) -> list:
+    """
+    Async version of `au_map_games()`.
+    Awaits `get_game()` for every item in `games`, with no more than
+    `max_concurrency` games in flight at once,
+    and returns the results in the same order as `games`.
+    """
+    if max_concurrency < 1:
+        raise ValueError('`max_concurrency` cannot be less than 1.')
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    progress = get_au_progress()
+
+    async def run(game):
+        async with semaphore:
+            if progress is None:
+                return await get_game(game)
+
+            progress.game_started(sport, season, game)
+            try:
+                result = await get_game(game)
+            except Exception as e:
+                progress.game_failed(sport, season, game, e)
+                raise
+
+            progress.game_parsed(sport, season, game)
+            return result
+
+    games = list(games)
+    if progress is None:
+        return await asyncio.gather(*(run(g) for g in games))
+
+    progress.season_started(sport, season, len(games))
+    try:
+        return await asyncio.gather(*(run(g) for g in games))
+    finally:
+        progress.season_finished(sport, season)
+
+
+def _au_season_stats_output(
+        from_box,
+        game_stats_df: pd.DataFrame,
+        sport: str,
+        dataset: str,
+        season: int,
+        output: str):
+    """
+    Calculates season stats from the box scores of a season with `from_box()`,
+    and returns them in the format set by `output`.
+    Run in a worker thread, so that the event loop isn't blocked.
+    """
+    season_stats_df = _au_measure(
+        "aggregate", sport, dataset, season, from_box, game_stats_df, season)
+    return _au_season_output(season_stats_df, sport, dataset, output)
+
+
+async def _au_season_game_ids(sport: str, season_id: int) -> list:
+    """
+    Returns the game IDs for a season ID, in the order the API lists them.
+    If the season ID isn't in the API, an empty list is returned.
+    The catalog comes from `get_au_season_catalog()` (in a thread),
+    so coroutines and threads share its locks and its one download.
+    """
+    sport_json_data = await asyncio.to_thread(client.get_au_season_catalog, sport)
+
+    for i in sport_json_data['data']:
+        if i['seasonId'] == season_id:
+            return list(i['gameIds'])
+
+    return []
+
+##############################################################################
+##
+# Basketball
+##
+##############################################################################
+
+
+async def get_au_basketball_game_stats(
+        season: int,
+        game_num: int,
+        get_team_stats=False,
+        get_player_and_team_stats=False,
+        rename_cols=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_game_stats()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    season_id = get_au_basketball_season_id(season)
+
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_basketball_game_stats_request(season_id, game_num)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    player_stats_df, team_stats_df = await asyncio.to_thread(
+        _parse_au_basketball_game_stats, json_data)
+
+    return await asyncio.to_thread(
+        _au_game_stats_output,
+        player_stats_df,
+        team_stats_df,
+        "basketball",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
+
+
+async def get_au_basketball_pbp(
+        season: int,
+        game_id: int,
+        return_participation_data=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas"):
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_pbp()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    season_id = get_au_basketball_season_id(season)
+
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
+
+    request, cache_key = _au_basketball_pbp_request(season_id, game_id)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    pbp = await asyncio.to_thread(
+        _parse_au_basketball_pbp,
+        json_data,
+        season,
+        game_id,
+        return_participation_data
+    )
+
+    return await asyncio.to_thread(
+        _au_game_pbp_output, pbp, "basketball", output)
+
+
+async def get_au_basketball_season_pbp(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_pbp()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+        Games are always returned in the same order,
+        regardless of how many games are downloaded at once.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_basketball_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("basketball", season_id)
+
+        async def get_game(j):
+            return await get_au_basketball_pbp(season, j, session=s)
+
+        game_dfs = await _au_gather_games(
+            get_game, game_ids, max_concurrency, sport="basketball", season=season)
+
+    season_pbp_df = await asyncio.to_thread(au_concat_games, game_dfs)
+    return await asyncio.to_thread(
+        _au_season_output, season_pbp_df, "basketball", "pbp", output)
+
+
+async def get_au_basketball_season_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> tuple:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_basketball_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("basketball", season_id)
+
+        async def get_game(j):
+            request, cache_key = _au_basketball_game_stats_request(season_id, j)
+            json_data = await get_au_json(
+                request, cache_key=cache_key, session=s)
+            _au_game_fetched("basketball", season, j)
+            return await asyncio.to_thread(
+                _au_measure, "parse", "basketball", "box", season,
+                _parse_au_basketball_game_stats, json_data)
+
+        game_pairs = await _au_gather_games(
+            get_game, range(1, len(game_ids)+1), max_concurrency,
+            sport="basketball", season=season)
+
+    season_player_df, season_team_df = await asyncio.to_thread(
+        au_concat_game_pairs, game_pairs)
+    return (
+        await asyncio.to_thread(
+            _au_season_output, season_player_df, "basketball", "player_box", output),
+        await asyncio.to_thread(
+            _au_season_output, season_team_df, "basketball", "team_box", output)
+    )
+
+
+async def get_au_basketball_season_player_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_player_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    player_box_df, _ = await get_au_basketball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return player_box_df
+
+
+async def get_au_basketball_season_team_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_team_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    _, team_box_df = await get_au_basketball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return team_box_df
+
+
+async def get_au_basketball_season_player_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_player_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_basketball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_basketball_season_player_stats_from_box,
+        game_stats_df, "basketball", "player_stats", season, output)
+
+
+async def get_au_basketball_season_team_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_basketball_season_team_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_basketball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_basketball_season_team_stats_from_box,
+        game_stats_df, "basketball", "team_stats", season, output)
+
+##############################################################################
+##
+# Lacrosse
+##
+##############################################################################
+
+
+async def get_au_lacrosse_game_stats(
+        season_id: int,
+        game_num: int,
+        get_team_stats=False,
+        get_player_and_team_stats=False,
+        rename_cols=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_game_stats()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_lacrosse_game_stats_request(season_id, game_num)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    player_stats_df, team_stats_df = await asyncio.to_thread(
+        _parse_au_lacrosse_game_stats, json_data)
+
+    return await asyncio.to_thread(
+        _au_game_stats_output,
+        player_stats_df,
+        team_stats_df,
+        "lacrosse",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
+
+
+async def get_au_lacrosse_pbp(
+        season_id: int,
+        game_id: int,
+        return_participation_data=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas"):
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_pbp()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    season = get_au_lacrosse_season(season_id)
+
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
+
+    request, cache_key = _au_lacrosse_pbp_request(season_id, game_id)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    pbp = await asyncio.to_thread(
+        _parse_au_lacrosse_pbp,
+        json_data,
+        season,
+        game_id,
+        return_participation_data
+    )
+
+    return await asyncio.to_thread(
+        _au_game_pbp_output, pbp, "lacrosse", output)
+
+
+async def get_au_lacrosse_season_pbp(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_pbp()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+        Games are always returned in the same order,
+        regardless of how many games are downloaded at once.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_lacrosse_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("lacrosse", season_id)
+
+        async def get_game(j):
+            return await get_au_lacrosse_pbp(season_id, j, session=s)
+
+        game_dfs = await _au_gather_games(
+            get_game, game_ids, max_concurrency, sport="lacrosse", season=season)
+
+    season_pbp_df = await asyncio.to_thread(au_concat_games, game_dfs)
+    return await asyncio.to_thread(
+        _au_season_output, season_pbp_df, "lacrosse", "pbp", output)
+
+
+async def get_au_lacrosse_season_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> tuple:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_lacrosse_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("lacrosse", season_id)
+
+        async def get_game(j):
+            request, cache_key = _au_lacrosse_game_stats_request(season_id, j)
+            json_data = await get_au_json(
+                request, cache_key=cache_key, session=s)
+            _au_game_fetched("lacrosse", season, j)
+            return await asyncio.to_thread(
+                _au_measure, "parse", "lacrosse", "box", season,
+                _parse_au_lacrosse_game_stats, json_data)
+
+        game_pairs = await _au_gather_games(
+            get_game, range(1, len(game_ids)+1), max_concurrency,
+            sport="lacrosse", season=season)
+
+    season_player_df, season_team_df = await asyncio.to_thread(
+        au_concat_game_pairs, game_pairs)
+    return (
+        await asyncio.to_thread(
+            _au_season_output, season_player_df, "lacrosse", "player_box", output),
+        await asyncio.to_thread(
+            _au_season_output, season_team_df, "lacrosse", "team_box", output)
+    )
+
+
+async def get_au_lacrosse_season_player_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_player_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    player_box_df, _ = await get_au_lacrosse_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return player_box_df
+
+
+async def get_au_lacrosse_season_team_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_team_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    _, team_box_df = await get_au_lacrosse_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return team_box_df
+
+
+async def get_au_lacrosse_season_player_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_player_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_lacrosse_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_lacrosse_season_player_stats_from_box,
+        game_stats_df, "lacrosse", "player_stats", season, output)
+
+
+async def get_au_lacrosse_season_team_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_lacrosse_season_team_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_lacrosse_season_team_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_lacrosse_season_team_stats_from_box,
+        game_stats_df, "lacrosse", "team_stats", season, output)
+
+##############################################################################
+##
+# Volleyball
+##
+##############################################################################
+
+
+async def get_au_volleyball_game_stats(
+        season_id: int,
+        game_num: int,
+        get_team_stats=False,
+        get_player_and_team_stats=False,
+        rename_cols=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_game_stats()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_volleyball_game_stats_request(season_id, game_num)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    player_stats_df, team_stats_df = await asyncio.to_thread(
+        _parse_au_volleyball_game_stats, json_data)
+
+    return await asyncio.to_thread(
+        _au_game_stats_output,
+        player_stats_df,
+        team_stats_df,
+        "volleyball",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
+
+
+async def get_au_volleyball_pbp(
+        season_id: int,
+        game_id: int,
+        return_participation_data=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas"):
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_pbp()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    season = get_au_volleyball_season(season_id)
+
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
+
+    request, cache_key = _au_volleyball_pbp_request(season_id, game_id)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    pbp = await asyncio.to_thread(
+        _parse_au_volleyball_pbp,
+        json_data,
+        season,
+        game_id,
+        return_participation_data
+    )
+
+    return await asyncio.to_thread(
+        _au_game_pbp_output, pbp, "volleyball", output)
+
+
+async def get_au_volleyball_season_pbp(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_pbp()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+        Games are always returned in the same order,
+        regardless of how many games are downloaded at once.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_volleyball_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("volleyball", season_id)
+
+        async def get_game(j):
+            return await get_au_volleyball_pbp(season_id, j, session=s)
+
+        game_dfs = await _au_gather_games(
+            get_game, game_ids, max_concurrency, sport="volleyball", season=season)
+
+    season_pbp_df = await asyncio.to_thread(au_concat_games, game_dfs)
+    return await asyncio.to_thread(
+        _au_season_output, season_pbp_df, "volleyball", "pbp", output)
+
+
+async def get_au_volleyball_season_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> tuple:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_id = get_au_volleyball_season_id(season)
+
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("volleyball", season_id)
+
+        async def get_game(j):
+            request, cache_key = _au_volleyball_game_stats_request(season_id, j)
+            json_data = await get_au_json(
+                request, cache_key=cache_key, session=s)
+            _au_game_fetched("volleyball", season, j)
+            return await asyncio.to_thread(
+                _au_measure, "parse", "volleyball", "box", season,
+                _parse_au_volleyball_game_stats, json_data)
+
+        game_pairs = await _au_gather_games(
+            get_game, range(1, len(game_ids)+1), max_concurrency,
+            sport="volleyball", season=season)
+
+    season_player_df, season_team_df = await asyncio.to_thread(
+        au_concat_game_pairs, game_pairs)
+    return (
+        await asyncio.to_thread(
+            _au_season_output, season_player_df, "volleyball", "player_box", output),
+        await asyncio.to_thread(
+            _au_season_output, season_team_df, "volleyball", "team_box", output)
+    )
+
+
+async def get_au_volleyball_season_player_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_player_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    player_box_df, _ = await get_au_volleyball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return player_box_df
+
+
+async def get_au_volleyball_season_team_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_team_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    _, team_box_df = await get_au_volleyball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return team_box_df
+
+
+async def get_au_volleyball_season_player_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_player_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_volleyball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_volleyball_season_player_stats_from_box,
+        game_stats_df, "volleyball", "player_stats", season, output)
+
+
+async def get_au_volleyball_season_team_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_volleyball_season_team_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_volleyball_season_team_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_volleyball_season_team_stats_from_box,
+        game_stats_df, "volleyball", "team_stats", season, output)
+
+##############################################################################
+##
+# Softball
+##
+##############################################################################
+
+
+async def get_au_softball_game_stats(
+        season_id: int,
+        game_num: int,
+        get_team_stats: bool = False,
+        get_player_and_team_stats: bool = False,
+        rename_cols: bool = False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_game_stats()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_softball_game_stats_request(season_id, game_num)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    player_stats_df, team_stats_df = await asyncio.to_thread(
+        _parse_au_softball_game_stats, json_data)
+
+    return await asyncio.to_thread(
+        _au_game_stats_output,
+        player_stats_df,
+        team_stats_df,
+        "softball",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
+
+
+async def get_au_softball_pbp(
+        season_id: int,
+        game_id: int,
+        return_participation_data=False,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas"):
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_pbp()`.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this game with.
+        If not set, a new session is opened and closed for this game.
+    """
+    _au_check_output(output)
+    season = get_au_softball_season(season_id)
+
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
+
+    request, cache_key = _au_softball_pbp_request(season_id, game_id)
+
+    json_data = await get_au_json(
+        request, cache_key=cache_key, session=session)
+
+    pbp = await asyncio.to_thread(
+        _parse_au_softball_pbp,
+        json_data,
+        season,
+        game_id,
+        return_participation_data
+    )
+
+    return await asyncio.to_thread(
+        _au_game_pbp_output, pbp, "softball", output)
+
+
+async def _au_softball_season_pbp(
+        season_id: int,
+        max_concurrency: int,
+        session: aiohttp.ClientSession,
+        sport: str = "softball",
+        season: int = None) -> pd.DataFrame:
+    """
+    Shared by `get_au_softball_season_pbp()` and `get_aux_softball_season_pbp()`.
+    `sport` and `season` are sent with progress events (see `set_au_progress()`).
+    """
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("softball", season_id)
+
+        async def get_game(j):
+            return await get_au_softball_pbp(season_id, j, session=s)
+
+        game_dfs = await _au_gather_games(
+            get_game, game_ids, max_concurrency, sport=sport, season=season)
+
+    return await asyncio.to_thread(au_concat_games, game_dfs)
+
+
+async def _au_softball_season_box(
+        season_id: int,
+        max_concurrency: int,
+        session: aiohttp.ClientSession,
+        sport: str = "softball",
+        season: int = None) -> tuple:
+    """
+    Shared by the AU and AUX softball season box score functions.
+    Returns the player and team box scores of the season.
+    `sport` and `season` are sent with progress events (see `set_au_progress()`).
+    """
+    async with _au_aio_session(session) as s:
+        game_ids = await _au_season_game_ids("softball", season_id)
+
+        async def get_game(j):
+            request, cache_key = _au_softball_game_stats_request(season_id, j)
+            json_data = await get_au_json(
+                request, cache_key=cache_key, session=s)
+            _au_game_fetched(sport, season, j)
+            return await asyncio.to_thread(
+                _au_measure, "parse", sport, "box", season,
+                _flatten_au_softball_game_stats, json_data)
+
+        game_rows = await _au_gather_games(
+            get_game, range(1, len(game_ids)+1), max_concurrency,
+            sport=sport, season=season)
+
+    season_player_rows = []
+    season_team_rows = []
+    for player_rows, team_rows in game_rows:
+        season_player_rows.extend(player_rows)
+        season_team_rows.extend(team_rows)
+
+    return (
+        await asyncio.to_thread(
+            _au_softball_box_from_rows, season_player_rows, True),
+        await asyncio.to_thread(
+            _au_softball_box_from_rows, season_team_rows, False)
+    )
+
+
+async def get_au_softball_season_pbp(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_pbp()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+        Games are always returned in the same order,
+        regardless of how many games are downloaded at once.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_pbp_df = await _au_softball_season_pbp(
+        get_au_softball_season_id(season), max_concurrency, session,
+        sport="softball", season=season)
+    return await asyncio.to_thread(
+        _au_season_output, season_pbp_df, "softball", "pbp", output)
+
+
+async def get_au_softball_season_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> tuple:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_player_df, season_team_df = await _au_softball_season_box(
+        get_au_softball_season_id(season), max_concurrency, session,
+        sport="softball", season=season)
+
+    return (
+        await asyncio.to_thread(
+            _au_season_output, season_player_df, "softball", "player_box", output),
+        await asyncio.to_thread(
+            _au_season_output, season_team_df, "softball", "team_box", output)
+    )
+
+
+async def get_au_softball_season_player_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_player_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    player_box_df, _ = await get_au_softball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return player_box_df
+
+
+async def get_au_softball_season_team_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_team_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    _, team_box_df = await get_au_softball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return team_box_df
+
+
+async def get_au_softball_season_player_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_player_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_softball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_softball_season_player_stats_from_box,
+        game_stats_df, "softball", "player_stats", season, output)
+
+
+async def get_au_softball_season_team_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_au_softball_season_team_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_au_softball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _au_softball_season_team_stats_from_box,
+        game_stats_df, "softball", "team_stats", season, output)
+
+##############################################################################
+##
+# AUX Softball
+##
+##############################################################################
+
+
+async def get_aux_softball_season_pbp(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_pbp()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+        Games are always returned in the same order,
+        regardless of how many games are downloaded at once.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_pbp_df = await _au_softball_season_pbp(
+        get_aux_softball_season_id(season), max_concurrency, session,
+        sport="aux_softball", season=season)
+    return await asyncio.to_thread(
+        _au_season_output, season_pbp_df, "aux_softball", "pbp", output)
+
+
+async def get_aux_softball_season_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> tuple:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+        If not set, a new session is opened and closed for this season.
+    """
+    _au_check_output(output)
+    season_player_df, season_team_df = await _au_softball_season_box(
+        get_aux_softball_season_id(season), max_concurrency, session,
+        sport="aux_softball", season=season)
+    season_player_df['sport'] = 'aux_softball'
+    season_team_df['sport'] = 'aux_softball'
+
+    return (
+        await asyncio.to_thread(
+            _au_season_output, season_player_df, "aux_softball", "player_box", output),
+        await asyncio.to_thread(
+            _au_season_output, season_team_df, "aux_softball", "team_box", output)
+    )
+
+
+async def get_aux_softball_season_player_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_player_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    player_box_df, _ = await get_aux_softball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return player_box_df
+
+
+async def get_aux_softball_season_team_box(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_team_box()`.
+
+    `max_concurrency` (int, optional) = 5:
+        The maximum number of games that will be downloaded at the same time.
+
+    `session` (aiohttp.ClientSession, optional) = None:
+        The session to download this season with.
+    """
+    _, team_box_df = await get_aux_softball_season_box(
+        season, max_concurrency=max_concurrency, session=session, output=output)
+    return team_box_df
+
+
+async def get_aux_softball_season_player_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_player_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_aux_softball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _aux_softball_season_player_stats_from_box,
+        game_stats_df, "aux_softball", "player_stats", season, output)
+
+
+async def get_aux_softball_season_team_stats(
+        season: int,
+        max_concurrency: int = 5,
+        session: aiohttp.ClientSession = None,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Async version of `athetes_unlimited_py.get_aux_softball_season_team_stats()`.
+    """
+    _au_check_output(output)
+    game_stats_df = await get_aux_softball_season_player_box(
+        season, max_concurrency=max_concurrency, session=session)
+    return await asyncio.to_thread(
+        _au_season_stats_output, _aux_softball_season_team_stats_from_box,
+        game_stats_df, "aux_softball", "team_stats", season, output)
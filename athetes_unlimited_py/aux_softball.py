@@ -1,12 +1,26 @@
-import json
+from collections.abc import Iterator
 
 import pandas as pd
-import requests
-from tqdm import tqdm
 
+from athetes_unlimited_py.client import get_au_season_catalog
+from athetes_unlimited_py.metrics import _au_measure
+from athetes_unlimited_py.progress import _au_game_fetched, _au_season_empty
+from athetes_unlimited_py.season import get_au_season, get_au_season_id
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_season_output,
+    au_chunk_games,
+    au_concat_games,
+    au_imap_games,
+)
 from athetes_unlimited_py.softball import (
-    get_au_softball_game_stats,
-    get_au_softball_pbp,
+    _au_softball_box_chunks,
+    _au_softball_season_box_rows,
+    _au_softball_season_innings,
+    _get_au_softball_pbp_json,
+    _get_au_softball_season_box,
+    _parse_au_softball_pbp,
+    get_au_softball_season,
 )
 
 
@@ -24,23 +38,7 @@ def get_aux_softball_season_id(season: int) -> int:
     ----------
     The proper season ID corresponding to an Athletes Unlimited softball season.
     """
-    seasonId = 0
-
-    if season == 2022:
-        seasonId = 39
-        return seasonId
-    elif season == 2023:
-        seasonId = 106
-        return seasonId
-    elif season == 2023:
-        seasonId = 106
-        return seasonId
-    elif season == 2024:
-        seasonId = 172
-        return seasonId
-    else:
-        raise ValueError(
-            f'[season] can only be a value betwen 2022 and 2024 at this time for softball.\nYou entered :\n\t{season}')
+    return get_au_season_id("aux_softball", season)
 
 
 ##############################################################################
@@ -49,7 +47,32 @@ def get_aux_softball_season_id(season: int) -> int:
 ##
 ##############################################################################
 
-def get_aux_softball_season_pbp(season: int) -> pd.DataFrame():
+def _aux_softball_season_pbp_games(season: int, max_workers: int = 1):
+    """
+    Yields the PBP data of every game in an Atheltes Unlimited (AU) softball season, one game at a time.
+    Shared by `get_aux_softball_season_pbp()` and `iter_aux_softball_season_pbp()`.
+    """
+    seasonId = get_aux_softball_season_id(season)
+    sport_json_data = get_au_season_catalog("softball")
+
+    for i in sport_json_data['data']:
+        # print(i)
+        if i['seasonId'] == seasonId:
+            pbp_season = get_au_softball_season(seasonId)
+
+            def get_game(j):
+                json_data = _get_au_softball_pbp_json(seasonId, j)
+                _au_game_fetched("aux_softball", season, j)
+                return _au_measure(
+                    "parse", "aux_softball", "pbp", season,
+                    _parse_au_softball_pbp, json_data, pbp_season, j)
+
+            yield from au_imap_games(
+                get_game, i['gameIds'], max_workers,
+                sport="aux_softball", season=season)
+
+
+def get_aux_softball_season_pbp(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
     """
     Given an Atheltes Unlimited (AU) softball season, get and parse all play-by-play (PBP) data for an AU softball season.
 
@@ -58,139 +81,268 @@ def get_aux_softball_season_pbp(season: int) -> pd.DataFrame():
     `season` (int, mandatory):
         The AU softball season you want PBP data from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_aux_softball_season_pbp()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing PBP data from a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing PBP data from a AU season.
 
     """
-    season_pbp_df = pd.DataFrame()
-    seasonId = get_aux_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"}
+    _au_check_output(output)
+    season_pbp_df = au_concat_games(
+        _aux_softball_season_pbp_games(season, max_workers),
+        chunk_size=chunk_size
+    )
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+    return _au_season_output(season_pbp_df, "aux_softball", "pbp", output)
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == seasonId:
-            len_game_ids = len(i['gameIds'])
 
-            count = 0
-            for j in tqdm(i['gameIds']):
-                count += 1
-                print(f'\nOn game {count} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+def iter_aux_softball_season_pbp(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[pd.DataFrame]:
+    """
+    Same as `get_aux_softball_season_pbp()`, but yields the play-by-play (PBP) data of an AUX softball season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning one DataFrame once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
 
-                game_df = get_au_softball_pbp(seasonId, j)
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AUX softball season you want PBP data from.
 
-                season_pbp_df = pd.concat(
-                    [season_pbp_df, game_df], ignore_index=True)
-                del game_df
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
 
-    return season_pbp_df
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded DataFrame.
+        By default, one DataFrame is yielded for every game.
 
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`), so every chunk has the same columns and types.
 
-def get_aux_softball_season_player_box(season: int) -> pd.DataFrame():
+    Returns
+    ----------
+    A generator of pandas DataFrames (or `pyarrow.Table`s) containing PBP data from a AUX season.
+    """
+    _au_check_output(output)
+
+    return (
+        _au_season_output(pbp_df, "aux_softball", "pbp", output)
+        for pbp_df in au_chunk_games(
+            _aux_softball_season_pbp_games(season, max_workers), chunk_size)
+    )
+
+
+def get_aux_softball_season_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> tuple:
     """
     Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
-    This returns all player game stats, and does not return season stats or game averages.
+    Every game is downloaded once, and both the player and team game stats are returned.
 
     Parameters
     ----------
     `season` (int, mandatory):
-        The AU softball season you want player box scores from.
+        The AU softball season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_aux_softball_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, pandas DataFrames are returned.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are returned
+        (see `get_au_schema()`).
 
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A tuple containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats from a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
+    _au_check_output(output)
     seasonId = get_aux_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    season_player_df, season_team_df = _get_au_softball_season_box(
+        season, seasonId, max_workers=max_workers, chunk_size=chunk_size,
+        sport="aux_softball")
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+    season_player_df['sport'] = 'aux_softball'
+    season_team_df['sport'] = 'aux_softball'
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == seasonId:
-            len_game_ids = len(i['gameIds'])
+    return (
+        _au_season_output(season_player_df, "aux_softball", "player_box", output),
+        _au_season_output(season_team_df, "aux_softball", "team_box", output)
+    )
+
+
+def _aux_softball_box_chunks(season: int, max_workers: int = 1, chunk_size: int = 1):
+    """
+    Yields the `(player_df, team_df)` box scores of every `chunk_size` games
+    in an AUX softball season.
+    """
+    seasonId = get_aux_softball_season_id(season)
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+    for player_df, team_df in _au_softball_box_chunks(
+            _au_softball_season_box_rows(
+                season, seasonId, max_workers, sport="aux_softball"),
+            chunk_size=chunk_size):
+        player_df['sport'] = 'aux_softball'
+        team_df['sport'] = 'aux_softball'
+        yield player_df, team_df
 
-                game_df = get_au_softball_game_stats(
-                    seasonId, j, get_team_stats=False)
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+def iter_aux_softball_season_box(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[tuple]:
+    """
+    Same as `get_aux_softball_season_box()`, but yields the player and team box scores of an AUX softball season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning them once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AUX softball season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded tuple.
+        By default, one tuple is yielded for every game.
+
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A generator of tuples containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats.
+    """
+    _au_check_output(output)
+
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
 
-    season_stats_df['sport'] = 'aux_softball'
-    return season_stats_df
+    return (
+        (
+            _au_season_output(player_df, "aux_softball", "player_box", output),
+            _au_season_output(team_df, "aux_softball", "team_box", output)
+        )
+        for player_df, team_df in _aux_softball_box_chunks(
+            season, max_workers, chunk_size)
+    )
 
 
-def get_aux_softball_season_team_box(season: int) -> pd.DataFrame():
+def get_aux_softball_season_player_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
     """
     Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
     This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_aux_softball_season_box()`.
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU softball season you want player box scores from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_aux_softball_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
-    seasonId = get_aux_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    player_box_df, _ = get_aux_softball_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return player_box_df
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == seasonId:
-            len_game_ids = len(i['gameIds'])
+def get_aux_softball_season_team_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
+    This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_aux_softball_season_box()`.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want player box scores from.
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
 
-                game_df = get_au_softball_game_stats(
-                    seasonId, j, get_team_stats=True)
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_aux_softball_season_box()`.
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
-    season_stats_df['sport'] = 'aux_softball'
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
 
-    return season_stats_df
+    """
+    _, team_box_df = get_aux_softball_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return team_box_df
 
 ##############################################################################
 ##
@@ -199,21 +351,11 @@ def get_aux_softball_season_team_box(season: int) -> pd.DataFrame():
 ##############################################################################
 
 
-def get_aux_softball_season_player_stats(season: int) -> pd.DataFrame():
+def _aux_softball_season_player_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) softball season, get all season player stats for an AU softball season.
-
-    Parameters
-    ----------
-    `season` (int, mandatory):
-        The AU softball season you want season player stats from.
-
-    Returns
-    ----------
-    A pandas DataFrame containing season player stats a AU season.
-
+    Given Athletes Unlimited X (AUX) softball box score stats for a season, calculates season player stats.
+    Used by `get_aux_softball_season_player_stats()`.
     """
-    game_stats_df = get_aux_softball_season_player_box(season)
 
     if len(game_stats_df) > 0:
         finished_df = game_stats_df.groupby(['sport', 'season', 'seasonId', 'playerId',
@@ -224,20 +366,21 @@ def get_aux_softball_season_player_stats(season: int) -> pd.DataFrame():
                                                  'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA',
                                                  'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH',
                                                  'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS',
-                                                 'pitching_SV', 'pitching_IP',
+                                                 'pitching_SV', 'pitching_OUTS',
                                                  'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB',
                                                  'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls',
                                                  'pitching_PI_strikes',
-                                                 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
+                                                 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
                                                  'fielding_CS', 'fielding_TC'
                                              ]].sum()
 
         finished_df[[
             'G',
             'GS',
-            'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
-            'G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
-        finished_df['pitching_IP'] = finished_df['pitching_IP'].astype('float')
+            'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
+            'G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
+        # Innings are summed as outs, and converted back once.
+        _au_softball_season_innings(finished_df)
         # Batting
         finished_df.loc[finished_df['batting_AB'] >= 1,
                         'batting_BA'] = finished_df['batting_H'] / finished_df['batting_AB']
@@ -282,39 +425,39 @@ def get_aux_softball_season_player_stats(season: int) -> pd.DataFrame():
         finished_df['batting_PSN'] = finished_df['batting_PSN'].round(3)
 
         # Pitching
-        finished_df['pitching_ERA'] = 9 * \
-            (finished_df['pitching_ER'] / finished_df['pitching_IP'])
+        finished_df['pitching_ERA'] = 27 * \
+            (finished_df['pitching_ER'] / finished_df['pitching_OUTS'])
         finished_df['pitching_ERA'] = finished_df['pitching_ERA'].round(3)
 
         finished_df['pitching_ERA+'] = None
         finished_df['pitching_FIP'] = None
         finished_df['pitching_FIP-'] = None
         finished_df['pitching_WHIP'] = (
-            finished_df['pitching_BB'] + finished_df['pitching_H']) / finished_df['pitching_IP']
+            3 * (finished_df['pitching_BB'] + finished_df['pitching_H'])) / finished_df['pitching_OUTS']
         finished_df['pitching_WHIP'] = finished_df['pitching_WHIP'].round(3)
 
         finished_df['pitching_H9'] = (
-            9 * finished_df['pitching_H']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_H']) / finished_df['pitching_OUTS']
         finished_df['pitching_H9'] = finished_df['pitching_H9'].round(3)
 
         finished_df['pitching_HR9'] = (
-            9 * finished_df['pitching_HR']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_HR']) / finished_df['pitching_OUTS']
         finished_df['pitching_HR9'] = finished_df['pitching_HR9'].round(3)
 
         finished_df['pitching_BB9'] = (
-            9 * finished_df['pitching_BB']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_BB']) / finished_df['pitching_OUTS']
         finished_df['pitching_BB9'] = finished_df['pitching_BB9'].round(3)
 
         finished_df['pitching_SO9'] = (
-            9 * finished_df['pitching_SO']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_SO']) / finished_df['pitching_OUTS']
         finished_df['pitching_SO9'] = finished_df['pitching_SO9'].round(3)
 
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO'] / \
             finished_df['pitching_BB']
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO/BB'].round(3)
 
-        finished_df['pitching_RA9'] = 9 * \
-            (finished_df['pitching_R'] / finished_df['pitching_IP'])
+        finished_df['pitching_RA9'] = 27 * \
+            (finished_df['pitching_R'] / finished_df['pitching_OUTS'])
         finished_df['pitching_RA9'] = finished_df['pitching_RA9'].round(3)
 
         # Fielding
@@ -329,8 +472,8 @@ def get_aux_softball_season_player_stats(season: int) -> pd.DataFrame():
         # finished_df['fielding_CS%'] = 0
         # finished_df['fielding_CS%'] = finished_df['fielding_CS%'].round(3)
 
-        finished_df['fielding_RF/9'] = (9 * (finished_df['fielding_PO'] +
-                                        finished_df['fielding_A'])) / finished_df['fielding_IP']
+        finished_df['fielding_RF/9'] = (27 * (finished_df['fielding_PO'] +
+                                         finished_df['fielding_A'])) / finished_df['fielding_OUTS']
         finished_df['fielding_RF/9'] = finished_df['fielding_RF/9'].round(3)
 
         # finished_df.to_csv('test.csv')
@@ -338,25 +481,48 @@ def get_aux_softball_season_player_stats(season: int) -> pd.DataFrame():
         # print(game_stats_df.columns)
         return finished_df
     else:
-        print(f'No AUX softball stats found so far in {season}')
+        _au_season_empty("aux_softball", season, "player_stats")
         return pd.DataFrame()
 
 
-def get_aux_softball_season_team_stats(season: int) -> pd.DataFrame():
+def get_aux_softball_season_player_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) softball season, get all season team stats for an AU softball season.
+    Given an Atheltes Unlimited (AU) softball season, get all season player stats for an AU softball season.
+    Box scores are downloaded once per season, and are shared with `get_aux_softball_season_team_stats()` (see `get_au_season()`).
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU softball season you want season player stats from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing season player stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing season player stats a AU season.
 
     """
-    game_stats_df = get_aux_softball_season_player_box(season)
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "aux_softball", season, max_workers=max_workers).player_stats.copy()
+    return _au_season_output(season_stats_df, "aux_softball", "player_stats", output)
+
+
+def _aux_softball_season_team_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """
+    Given Athletes Unlimited X (AUX) softball box score stats for a season, calculates season team stats.
+    Used by `get_aux_softball_season_team_stats()`.
+    """
     # ['sport', 'api_version', 'season', 'seasonId', 'weekNumber',
     #    'gameNumber', 'seasonType', 'playerId', 'uniformNumber',
     #    'uniformNumberDisplay', 'primaryPositionLk', 'secondaryPositionLk',
@@ -384,17 +550,18 @@ def get_aux_softball_season_team_stats(season: int) -> pd.DataFrame():
             'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA',
             'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH',
             'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS',
-            'pitching_SV', 'pitching_IP',
+            'pitching_SV', 'pitching_OUTS',
             'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB',
             'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls',
             'pitching_PI_strikes',
-            'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
+            'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
             'fielding_CS', 'fielding_TC'
         ]].sum()
 
-        finished_df[['G',  'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
-            'G', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
-        finished_df['pitching_IP'] = finished_df['pitching_IP'].astype('float')
+        finished_df[['G',  'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
+            'G', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
+        # Innings are summed as outs, and converted back once.
+        _au_softball_season_innings(finished_df)
         # Batting
         finished_df.loc[finished_df['batting_AB'] >= 1,
                         'batting_BA'] = finished_df['batting_H'] / finished_df['batting_AB']
@@ -439,39 +606,39 @@ def get_aux_softball_season_team_stats(season: int) -> pd.DataFrame():
         finished_df['batting_PSN'] = finished_df['batting_PSN'].round(3)
 
         # Pitching
-        finished_df['pitching_ERA'] = 9 * \
-            (finished_df['pitching_ER'] / finished_df['pitching_IP'])
+        finished_df['pitching_ERA'] = 27 * \
+            (finished_df['pitching_ER'] / finished_df['pitching_OUTS'])
         finished_df['pitching_ERA'] = finished_df['pitching_ERA'].round(3)
 
         finished_df['pitching_ERA+'] = None
         finished_df['pitching_FIP'] = None
         finished_df['pitching_FIP-'] = None
         finished_df['pitching_WHIP'] = (
-            finished_df['pitching_BB'] + finished_df['pitching_H']) / finished_df['pitching_IP']
+            3 * (finished_df['pitching_BB'] + finished_df['pitching_H'])) / finished_df['pitching_OUTS']
         finished_df['pitching_WHIP'] = finished_df['pitching_WHIP'].round(3)
 
         finished_df['pitching_H9'] = (
-            9 * finished_df['pitching_H']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_H']) / finished_df['pitching_OUTS']
         finished_df['pitching_H9'] = finished_df['pitching_H9'].round(3)
 
         finished_df['pitching_HR9'] = (
-            9 * finished_df['pitching_HR']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_HR']) / finished_df['pitching_OUTS']
         finished_df['pitching_HR9'] = finished_df['pitching_HR9'].round(3)
 
         finished_df['pitching_BB9'] = (
-            9 * finished_df['pitching_BB']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_BB']) / finished_df['pitching_OUTS']
         finished_df['pitching_BB9'] = finished_df['pitching_BB9'].round(3)
 
         finished_df['pitching_SO9'] = (
-            9 * finished_df['pitching_SO']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_SO']) / finished_df['pitching_OUTS']
         finished_df['pitching_SO9'] = finished_df['pitching_SO9'].round(3)
 
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO'] / \
             finished_df['pitching_BB']
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO/BB'].round(3)
 
-        finished_df['pitching_RA9'] = 9 * \
-            (finished_df['pitching_R'] / finished_df['pitching_IP'])
+        finished_df['pitching_RA9'] = 27 * \
+            (finished_df['pitching_R'] / finished_df['pitching_OUTS'])
         finished_df['pitching_RA9'] = finished_df['pitching_RA9'].round(3)
 
         # Fielding
@@ -486,8 +653,8 @@ def get_aux_softball_season_team_stats(season: int) -> pd.DataFrame():
         # finished_df['fielding_CS%'] = 0
         # finished_df['fielding_CS%'] = finished_df['fielding_CS%'].round(3)
 
-        finished_df['fielding_RF/9'] = (9 * (finished_df['fielding_PO'] +
-                                        finished_df['fielding_A'])) / finished_df['fielding_IP']
+        finished_df['fielding_RF/9'] = (27 * (finished_df['fielding_PO'] +
+                                         finished_df['fielding_A'])) / finished_df['fielding_OUTS']
         finished_df['fielding_RF/9'] = finished_df['fielding_RF/9'].round(3)
 
         # finished_df.to_csv('test.csv')
@@ -495,5 +662,38 @@ def get_aux_softball_season_team_stats(season: int) -> pd.DataFrame():
         # print(game_stats_df.columns)
         return finished_df
     else:
-        print(f'No AUX softball stats found so far in {season}')
+        _au_season_empty("aux_softball", season, "team_stats")
         return pd.DataFrame()
+
+
+def get_aux_softball_season_team_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) softball season, get all season team stats for an AU softball season.
+    Box scores are downloaded once per season, and are shared with `get_aux_softball_season_player_stats()` (see `get_au_season()`).
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want season player stats from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing season player stats a AU season.
+
+    """
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "aux_softball", season, max_workers=max_workers).team_stats.copy()
+    return _au_season_output(season_stats_df, "aux_softball", "team_stats", output)
@@ -0,0 +1,277 @@
+import importlib
+import json
+import os
+import shutil
+import threading
+import time
+
+from athetes_unlimited_py.decode import au_json_loads
+
+##############################################################################
+##
+# On-disk response cache
+##
+##############################################################################
+
+_au_cache_settings = {
+    "cache_dir": None,
+    "in_progress_ttl": 900,
+    "final_after": 86400,
+}
+_au_cache_lock = threading.Lock()
+
+
+def configure_au_cache(
+        cache_dir: str = None,
+        in_progress_ttl: float = None,
+        final_after: float = None,
+        enabled: bool = True) -> None:
+    """
+    Turns on (or off) the on-disk cache for game-level API responses.
+    The cache is off by default.
+
+    When on, the raw JSON of every box score and play-by-play (PBP) response
+    is saved to `cache_dir`, keyed by sport, endpoint, season ID and game.
+
+    A game is cached as "in progress", and is downloaded again
+    once it is older than `in_progress_ttl` seconds,
+    until it is downloaded after the game is over.
+    A game is over if it has plays (PBP) or stats (box scores), and either
+    its season is from a past year, or it already had plays or stats
+    `final_after` seconds earlier. Finished games are never downloaded again.
+    Games that haven't started yet (with no plays or stats) are never finished.
+
+    Parameters
+    ----------
+    `cache_dir` (str, optional) = None:
+        The folder the cache is stored in.
+        Mandatory if `enabled` is set to `True`
+        and the cache has not been configured before.
+
+    `in_progress_ttl` (float, optional) = None:
+        The number of seconds a game that isn't known to be finished
+        is kept in the cache before it is downloaded again.
+        Defaults to 900 (15 minutes) if never set.
+
+    `final_after` (float, optional) = None:
+        The number of seconds after a game was first downloaded with plays
+        or stats that it's known to be over (no game lasts that long,
+        even with delays). Only used for seasons of the current year.
+        Defaults to 86400 (1 day) if never set.
+
+    `enabled` (bool, optional) = True:
+        If set to `False`, the cache is turned off.
+        Files already in the cache are not deleted.
+    """
+    with _au_cache_lock:
+        if enabled == False:
+            _au_cache_settings["cache_dir"] = None
+            return
+
+        if cache_dir is not None:
+            _au_cache_settings["cache_dir"] = os.path.abspath(
+                os.path.expanduser(cache_dir))
+        elif _au_cache_settings["cache_dir"] is None:
+            raise ValueError(
+                '`cache_dir` must be set to turn on the cache.')
+
+        if in_progress_ttl is not None:
+            if in_progress_ttl < 0:
+                raise ValueError('`in_progress_ttl` cannot be less than 0.')
+            _au_cache_settings["in_progress_ttl"] = in_progress_ttl
+
+        if final_after is not None:
+            if final_after < 0:
+                raise ValueError('`final_after` cannot be less than 0.')
+            _au_cache_settings["final_after"] = final_after
+
+
+def get_au_cache_dir() -> str | None:
+    """
+    Returns the folder the cache is stored in,
+    or `None` if the cache is turned off.
+    """
+    return _au_cache_settings["cache_dir"]
+
+
+def clear_au_cache(sport: str = None) -> None:
+    """
+    Deletes every file in the cache.
+
+    Parameters
+    ----------
+    `sport` (str, optional) = None:
+        If set, only cached games of this sport
+        (`basketball`, `lacrosse`, `softball` or `volleyball`)
+        will be deleted.
+    """
+    cache_dir = get_au_cache_dir()
+
+    if cache_dir is None:
+        return
+
+    if sport is not None:
+        cache_dir = os.path.join(cache_dir, sport)
+
+    with _au_cache_lock:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def _au_cache_path(cache_key: tuple) -> str:
+    """
+    Returns the file a `(sport, endpoint, season_id, game)` cache key is stored in.
+    """
+    sport, endpoint, season_id, game = cache_key
+    return os.path.join(
+        get_au_cache_dir(),
+        str(sport),
+        str(endpoint),
+        str(season_id),
+        f"{game}.json"
+    )
+
+
+def _read_au_cache(cache_key: tuple) -> tuple:
+    """
+    Looks up a cache key.
+
+    Returns
+    ----------
+    A tuple of `(entry, is_fresh)`. `entry` is the cached entry
+    (or `None` if this key isn't cached), and `is_fresh` is `True`
+    if the entry can be used without downloading the game again.
+    """
+    if get_au_cache_dir() is None or cache_key is None:
+        return None, False
+
+    try:
+        with open(_au_cache_path(cache_key), "rb") as f:
+            entry = au_json_loads(f.read())
+    except (OSError, ValueError):
+        return None, False
+
+    # Caches written by older versions may have games with no data marked as final.
+    if entry["final"] == True and _au_game_has_data(cache_key[1], entry["data"]):
+        return entry, True
+
+    age = time.time() - entry["fetched_at"]
+    return entry, age < _au_cache_settings["in_progress_ttl"]
+
+
+def _write_au_cache(cache_key: tuple, json_data: dict, previous_entry: dict = None) -> None:
+    """
+    Saves the JSON of a response to the cache,
+    and marks the game as finished if it's over (see `_au_game_is_final()`).
+    """
+    if get_au_cache_dir() is None or cache_key is None:
+        return
+
+    fetched_at = time.time()
+    data_since = _au_game_data_since(
+        cache_key[1],
+        json_data,
+        None if previous_entry is None else previous_entry.get("data_since"),
+        fetched_at
+    )
+
+    entry = {
+        "fetched_at": fetched_at,
+        "final": _au_game_is_final(cache_key, data_since, fetched_at),
+        "data_since": data_since,
+        "data": json_data,
+    }
+
+    path = _au_cache_path(cache_key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first, so that other threads/processes
+    # never read a half-written file.
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(temp_path, path)
+
+
+##############################################################################
+##
+# Finished games
+##
+##############################################################################
+
+# The keys of a box score entry that hold its stats, in every sport.
+_AU_BOX_STATS_KEYS = (
+    "stats",
+    "playerStats",
+    "goalieStats",
+    "battingStats",
+    "pitchingStats",
+    "fieldingStats",
+)
+
+
+def _au_game_has_data(endpoint: str, json_data: dict) -> bool:
+    """
+    Returns `True` if the JSON of a game has any plays (`play-by-play`)
+    or any stats (`by-game`). Games that haven't started yet
+    are returned with no plays, or with no stats for anyone.
+    """
+    data = json_data.get("data") or []
+
+    if endpoint == "play-by-play":
+        return any(len(game.get("plays") or []) > 0 for game in data)
+
+    return any(
+        len(entry.get(key) or []) > 0
+        for entry in data for key in _AU_BOX_STATS_KEYS
+    )
+
+
+def _au_game_data_since(
+        endpoint: str,
+        json_data: dict,
+        previous_data_since: float | None,
+        fetched_at: float) -> float | None:
+    """
+    Returns when a game was first downloaded with plays or stats (Epoch time),
+    or `None` if `json_data` has none yet.
+    """
+    if not _au_game_has_data(endpoint, json_data):
+        return None
+
+    if previous_data_since is not None:
+        return previous_data_since
+
+    return fetched_at
+
+
+def _au_season_is_over(sport: str, season_id: int) -> bool:
+    """
+    Returns `True` if a season ID belongs to a season of a past year.
+    Every AU season is played within one year.
+    """
+    # Imported here, since `athetes_unlimited_py.season` imports this module.
+    season_module = importlib.import_module("athetes_unlimited_py.season")
+    season = season_module._au_id_seasons.get(sport, {}).get(season_id)
+
+    return season is not None and season < time.localtime().tm_year
+
+
+def _au_game_is_final(cache_key: tuple, data_since: float | None, fetched_at: float) -> bool:
+    """
+    Returns `True` if a game downloaded at `fetched_at` was already over,
+    so that it never has to be downloaded again.
+    Shared by the on-disk cache and `sync_au_season_box()`/`sync_au_season_pbp()`.
+
+    A game is over if it has plays or stats (`data_since` is set), and either
+    its season is from a past year, or it already had plays or stats
+    `final_after` seconds before it was downloaded (see `configure_au_cache()`).
+    """
+    if data_since is None:
+        return False
+
+    sport, _, season_id, _ = cache_key
+
+    if _au_season_is_over(sport, season_id):
+        return True
+
+    return fetched_at - data_since >= _au_cache_settings["final_after"]
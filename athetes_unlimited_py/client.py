@@ -0,0 +1,551 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from athetes_unlimited_py import metrics, replay
+from athetes_unlimited_py.cache import _read_au_cache, _write_au_cache
+from athetes_unlimited_py.decode import au_json_loads
+from athetes_unlimited_py.utils import raise_html_status_code
+
+##############################################################################
+##
+# Shared HTTP client
+##
+##############################################################################
+
+AU_PROXY_URL = "https://auprosports.com/proxy.php?request="
+AU_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"
+
+# HTTP status codes that are worth retrying.
+AU_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_au_client_settings = {
+    "base_url": AU_PROXY_URL,
+    "pool_size": 10,
+    "timeout": (10, 60),
+    "user_agent": AU_USER_AGENT,
+    "catalog_ttl": 3600,
+    "max_retries": 3,
+    "backoff_factor": 0.5,
+    "backoff_max": 30.0,
+    "rate_limit": 10.0,
+    "rate_burst": 10,
+}
+_au_session = None
+_au_session_lock = threading.Lock()
+
+# sport -> (time fetched, seasons catalog JSON)
+_au_season_catalogs = {}
+_au_season_catalogs_lock = threading.Lock()
+# sport -> lock held while that sport's catalog is downloaded
+_au_season_catalog_fetch_locks = {}
+
+
+class _AUTokenBucket:
+    """
+    A thread-safe token bucket, used to limit how many requests
+    are sent to auprosports.com per second, across every thread.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket,
+        and returns how many seconds the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+_au_rate_limiter = _AUTokenBucket(
+    _au_client_settings["rate_limit"], _au_client_settings["rate_burst"])
+
+
+def _au_rate_limit_delay() -> float:
+    """
+    Returns how many seconds the next request must wait
+    to stay under the rate limit.
+    """
+    if _au_rate_limiter is None:
+        return 0.0
+    return _au_rate_limiter.reserve()
+
+
+def _parse_retry_after(retry_after: str | None) -> float | None:
+    """
+    Parses a `Retry-After` header, which can either be
+    a number of seconds, or an HTTP date.
+    """
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _au_retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Returns how many seconds to wait before retry number `attempt` (starting at 0).
+    Uses exponential backoff with full jitter,
+    unless the server sent a `Retry-After` header.
+    """
+    retry_after = _parse_retry_after(retry_after)
+
+    if retry_after is not None:
+        return retry_after
+
+    backoff = min(
+        _au_client_settings["backoff_max"],
+        _au_client_settings["backoff_factor"] * (2 ** attempt)
+    )
+    return random.uniform(0, backoff)
+
+
+def _build_au_session() -> requests.Session:
+    """
+    Builds a `requests.Session` with a keep-alive connection pool
+    sized by the current client settings.
+    """
+    pool_size = _au_client_settings["pool_size"]
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": _au_client_settings["user_agent"]})
+    return session
+
+
+def configure_au_client(
+        pool_size: int = None,
+        timeout: float | tuple = None,
+        user_agent: str = None,
+        catalog_ttl: float = None,
+        max_retries: int = None,
+        backoff_factor: float = None,
+        backoff_max: float = None,
+        rate_limit: float = None,
+        rate_burst: int = None,
+        base_url: str = None) -> None:
+    """
+    Changes the settings of the HTTP client shared by every `get_au_*` function.
+    The shared session is rebuilt the next time a request is made.
+
+    Parameters
+    ----------
+    `pool_size` (int, optional) = None:
+        The maximum number of keep-alive connections to auprosports.com.
+        Defaults to 10 if never set.
+
+    `timeout` (float or tuple, optional) = None:
+        The timeout, in seconds, passed to every request.
+        Can be a single number, or a `(connect, read)` tuple.
+        Defaults to `(10, 60)` if never set.
+
+    `user_agent` (str, optional) = None:
+        The `User-Agent` header sent with every request.
+
+    `catalog_ttl` (float, optional) = None:
+        The number of seconds a sport's seasons catalog
+        is kept in memory before it is downloaded again.
+        Defaults to 3600 (1 hour) if never set.
+
+    `max_retries` (int, optional) = None:
+        The number of times a request is retried after a connection error,
+        a timeout, or an HTTP 429, 500, 502, 503 or 504 status code.
+        Set to 0 to turn off retries.
+        Defaults to 3 if never set.
+
+    `backoff_factor` (float, optional) = None:
+        The longest wait, in seconds, before the first retry.
+        The longest wait doubles with every retry,
+        and a random wait between 0 and the longest wait is used.
+        If the website sends a `Retry-After` header, that is used instead.
+        Defaults to 0.5 if never set.
+
+    `backoff_max` (float, optional) = None:
+        The longest wait, in seconds, between two retries.
+        Defaults to 30 if never set.
+
+    `rate_limit` (float, optional) = None:
+        The maximum number of requests per second sent to auprosports.com,
+        shared by every thread. Set to 0 to turn off the rate limit.
+        Defaults to 10 if never set.
+
+    `rate_burst` (int, optional) = None:
+        The number of requests that can be sent at once,
+        before `rate_limit` applies.
+        Defaults to 10 if never set.
+
+    `base_url` (str, optional) = None:
+        The URL every API path is appended to.
+        Set this to the `base_url` of an `AUStandInServer`
+        (see `athetes_unlimited_py.server`) to send requests to a local stand-in
+        instead of auprosports.com.
+        Defaults to `AU_PROXY_URL` if never set.
+    """
+    global _au_session, _au_rate_limiter
+
+    if base_url is not None:
+        _au_client_settings["base_url"] = base_url
+
+    if pool_size is not None:
+        if pool_size < 1:
+            raise ValueError('`pool_size` cannot be less than 1.')
+        _au_client_settings["pool_size"] = pool_size
+
+    if timeout is not None:
+        _au_client_settings["timeout"] = timeout
+
+    if user_agent is not None:
+        _au_client_settings["user_agent"] = user_agent
+
+    if catalog_ttl is not None:
+        if catalog_ttl < 0:
+            raise ValueError('`catalog_ttl` cannot be less than 0.')
+        _au_client_settings["catalog_ttl"] = catalog_ttl
+
+    if max_retries is not None:
+        if max_retries < 0:
+            raise ValueError('`max_retries` cannot be less than 0.')
+        _au_client_settings["max_retries"] = max_retries
+
+    if backoff_factor is not None:
+        _au_client_settings["backoff_factor"] = backoff_factor
+
+    if backoff_max is not None:
+        _au_client_settings["backoff_max"] = backoff_max
+
+    if rate_limit is not None:
+        if rate_limit < 0:
+            raise ValueError('`rate_limit` cannot be less than 0.')
+        _au_client_settings["rate_limit"] = rate_limit
+
+    if rate_burst is not None:
+        if rate_burst < 1:
+            raise ValueError('`rate_burst` cannot be less than 1.')
+        _au_client_settings["rate_burst"] = rate_burst
+
+    if _au_client_settings["rate_limit"] > 0:
+        _au_rate_limiter = _AUTokenBucket(
+            _au_client_settings["rate_limit"],
+            _au_client_settings["rate_burst"]
+        )
+    else:
+        _au_rate_limiter = None
+
+    with _au_session_lock:
+        if _au_session is not None:
+            _au_session.close()
+        _au_session = None
+
+
+def get_au_session() -> requests.Session:
+    """
+    Returns the `requests.Session` shared by every `get_au_*` function,
+    creating it if it doesn't exist yet.
+    """
+    global _au_session
+
+    with _au_session_lock:
+        if _au_session is None:
+            _au_session = _build_au_session()
+        return _au_session
+
+
+def set_au_session(session: requests.Session | None) -> None:
+    """
+    Replaces the session shared by every `get_au_*` function.
+    Useful for testing against a local stand-in server,
+    or for mounting custom adapters.
+
+    Parameters
+    ----------
+    `session` (requests.Session, mandatory):
+        The session to use. If set to `None`,
+        a new pooled session will be built on the next request.
+    """
+    global _au_session
+
+    with _au_session_lock:
+        _au_session = session
+
+
+def _build_au_url(request: str, cache_buster: bool = True) -> str:
+    """
+    Turns an API path into a full auprosports.com API proxy URL.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    if cache_buster == True:
+        # Yes, the key is literaly the int of the Epoch time at the time of the GET request.
+        key = int(time.time())
+
+        if "?" in request:
+            request = f"{request}%26k={key}"
+        else:
+            request = f"{request}?k={key}"
+
+    return f"{_au_client_settings['base_url']}{request}"
+
+
+def get_au_response(request: str, cache_buster: bool = True) -> requests.Response:
+    """
+    Sends a GET request to the auprosports.com API proxy
+    through the shared session.
+
+    Parameters
+    ----------
+    `request` (str, mandatory):
+        The API path passed to the proxy,
+        e.g. `/api/play-by-play/softball/v1/event/14/game/1`.
+
+    `cache_buster` (bool, optional) = True:
+        If set to `True`, the `k` key the website uses to bust caches
+        will be appended to `request`.
+
+    Returns
+    ----------
+    The `requests.Response` for this request.
+    Connection errors, timeouts and some HTTP status codes
+    are retried (see `configure_au_client()`).
+    If the response still has a bad HTTP status code, an exception will be raised.
+    """
+    url = _build_au_url(request, cache_buster=cache_buster)
+    attempt = 0
+
+    while True:
+        time.sleep(_au_rate_limit_delay())
+        started_at = time.perf_counter()
+
+        try:
+            response = get_au_session().get(
+                url,
+                timeout=_au_client_settings["timeout"]
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if metrics._au_metrics is not None:
+                metrics._au_record_request(
+                    request,
+                    type(e).__name__,
+                    time.perf_counter() - started_at,
+                    retried=attempt < _au_client_settings["max_retries"]
+                )
+
+            if attempt >= _au_client_settings["max_retries"]:
+                raise
+            delay = _au_retry_delay(attempt)
+        else:
+            is_done = response.status_code not in AU_RETRY_STATUS_CODES or \
+                attempt >= _au_client_settings["max_retries"]
+
+            if metrics._au_metrics is not None:
+                metrics._au_record_request(
+                    request,
+                    response.status_code,
+                    time.perf_counter() - started_at,
+                    num_bytes=len(response.content),
+                    retried=not is_done
+                )
+
+            if is_done == True:
+                break
+            delay = _au_retry_delay(
+                attempt, response.headers.get("Retry-After"))
+            response.close()
+
+        attempt += 1
+        time.sleep(delay)
+
+    raise_html_status_code(response.status_code)
+    return response
+
+
+def get_au_json(request: str, cache_buster: bool = True, cache_key: tuple = None) -> dict:
+    """
+    Same as `get_au_response()`, but returns the parsed JSON body of the response.
+
+    `cache_key` (tuple, optional) = None:
+        A `(sport, endpoint, season_id, game)` tuple identifying this response.
+        If set, and the on-disk cache is turned on (see `configure_au_cache()`),
+        the response will be read from, and saved to, the cache.
+
+    If record/replay is on (see `configure_au_replay()`),
+    the response is read from, or recorded to, the payload folder.
+    """
+    replay_mode = replay._au_replay_settings["mode"]
+
+    if replay_mode == "replay":
+        return replay._read_au_replay(request)
+
+    cached_entry, is_fresh = _read_au_cache(cache_key)
+
+    if is_fresh == True:
+        if metrics._au_metrics is not None:
+            metrics._au_record_cache_hit(request)
+        if replay_mode == "record":
+            replay._write_au_replay(request, cached_entry["data"])
+        return cached_entry["data"]
+
+    response = get_au_response(request, cache_buster=cache_buster)
+
+    if metrics._au_metrics is None:
+        json_data = au_json_loads(response.content)
+    else:
+        started_at = time.perf_counter()
+        json_data = au_json_loads(response.content)
+        metrics._au_record_decode(request, time.perf_counter() - started_at)
+
+    _write_au_cache(cache_key, json_data, cached_entry)
+
+    if replay_mode == "record":
+        replay._write_au_replay(request, json_data)
+
+    return json_data
+
+
+##############################################################################
+##
+# Seasons catalog
+##
+##############################################################################
+
+
+def _au_season_catalog_request(sport: str) -> str:
+    """
+    Returns the API request of the seasons catalog of a sport.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    return f"api/seasons/{sport}/v1"
+
+
+def _get_cached_au_season_catalog(sport: str) -> dict | None:
+    """
+    Returns the seasons catalog of `sport` if it's in memory,
+    and younger than `catalog_ttl` seconds. Otherwise, returns `None`.
+    """
+    cached = _au_season_catalogs.get(sport)
+
+    if cached is None:
+        return None
+
+    fetched_at, catalog = cached
+    if time.time() - fetched_at >= _au_client_settings["catalog_ttl"]:
+        return None
+
+    return catalog
+
+
+def _set_cached_au_season_catalog(sport: str, catalog: dict) -> None:
+    """
+    Keeps the seasons catalog of `sport` in memory.
+    """
+    _au_season_catalogs[sport] = (time.time(), catalog)
+
+
+def _au_season_catalog_fetch_lock(sport: str) -> threading.Lock:
+    """
+    Returns the lock held while the seasons catalog of `sport` is downloaded,
+    so that threads asking for the same catalog share one download,
+    without waiting on the catalogs of other sports.
+    """
+    with _au_season_catalogs_lock:
+        return _au_season_catalog_fetch_locks.setdefault(sport, threading.Lock())
+
+
+def get_au_season_catalog(sport: str, refresh: bool = False) -> dict:
+    """
+    Returns the seasons catalog (`api/seasons/{sport}/v1`) of a sport,
+    which lists every season ID of that sport, and the game IDs in each season.
+
+    The catalog is downloaded once, and is kept in memory for `catalog_ttl` seconds
+    (see `configure_au_client()`), and shared by every function in this package.
+    The returned dict is shared, and should not be modified.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport you want the seasons catalog of.
+        Can be `basketball`, `lacrosse`, `softball` or `volleyball`.
+
+    `refresh` (bool, optional) = False:
+        If set to `True`, the catalog will be downloaded again,
+        even if it's already in memory.
+
+    Returns
+    ----------
+    A dict containing the JSON of the seasons catalog.
+    """
+    if refresh == False:
+        with _au_season_catalogs_lock:
+            catalog = _get_cached_au_season_catalog(sport)
+
+        if catalog is not None:
+            return catalog
+
+    with _au_season_catalog_fetch_lock(sport):
+        # Another thread may have downloaded this catalog while we waited.
+        if refresh == False:
+            with _au_season_catalogs_lock:
+                catalog = _get_cached_au_season_catalog(sport)
+
+            if catalog is not None:
+                return catalog
+
+        # The download (and its retries) happens outside of `_au_season_catalogs_lock`.
+        catalog = get_au_json(
+            _au_season_catalog_request(sport), cache_buster=False)
+
+        with _au_season_catalogs_lock:
+            _set_cached_au_season_catalog(sport, catalog)
+
+        return catalog
+
+
+def refresh_au_season_catalog(sport: str = None) -> None:
+    """
+    Forgets the seasons catalogs kept in memory,
+    so that they are downloaded again the next time they are needed.
+
+    Parameters
+    ----------
+    `sport` (str, optional) = None:
+        If set, only the catalog of this sport is forgotten.
+        Otherwise, every catalog is forgotten.
+    """
+    with _au_season_catalogs_lock:
+        if sport is None:
+            _au_season_catalogs.clear()
+        else:
+            _au_season_catalogs.pop(sport, None)
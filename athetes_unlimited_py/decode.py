@@ -0,0 +1,158 @@
+import importlib
+import json
+import threading
+
+##############################################################################
+##
+# JSON decoding
+##
+##############################################################################
+
+# Picked in this order when the backend isn't set.
+AU_JSON_BACKENDS = ("orjson", "simdjson", "json")
+
+_au_json_settings = {
+    "backend": None,
+    "loads": None,
+}
+_au_json_lock = threading.Lock()
+
+# Integers that may not fit in 64 bits (2 ** 64 has 20 digits) are found
+# by turning every digit into `0` and everything else into a space,
+# which is much faster than a regex on documents full of numbers.
+_AU_DIGITS_TABLE = bytes(
+    ord("0") if ord("0") <= i <= ord("9") else ord(" ") for i in range(256))
+_AU_WIDE_INTEGER = b"0" * 20
+
+
+def _au_import_json_backend(backend: str):
+    """
+    Returns the `loads()` function of a JSON backend.
+    Raises an `ImportError` if the backend isn't installed.
+    """
+    if backend == "json":
+        return json.loads
+
+    loads = importlib.import_module(backend).loads
+
+    try:
+        decoded = loads(b"[18446744073709551617]")[0]
+        wide_integers_are_exact = isinstance(decoded, int) and decoded == 2 ** 64 + 1
+    except ValueError:
+        # Raising is fine, since `au_json_loads()` falls back to `json`.
+        wide_integers_are_exact = True
+
+    if wide_integers_are_exact:
+        return loads
+
+    return _au_exact_wide_integers(loads)
+
+
+def _au_exact_wide_integers(loads):
+    """
+    Wraps the `loads()` of a backend that turns integers wider than 64 bits
+    into floats (like older versions of `orjson`),
+    so that documents that may have one are decoded with `json` instead.
+    """
+    def exact_loads(data):
+        raw_data = data.encode() if isinstance(data, str) else data
+
+        if raw_data.translate(_AU_DIGITS_TABLE).find(_AU_WIDE_INTEGER) != -1:
+            return json.loads(data)
+
+        return loads(data)
+
+    return exact_loads
+
+
+def _au_resolve_json_backend() -> tuple:
+    """
+    Returns a tuple of `(backend, loads)`, and picks the fastest
+    installed backend the first time it's called.
+    """
+    loads = _au_json_settings["loads"]
+
+    if loads is not None:
+        return _au_json_settings["backend"], loads
+
+    with _au_json_lock:
+        if _au_json_settings["loads"] is None:
+            for backend in AU_JSON_BACKENDS:
+                try:
+                    loads = _au_import_json_backend(backend)
+                except ImportError:
+                    continue
+
+                _au_json_settings["backend"] = backend
+                _au_json_settings["loads"] = loads
+                break
+
+        return _au_json_settings["backend"], _au_json_settings["loads"]
+
+
+def configure_au_json(backend: str = None) -> None:
+    """
+    Sets the library used to decode the JSON of every API response,
+    cached response and recorded payload.
+
+    By default, the fastest installed library is used:
+    `orjson`, then `simdjson` (pysimdjson), then the standard library's `json`.
+    Bodies are decoded straight from the bytes of the response,
+    and if a fast backend rejects a body (e.g. one with `NaN` in it),
+    it's decoded again with `json`, so the result never depends on the backend.
+    Backends that turn integers wider than 64 bits into floats (like older versions of `orjson`)
+    pass documents that may have one to `json` instead.
+
+    Parameters
+    ----------
+    `backend` (str, optional) = None:
+        `"orjson"`, `"simdjson"` or `"json"`.
+        If set to `None`, the fastest installed backend is picked.
+        An `ImportError` is raised if `backend` isn't installed.
+    """
+    if backend is not None and backend not in AU_JSON_BACKENDS:
+        raise ValueError(
+            f'`backend` must be one of {AU_JSON_BACKENDS}, not `{backend}`.')
+
+    loads = None
+    if backend is not None:
+        loads = _au_import_json_backend(backend)
+
+    with _au_json_lock:
+        _au_json_settings["backend"] = backend
+        _au_json_settings["loads"] = loads
+
+
+def get_au_json_backend() -> str:
+    """
+    Returns the name of the library used to decode JSON
+    (`"orjson"`, `"simdjson"` or `"json"`).
+    """
+    return _au_resolve_json_backend()[0]
+
+
+def au_json_loads(data: bytes | str):
+    """
+    Decodes a JSON document with the backend set by `configure_au_json()`.
+
+    Parameters
+    ----------
+    `data` (bytes or str, mandatory):
+        The JSON document. Passing the raw bytes of a response
+        (`response.content`) avoids decoding them to a str first.
+
+    Returns
+    ----------
+    The decoded JSON, as Python objects.
+    """
+    backend, loads = _au_resolve_json_backend()
+
+    if backend == "json":
+        return loads(data)
+
+    try:
+        return loads(data)
+    except ValueError:
+        # `json` accepts a few things the fast backends don't
+        # (`NaN`, `Infinity`, and integers wider than 64 bits).
+        return json.loads(data)
@@ -1,12 +1,29 @@
-import json
-import time
 # from urllib.request import urlopen
+from collections.abc import Iterator
 
 import pandas as pd
-import requests
-from tqdm import tqdm
 
-from athetes_unlimited_py.utils import raise_html_status_code
+from athetes_unlimited_py.client import get_au_json, get_au_season_catalog
+from athetes_unlimited_py.metrics import _au_measure
+from athetes_unlimited_py.progress import _au_game_fetched, _au_season_empty
+from athetes_unlimited_py.season import (
+    _au_game_seasons,
+    get_au_season,
+    get_au_season_id,
+    get_au_season_year,
+)
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_game_pbp_output,
+    _au_game_stats_output,
+    _au_season_output,
+    au_chunk_game_pairs,
+    au_chunk_games,
+    au_concat_game_pairs,
+    au_concat_games,
+    au_imap_games,
+    au_parse_game_roster,
+)
 
 ##############################################################################
 ##
@@ -29,23 +46,7 @@ def get_au_lacrosse_season(season_id: int) -> int:
     ----------
     The proper season corresponding to an Athletes Unlimited lacrosse season ID.
     """
-    season = 0
-    if season_id == 5:
-        season = 2021
-        return season
-    elif season_id == 17:
-        season = 2022
-        return season
-    elif season_id == 105:
-        season = 2023
-        return season
-    # TODO: Get a season ID for AU Lacrosse
-    # elif season_id == 105:
-    #     season = 2024
-    #     return season
-    else:
-        raise ValueError(
-            f'[season_id] can only be for the 2021-2024 lacrosse seasons at this time.\nYou entered :\n\t{season}')
+    return get_au_season_year("lacrosse", season_id)
 
 
 def get_au_lacrosse_season_id(season: int) -> int:
@@ -62,24 +63,8 @@ def get_au_lacrosse_season_id(season: int) -> int:
     ----------
     The proper season ID corresponding to an Athletes Unlimited lacrosse season.
     """
-    seasonId = 0
-
-    if season == 2021:
-        seasonId = 5
-        return seasonId
-    elif season == 2022:
-        seasonId = 17
-        return seasonId
-    elif season == 2023:
-        seasonId = 105
-        return seasonId
-    # TODO: Get a season ID for AU Lacrosse
-    # elif season == 2024:
-    #     seasonId = 105
-    #     return seasonId
-    else:
-        raise ValueError(
-            f'[season] can only be 2021, 2022, or 2023 at this time for lacrosse.\nYou entered :\n\t{season}')
+    return get_au_season_id("lacrosse", season)
+
 
 ##############################################################################
 ##
@@ -88,66 +73,36 @@ def get_au_lacrosse_season_id(season: int) -> int:
 ##############################################################################
 
 
-def get_au_lacrosse_game_stats(season_id: int, game_num: int, get_team_stats=False, get_player_and_team_stats=False, rename_cols=False) -> pd.DataFrame():
+def _parse_au_lacrosse_game_stats(json_data: dict) -> tuple:
     """
-    Retrieves the player and/or team game stats for an Atheltes Unlimited (AU) lacrosse game.
+    Parses the JSON returned by the Athletes Unlimited (AU) lacrosse box score API.
 
     Parameters
     ----------
-    `season_id` (int, mandatory):
-        The AU lacrosse season ID you want a game from.
-
-    `game_num` (int, mandatory):
-        The game number you want player and/or team stats from.
-        This is not the game ID!
-        A `ValueError` will be raised if `game_num` is set to less than 1.
-
-    `get_team_stats` (bool, optional) = False:
-        Optional boolean argument. 
-        If set to `True`, the pandas DataFrame returned by `get_lacrosse_game_stats()` will only return team stats for that game, 
-        and will not return player stats, unless `get_player_and_team_stats` is set to `True` if `get_team_stats` is set to `True`.
-
-    `get_player_and_team_stats` (bool, optional) = False:
-
-    `rename_cols` (bool, optional) = False:
-        NOT IMPLEMENTED YET!
-        `get_lacrosse_game_stats()` will have no change in functionality at this time if `rename_cols` is set to `True`.
-
+    `json_data` (dict, mandatory):
+        The JSON of a `by-game` API response.
 
     Returns
     ----------
-    A pandas DataFrame containing player and/or team stats for a given AU game within a given AU season ID.
+    A tuple containing two pandas DataFrames. The first contains player stats for this game,
+    and the second contains team stats for this game.
     """
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
     player_stats_df = pd.DataFrame()
     team_stats_df = pd.DataFrame()
     row_df = pd.DataFrame()
 
-    if game_num < 1:
-        raise ValueError('`game_num` cannot be less than 0.')
-
-    # Yes, the key is literaly the int of the Epoch time at the time of the GET request.
-    key = int(time.time())
-    url = f"https://auprosports.com/proxy.php?request=/api/stats/lacrosse/v1/{season_id}/by-game/{game_num}?statType=lacrosse_player%26statType=lacrosse_goalie%26k={key}"
-
-    response = requests.get(url, headers=headers)
-    raise_html_status_code(response.status_code)
-
-    json_data = json.loads(response.text)
-
     sport = json_data['metaSport']['sport']
     api_version = json_data['metaSport']['version']
+    seasons = _au_game_seasons("lacrosse", json_data)
 
-    for i in tqdm(json_data['data']):
+    for i in json_data['data']:
         row_df = pd.DataFrame(
             {'sport': sport, 'api_version': api_version}, index=[0])
 
         ###################################################################
         # Player/Team info
         ###################################################################
-        row_df['season'] = get_au_lacrosse_season(i['seasonId'])
+        row_df['season'] = seasons[i['seasonId']]
         row_df['seasonId'] = i['seasonId']
         row_df['weekNumber'] = 0
         row_df['gameNumber'] = 0
@@ -225,24 +180,202 @@ def get_au_lacrosse_game_stats(season_id: int, game_num: int, get_team_stats=Fal
 
         del row_df
 
-    ###################################################################
-    # Once we're done, return the correct dataframe.
-    ###################################################################
-
-    if get_player_and_team_stats == True:
-        stats_df = pd.concat(
-            [player_stats_df, team_stats_df], ignore_index=True)
-        del player_stats_df, team_stats_df
-        return stats_df
-    elif get_team_stats == True:
-        del player_stats_df
-        return team_stats_df
+    return player_stats_df, team_stats_df
+
+
+def _au_lacrosse_game_stats_request(season_id: int, game_num: int) -> tuple:
+    """
+    Returns the API request and cache key of the box score of a lacrosse game.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    return (
+        f"/api/stats/lacrosse/v1/{season_id}/by-game/{game_num}?statType=lacrosse_player%26statType=lacrosse_goalie",
+        ("lacrosse", "by-game", season_id, game_num),
+    )
+
+
+def _get_au_lacrosse_game_stats_json(season_id: int, game_num: int) -> dict:
+    """
+    Downloads the box score JSON of an Atheltes Unlimited (AU) lacrosse game.
+    """
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_lacrosse_game_stats_request(season_id, game_num)
+    return get_au_json(request, cache_key=cache_key)
+
+
+def get_au_lacrosse_game_stats(season_id: int, game_num: int, get_team_stats=False, get_player_and_team_stats=False, rename_cols=False, output: str = "pandas") -> pd.DataFrame:
+    """
+    Retrieves the player and/or team game stats for an Atheltes Unlimited (AU) lacrosse game.
+
+    Parameters
+    ----------
+    `season_id` (int, mandatory):
+        The AU lacrosse season ID you want a game from.
+
+    `game_num` (int, mandatory):
+        The game number you want player and/or team stats from.
+        This is not the game ID!
+        A `ValueError` will be raised if `game_num` is set to less than 1.
+
+    `get_team_stats` (bool, optional) = False:
+        Optional boolean argument. 
+        If set to `True`, the pandas DataFrame returned by `get_lacrosse_game_stats()` will only return team stats for that game, 
+        and will not return player stats, unless `get_player_and_team_stats` is set to `True` if `get_team_stats` is set to `True`.
+
+    `get_player_and_team_stats` (bool, optional) = False:
+
+    `rename_cols` (bool, optional) = False:
+        NOT IMPLEMENTED YET!
+        `get_lacrosse_game_stats()` will have no change in functionality at this time if `rename_cols` is set to `True`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A pandas DataFrame containing player and/or team stats for a given AU game within a given AU season ID.
+    """
+    _au_check_output(output)
+    json_data = _get_au_lacrosse_game_stats_json(season_id, game_num)
+
+    player_stats_df, team_stats_df = _parse_au_lacrosse_game_stats(json_data)
+
+    return _au_game_stats_output(
+        player_stats_df,
+        team_stats_df,
+        "lacrosse",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
+
+
+def _parse_au_lacrosse_pbp(json_data: dict, season: int, game_id: int, return_participation_data=False):
+    """
+    Parses the JSON returned by the Athletes Unlimited (AU) lacrosse play-by-play (PBP) API.
+
+    Parameters
+    ----------
+    `json_data` (dict, mandatory):
+        The JSON of a `play-by-play` API response.
+
+    `season` (int, mandatory):
+        The season this game was played in.
+
+    `game_id` (int, mandatory):
+        The game ID of this game.
+
+    `return_participation_data` (bool, optional) = `False`:
+        If set to `True`, a secondary pandas DataFrame containing roster information will be returned.
+
+    Returns
+    ----------
+    The same data returned by `get_au_lacrosse_pbp()`.
+    """
+    plays = []
+
+    for i in json_data['data'][0]['plays']:
+        plays.append({
+            'season': season,
+            'game_id': game_id,
+            'game_number': i['gameNumber'],
+            'game_report_id': i['gameReportId'],
+            'play_seq_num': i['playSeqno'],
+            'action': i['action'],
+            'play_desc': i['text'],
+            'player_id': i['playerId'],
+            'team_id': i['teamId'],
+            'period': i['period'],
+            'clock': i['clock'],
+            'home_team_id': i['homeTeamId'],
+            'home_team_score': i['homeTeamScore'],
+            'is_a_play': i['isAPlay'],
+            'narrative_formatted': i['narrativeFormatted'],
+            'has_error': i['hasError'],
+            'goals': i['goals'],
+            'assists': i['assists'],
+            'shots': i['shots'],
+            'shots_on_goal': i['shotsOnGoal'],
+            'assist_player_id': i['assistPlayerId'],
+            'good_clear': i['goodClear'],
+            'failed_clear': i['failedClear'],
+            'disruptor_player_id': i['disruptorPlayerId'],
+            'gw_goals': i['gwGoals'],
+            'pp_goals': i['ppGoals'],
+            'sh_goals': i['shGoals'],
+            'ua_goals': i['uaGoals'],
+            'ot_goals': i['otGoals'],
+            'en_goals': i['enGoals'],
+            'gt_goals': i['gtGoals'],
+            'fg_goals': i['fgGoals'],
+            'shootout_goals': i['shootoutGoals'],
+            'penalties': i['penalties'],
+            'shot_clock_violations': i['shotClockViolations'],
+            'rcs': i['rcs'],
+            'ycs': i['ycs'],
+            'mn_penalties': i['mnPenalties'],
+            'mj_penalties': i['mjPenalties'],
+            'match_penalties': i['matchPenalties'],
+            'fouls': i['fouls'],
+            'face_won': i['faceWon'],
+            'face_lost': i['faceLost'],
+            'gbs': i['gbs'],
+            'dc': i['dc'],
+            'ct': i['ct'],
+            'turnovers': i['turnovers'],
+            'caused_turnover_player_id': i['causedTurnoverPlayerId'],
+            'caused_turnover_team': i['causedTurnoverTeam'],
+            'd_save': i['dsave'],
+            'minutes': i['minutes'],
+            'seconds': i['seconds'],
+            'goalie_time': i['goalieTime'],
+            'ga': i['ga'],
+            'saves': i['saves'],
+            'goalie_player_id': i['goaliePlayerId'],
+            'shots_faced': i['shotsFaced'],
+            'scoring_play': i['scoringPlay'],
+        })
+
+    game_pbp_df = pd.DataFrame(plays)
+    del plays
+
+    if return_participation_data == True:
+        roster_df = au_parse_game_roster(json_data, season, game_id)
+        return game_pbp_df, roster_df
+
     else:
-        del team_stats_df
-        return player_stats_df
+        return game_pbp_df
 
+def _au_lacrosse_pbp_request(season_id: int, game_id: int) -> tuple:
+    """
+    Returns the API request and cache key of the play-by-play (PBP) data of a lacrosse game.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    return (
+        f"/api/play-by-play/lacrosse/v1/event/{season_id}/game/{game_id}",
+        ("lacrosse", "play-by-play", season_id, game_id),
+    )
 
-def get_au_lacrosse_pbp(season_id: int, game_id: int, return_participation_data=False) -> pd.DataFrame():
+
+def _get_au_lacrosse_pbp_json(season_id: int, game_id: int) -> dict:
+    """
+    Downloads the play-by-play (PBP) JSON of an Atheltes Unlimited (AU) lacrosse game.
+    """
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
+
+    request, cache_key = _au_lacrosse_pbp_request(season_id, game_id)
+    return get_au_json(request, cache_key=cache_key)
+
+
+def get_au_lacrosse_pbp(season_id: int, game_id: int, return_participation_data=False, output: str = "pandas") -> pd.DataFrame:
     """
     Retrieves the play-by-play (PBP) data for an Atheltes Unlimited (AU) lacrosse game.
 
@@ -259,285 +392,334 @@ def get_au_lacrosse_pbp(season_id: int, game_id: int, return_participation_data=
         If set to `True`, `get_au_lacrosse_pbp()` will return a secondary pandas DataFrame
         containing roster information for this AU lacrosse game.
 
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+        If `return_participation_data` is set to `True`, both DataFrames are returned in this format.
+
     Returns
     ----------
     A pandas DataFrame containing PBP data for a given AU game ID within a given AU season ID.
     If `return_participation_data` is set to `True`, an additional pandas DataFrame containing roster data for this game will be returned as well.
     """
-
+    _au_check_output(output)
     # season_id = get_au_lacrosse_season_id(season)
     season = get_au_lacrosse_season(season_id)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
-    game_pbp_df = pd.DataFrame()
-    roster_df = pd.DataFrame()
-    row_df = pd.DataFrame()
+    json_data = _get_au_lacrosse_pbp_json(season_id, game_id)
 
-    if game_id < 1:
-        raise ValueError('`game_id` cannot be less than 0.')
+    pbp = _parse_au_lacrosse_pbp(
+        json_data,
+        season,
+        game_id,
+        return_participation_data=return_participation_data
+    )
+    return _au_game_pbp_output(pbp, "lacrosse", output)
 
-    # Yes, the key is literaly the int of the Epoch time at the time of the GET request.
-    key = int(time.time())
-    url = f"https://auprosports.com/proxy.php?request=/api/play-by-play/lacrosse/v1/event/{season_id}/game/{game_id}?k={key}"
 
-    response = requests.get(url, headers=headers)
-    raise_html_status_code(response.status_code)
+def _au_lacrosse_season_pbp_games(season: int, max_workers: int = 1):
+    """
+    Yields the PBP data of every game in an Atheltes Unlimited (AU) lacrosse season, one game at a time.
+    Shared by `get_au_lacrosse_season_pbp()` and `iter_au_lacrosse_season_pbp()`.
+    """
+    season_id = get_au_lacrosse_season_id(season)
+    sport_json_data = get_au_season_catalog("lacrosse")
 
-    json_data = json.loads(response.text)
+    for i in sport_json_data['data']:
+        # print(i)
+        if i['seasonId'] == season_id:
+            pbp_season = get_au_lacrosse_season(season_id)
 
-    del headers, key
-    # print(json_data)
-    for i in tqdm(json_data['data'][0]['plays']):
-        row_df = pd.DataFrame(
-            {'season': season, 'game_id': game_id}, index=[0])
-
-        row_df['game_number'] = i['gameNumber']
-        row_df['game_report_id'] = i['gameReportId']
-        row_df['play_seq_num'] = i['playSeqno']
-        row_df['action'] = i['action']
-        row_df['play_desc'] = i['text']
-        row_df['player_id'] = i['playerId']
-        row_df['team_id'] = i['teamId']
-        row_df['period'] = i['period']
-        row_df['clock'] = i['clock']
-        row_df['home_team_id'] = i['homeTeamId']
-        row_df['home_team_score'] = i['homeTeamScore']
-        row_df['is_a_play'] = i['isAPlay']
-        row_df['narrative_formatted'] = i['narrativeFormatted']
-        row_df['has_error'] = i['hasError']
-        row_df['goals'] = i['goals']
-        row_df['assists'] = i['assists']
-        row_df['shots'] = i['shots']
-        row_df['shots_on_goal'] = i['shotsOnGoal']
-        row_df['assist_player_id'] = i['assistPlayerId']
-        row_df['good_clear'] = i['goodClear']
-        row_df['failed_clear'] = i['failedClear']
-        row_df['disruptor_player_id'] = i['disruptorPlayerId']
-        row_df['gw_goals'] = i['gwGoals']
-        row_df['pp_goals'] = i['ppGoals']
-        row_df['sh_goals'] = i['shGoals']
-        row_df['ua_goals'] = i['uaGoals']
-        row_df['ot_goals'] = i['otGoals']
-        row_df['en_goals'] = i['enGoals']
-        row_df['gt_goals'] = i['gtGoals']
-        row_df['fg_goals'] = i['fgGoals']
-        row_df['shootout_goals'] = i['shootoutGoals']
-        row_df['penalties'] = i['penalties']
-        row_df['shot_clock_violations'] = i['shotClockViolations']
-        row_df['rcs'] = i['rcs']
-        row_df['ycs'] = i['ycs']
-        row_df['mn_penalties'] = i['mnPenalties']
-        row_df['mj_penalties'] = i['mjPenalties']
-        row_df['match_penalties'] = i['matchPenalties']
-        row_df['fouls'] = i['fouls']
-        row_df['face_won'] = i['faceWon']
-        row_df['face_lost'] = i['faceLost']
-        row_df['gbs'] = i['gbs']
-        row_df['dc'] = i['dc']
-        row_df['ct'] = i['ct']
-        row_df['turnovers'] = i['turnovers']
-        row_df['caused_turnover_player_id'] = i['causedTurnoverPlayerId']
-        row_df['caused_turnover_team'] = i['causedTurnoverTeam']
-        row_df['d_save'] = i['dsave']
-        row_df['minutes'] = i['minutes']
-        row_df['seconds'] = i['seconds']
-        row_df['goalie_time'] = i['goalieTime']
-        row_df['ga'] = i['ga']
-        row_df['saves'] = i['saves']
-        row_df['goalie_player_id'] = i['goaliePlayerId']
-        row_df['shots_faced'] = i['shotsFaced']
-        row_df['scoring_play'] = i['scoringPlay']
-
-        game_pbp_df = pd.concat([game_pbp_df, row_df])
-        del row_df
+            def get_game(j):
+                json_data = _get_au_lacrosse_pbp_json(season_id, j)
+                _au_game_fetched("lacrosse", season, j)
+                return _au_measure(
+                    "parse", "lacrosse", "pbp", season,
+                    _parse_au_lacrosse_pbp, json_data, pbp_season, j)
 
-    if return_participation_data == True:
+            yield from au_imap_games(
+                get_game, i['gameIds'], max_workers,
+                sport="lacrosse", season=season)
 
-        for i in json_data['data'][0]['competitors']:
-
-            competitor_id = i['competitorId']
-            competitor_color = i['color']
-            competitor_name = i['name']
-
-            for j in i['players']:
-                row_df = pd.DataFrame({
-                    'season': season,
-                    'game_id': game_id,
-                    'competitor_id': competitor_id,
-                    'competitor_color': competitor_color,
-                    'competitor_name': competitor_name
-                },
-                    index=[0]
-                )
-
-                row_df['competitor_id'] = j['competitorId']
-                row_df['player_id'] = j['playerId']
-                row_df['captain_flag'] = j['captainFlg']
-                row_df['display_name'] = j['displayName']
-                row_df['first_name'] = j['firstName']
-                row_df['last_name'] = j['lastName']
-                row_df['current_roster_status_description'] = j['currentRosterStatus']['description']
-                row_df['current_rosterStatus_comments'] = j['currentRosterStatus']['comments']
-                row_df['current_rosterStatus_transactionType'] = j['currentRosterStatus']['transactionType']
-                row_df['current_rosterStatus_rosterStatusLk'] = j['currentRosterStatus']['rosterStatusLk']
-                row_df['is_voting_flg'] = j['isVotingFlg']
-                row_df['can_be_voted_for_flg'] = j['canBeVotedForFlg']
-                row_df['has_voted_flag'] = j['hasVotedFlg']
-                row_df['uniform_number'] = str(j['uniformNumber'])
-                row_df['is_nominated_flag'] = j['isNominatedFlg']
-                row_df['nominated_flag'] = j['nominatedFlg']
-                row_df['player_url'] = j['resourceUrl']
-                row_df['image_url'] = j['imageResource']['imageUrl']
-
-                roster_df = pd.concat([roster_df, row_df], ignore_index=True)
-            del row_df
-
-        del json_data
-        return game_pbp_df, roster_df
 
-    else:
-        del json_data, roster_df
-        return game_pbp_df
+def get_au_lacrosse_season_pbp(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) lacrosse season, get and parse all play-by-play (PBP) data for an AU lacrosse season.
 
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU lacrosse season you want PBP data from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_lacrosse_season_pbp()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing PBP data from a AU season.
 
-def get_au_lacrosse_season_pbp(season: int) -> pd.DataFrame():
     """
-    Given an Atheltes Unlimited (AU) lacrosse season, get and parse all play-by-play (PBP) data for an AU lacrosse season.
+    _au_check_output(output)
+    season_pbp_df = au_concat_games(
+        _au_lacrosse_season_pbp_games(season, max_workers),
+        chunk_size=chunk_size
+    )
+
+    return _au_season_output(season_pbp_df, "lacrosse", "pbp", output)
+
+
+def iter_au_lacrosse_season_pbp(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[pd.DataFrame]:
+    """
+    Same as `get_au_lacrosse_season_pbp()`, but yields the play-by-play (PBP) data of an AU lacrosse season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning one DataFrame once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU lacrosse season you want PBP data from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded DataFrame.
+        By default, one DataFrame is yielded for every game.
+
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`), so every chunk has the same columns and types.
+
     Returns
     ----------
-    A pandas DataFrame containing PBP data from a AU season.
+    A generator of pandas DataFrames (or `pyarrow.Table`s) containing PBP data from a AU season.
+    """
+    _au_check_output(output)
+
+    return (
+        _au_season_output(pbp_df, "lacrosse", "pbp", output)
+        for pbp_df in au_chunk_games(
+            _au_lacrosse_season_pbp_games(season, max_workers), chunk_size)
+    )
+
 
+def _au_lacrosse_season_box_games(season: int, max_workers: int = 1):
+    """
+    Yields the `(player_df, team_df)` box scores of every game in an Atheltes Unlimited (AU) lacrosse season, one game at a time.
+    Shared by `get_au_lacrosse_season_box()` and `iter_au_lacrosse_season_box()`.
     """
-    season_pbp_df = pd.DataFrame()
     season_id = get_au_lacrosse_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/lacrosse/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"}
-
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+    sport_json_data = get_au_season_catalog("lacrosse")
 
     for i in sport_json_data['data']:
         # print(i)
         if i['seasonId'] == season_id:
             len_game_ids = len(i['gameIds'])
-            count = 0
-            for j in tqdm(i['gameIds']):
-                count += 1
-                print(f'\nOn game ID {count} of {len_game_ids} in {season}.')
-                # try:
-                #     game_df = get_lacrosse_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
 
-                game_df = get_au_lacrosse_pbp(season_id, j)
+            def get_game(j):
+                json_data = _get_au_lacrosse_game_stats_json(season_id, j)
+                _au_game_fetched("lacrosse", season, j)
+                return _au_measure(
+                    "parse", "lacrosse", "box", season,
+                    _parse_au_lacrosse_game_stats, json_data)
 
-                season_pbp_df = pd.concat(
-                    [season_pbp_df, game_df], ignore_index=True)
-                del game_df
+            yield from au_imap_games(
+                get_game, range(1, len_game_ids+1), max_workers,
+                sport="lacrosse", season=season)
 
-    return season_pbp_df
 
-
-def get_au_lacrosse_season_player_box(season: int) -> pd.DataFrame():
+def get_au_lacrosse_season_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> tuple:
     """
     Given an Atheltes Unlimited (AU) lacrosse season, get and parse all box-score game stats for an AU lacrosse season.
-    This returns all player game stats, and does not return season stats or game averages.
+    Every game is downloaded once, and both the player and team game stats are returned.
 
     Parameters
     ----------
     `season` (int, mandatory):
-        The AU lacrosse season you want player box scores from.
+        The AU lacrosse season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_lacrosse_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, pandas DataFrames are returned.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are returned
+        (see `get_au_schema()`).
 
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A tuple containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats from a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
-    season_id = get_au_lacrosse_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/lacrosse/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    _au_check_output(output)
+    season_player_df, season_team_df = au_concat_game_pairs(
+        _au_lacrosse_season_box_games(season, max_workers),
+        chunk_size=chunk_size
+    )
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+    return (
+        _au_season_output(season_player_df, "lacrosse", "player_box", output),
+        _au_season_output(season_team_df, "lacrosse", "team_box", output)
+    )
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == season_id:
-            len_game_ids = len(i['gameIds'])
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_lacrosse_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+def iter_au_lacrosse_season_box(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[tuple]:
+    """
+    Same as `get_au_lacrosse_season_box()`, but yields the player and team box scores of an AU lacrosse season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning them once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU lacrosse season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
 
-                game_df = get_au_lacrosse_game_stats(season_id, j)
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded tuple.
+        By default, one tuple is yielded for every game.
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`).
 
-    return season_stats_df
+    Returns
+    ----------
+    A generator of tuples containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats.
+    """
+    _au_check_output(output)
+
+    return (
+        (
+            _au_season_output(player_df, "lacrosse", "player_box", output),
+            _au_season_output(team_df, "lacrosse", "team_box", output)
+        )
+        for player_df, team_df in au_chunk_game_pairs(
+            _au_lacrosse_season_box_games(season, max_workers), chunk_size)
+    )
 
 
-def get_au_lacrosse_season_team_box(season: int) -> pd.DataFrame():
+def get_au_lacrosse_season_player_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
     """
     Given an Atheltes Unlimited (AU) lacrosse season, get and parse all box-score game stats for an AU lacrosse season.
     This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_au_lacrosse_season_box()`.
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU lacrosse season you want player box scores from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_lacrosse_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
-    season_id = get_au_lacrosse_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/lacrosse/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    player_box_df, _ = get_au_lacrosse_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return player_box_df
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == season_id:
-            len_game_ids = len(i['gameIds'])
+def get_au_lacrosse_season_team_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) lacrosse season, get and parse all box-score game stats for an AU lacrosse season.
+    This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_au_lacrosse_season_box()`.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU lacrosse season you want player box scores from.
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_lacrosse_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
 
-                game_df = get_au_lacrosse_game_stats(
-                    season_id, j, get_team_stats=True)
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_lacrosse_season_box()`.
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
-    return season_stats_df
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
+
+    """
+    _, team_box_df = get_au_lacrosse_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return team_box_df
 
 ##############################################################################
 ##
@@ -546,21 +728,11 @@ def get_au_lacrosse_season_team_box(season: int) -> pd.DataFrame():
 ##############################################################################
 
 
-def get_au_lacrosse_season_player_stats(season: int) -> pd.DataFrame():
+def _au_lacrosse_season_player_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) lacrosse season, get all season player stats for an AU lacrosse season.
-
-    Parameters
-    ----------
-    `season` (int, mandatory):
-        The AU lacrosse season you want season player stats from.
-
-    Returns
-    ----------
-    A pandas DataFrame containing season player stats a AU season.
-
+    Given Athletes Unlimited (AU) lacrosse box score stats for a season, calculates season player stats.
+    Used by `get_au_lacrosse_season_player_stats()`.
     """
-    game_stats_df = get_au_lacrosse_season_player_box(season)
     # ['sport', 'api_version', 'season', 'seasonId', 'weekNumber',
     #    'gameNumber', 'seasonType', 'playerId', 'uniformNumber',
     #    'uniformNumberDisplay', 'primaryPositionLk', 'secondaryPositionLk',
@@ -621,25 +793,48 @@ def get_au_lacrosse_season_player_stats(season: int) -> pd.DataFrame():
         return finished_df
 
     else:
-        print(f'No lacrosse stats found in {season}.')
+        _au_season_empty("lacrosse", season, "player_stats")
         return pd.DataFrame()
 
 
-def get_au_lacrosse_season_team_stats(season: int) -> pd.DataFrame():
+def get_au_lacrosse_season_player_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) lacrosse season, get all season team stats for an AU lacrosse season.
+    Given an Atheltes Unlimited (AU) lacrosse season, get all season player stats for an AU lacrosse season.
+    Box scores are downloaded once per season, and are shared with `get_au_lacrosse_season_team_stats()` (see `get_au_season()`).
 
     Parameters
     ----------
     `season` (int, mandatory):
-        The AU lacrosse season you want season team stats from.
+        The AU lacrosse season you want season player stats from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
     Returns
     ----------
-    A pandas DataFrame containing season team stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing season player stats a AU season.
 
     """
-    game_stats_df = get_au_lacrosse_season_team_box(season)
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "lacrosse", season, max_workers=max_workers).player_stats.copy()
+    return _au_season_output(season_stats_df, "lacrosse", "player_stats", output)
+
+
+def _au_lacrosse_season_team_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """
+    Given Athletes Unlimited (AU) lacrosse box score stats for a season, calculates season team stats.
+    Used by `get_au_lacrosse_season_team_stats()`.
+    """
     # ['sport', 'api_version', 'season', 'seasonId', 'weekNumber',
     #    'gameNumber', 'seasonType', 'playerId', 'uniformNumber',
     #    'uniformNumberDisplay', 'primaryPositionLk', 'secondaryPositionLk',
@@ -699,5 +894,38 @@ def get_au_lacrosse_season_team_stats(season: int) -> pd.DataFrame():
 
         return finished_df
     else:
-        print(f'No lacrosse stats found in {season}.')
+        _au_season_empty("lacrosse", season, "team_stats")
         return pd.DataFrame()
+
+
+def get_au_lacrosse_season_team_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) lacrosse season, get all season team stats for an AU lacrosse season.
+    Box scores are downloaded once per season, and are shared with `get_au_lacrosse_season_player_stats()` (see `get_au_season()`).
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU lacrosse season you want season team stats from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing season team stats a AU season.
+
+    """
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "lacrosse", season, max_workers=max_workers).team_stats.copy()
+    return _au_season_output(season_stats_df, "lacrosse", "team_stats", output)
@@ -0,0 +1,296 @@
+import warnings
+
+import pandas as pd
+
+from athetes_unlimited_py.progress import _au_track_game, get_au_progress
+from athetes_unlimited_py.season import (
+    AU_SEASON_SPORTS,
+    _au_api_sport,
+    get_au_season_ids,
+    refresh_au_season_ids,
+)
+from athetes_unlimited_py.sync import _au_sync_game_loader, _au_sync_games
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_imap_games,
+    _au_season_output,
+    au_concat_games,
+)
+
+##############################################################################
+##
+# Bulk loader
+##
+##############################################################################
+
+# dataset -> (the dataset downloaded for it, which of its DataFrames it is)
+# The player and team box scores of a game come from the same response,
+# so it's only downloaded once, even if both are loaded.
+AU_LOAD_DATASETS = {
+    "pbp": ("pbp", 0),
+    "player_box": ("box", 0),
+    "team_box": ("box", 1),
+}
+
+# The endpoint every downloaded dataset comes from.
+_AU_LOAD_ENDPOINTS = {
+    "box": "by-game",
+    "pbp": "play-by-play",
+}
+
+
+def _au_load_seasons(sport: str, seasons) -> list:
+    """
+    Returns every season (with its season ID) of a sport that will be loaded.
+    If `seasons` is `None`, every known season of `sport` is loaded,
+    and a warning names the season IDs of its seasons catalog that aren't mapped to a season.
+    Seasons that aren't known for `sport` are skipped, with a warning.
+    """
+    known_seasons = get_au_season_ids(sport)
+
+    if seasons is None:
+        unmapped_ids = refresh_au_season_ids(sport)[_au_api_sport(sport)]
+
+        if len(unmapped_ids) > 0:
+            warnings.warn(
+                f'The seasons catalog of {_au_api_sport(sport)} has season IDs that aren\'t mapped '
+                f'to a season, which are not loaded: {unmapped_ids}.\n'
+                'Use `register_au_season()` to map them.',
+                stacklevel=4)
+
+        return list(known_seasons.items())
+
+    unknown_seasons = [
+        season for season in dict.fromkeys(seasons) if season not in known_seasons]
+
+    if len(unknown_seasons) > 0:
+        warnings.warn(
+            f'{sport} has no known season ID for {unknown_seasons}, '
+            'which are not loaded.\nUse `register_au_season()` to add them.',
+            stacklevel=4)
+
+    return [
+        (season, known_seasons[season])
+        for season in dict.fromkeys(seasons) if season in known_seasons
+    ]
+
+
+def _au_load_plan(sports, seasons, datasets) -> list:
+    """
+    Plans every request needed to load `datasets` for every season of `sports`.
+
+    Returns a list of `(sport, season, season_id, downloads)` tuples,
+    where `downloads` is a dict of `{"box" or "pbp": games}`.
+    Every game is listed once, even if it's used by multiple datasets.
+    """
+    if isinstance(sports, str):
+        sports = [sports]
+    if isinstance(seasons, int):
+        seasons = [seasons]
+    if isinstance(datasets, str):
+        datasets = [datasets]
+
+    for sport in sports:
+        if sport not in AU_SEASON_SPORTS:
+            raise ValueError(
+                f'`sport` must be one of {AU_SEASON_SPORTS}, not `{sport}`.')
+
+    for dataset in datasets:
+        if dataset not in AU_LOAD_DATASETS:
+            raise ValueError(
+                f'`dataset` must be one of {tuple(AU_LOAD_DATASETS)}, not `{dataset}`.')
+
+    downloaded_datasets = list(dict.fromkeys(
+        AU_LOAD_DATASETS[dataset][0] for dataset in datasets))
+
+    plan = []
+    for sport in dict.fromkeys(sports):
+        for season, season_id in _au_load_seasons(sport, seasons):
+            downloads = {
+                dataset: _au_sync_games(sport, season, dataset)[1]
+                for dataset in downloaded_datasets
+            }
+            plan.append((sport, season, season_id, downloads))
+
+    return plan
+
+
+def get_au_load_plan(
+        sports,
+        seasons=None,
+        datasets=("pbp", "player_box", "team_box")) -> pd.DataFrame:
+    """
+    Returns every request `load_au_seasons()` would send
+    for the same arguments, without sending any of them
+    (other than downloading the seasons catalog of every sport).
+
+    Parameters
+    ----------
+    `sports` (list, mandatory):
+        The sports to load (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` and/or `volleyball`).
+
+    `seasons` (list, optional) = None:
+        The seasons to load. Seasons a sport doesn't have a known season ID for
+        are skipped, with a warning.
+        If set to `None`, every known season of every sport is loaded,
+        and season IDs in the seasons catalog that aren't mapped to a season
+        are skipped, with a warning (see `refresh_au_season_ids()`).
+
+    `datasets` (list, optional) = ("pbp", "player_box", "team_box"):
+        The datasets to load (`pbp`, `player_box` and/or `team_box`).
+
+    Returns
+    ----------
+    A pandas DataFrame with one row for every request,
+    and the `sport`, `season`, `season_id`, `endpoint` and `game` of each.
+    """
+    rows = [
+        {
+            "sport": sport,
+            "season": season,
+            "season_id": season_id,
+            "endpoint": _AU_LOAD_ENDPOINTS[dataset],
+            "game": game,
+        }
+        for sport, season, season_id, downloads in _au_load_plan(sports, seasons, datasets)
+        for dataset, games in downloads.items()
+        for game in games
+    ]
+
+    return pd.DataFrame(
+        rows, columns=["sport", "season", "season_id", "endpoint", "game"])
+
+
+def load_au_seasons(
+        sports,
+        seasons=None,
+        datasets=("pbp", "player_box", "team_box"),
+        max_workers: int = 4,
+        output: str = "pandas") -> dict:
+    """
+    Loads multiple datasets of multiple seasons of multiple sports in one pass,
+    e.g. to rebuild a data warehouse.
+
+    Every request is planned up front (see `get_au_load_plan()`),
+    and every game is downloaded once, even if it's used by multiple datasets
+    (the player and team box scores of a game come from the same response).
+    Every request of every season is then sent by one shared pool of
+    `max_workers` threads, instead of one season at a time,
+    under the rate limit shared by every function (see `configure_au_client()`).
+
+    A season's DataFrames are built as soon as its last game is downloaded,
+    and are the same as the ones returned by the `get_au_*_season_pbp()`,
+    `get_au_*_season_player_box()` and `get_au_*_season_team_box()` functions.
+
+    Parameters
+    ----------
+    `sports` (list, mandatory):
+        The sports to load (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` and/or `volleyball`).
+
+    `seasons` (list, optional) = None:
+        The seasons to load. Seasons a sport doesn't have a known season ID for
+        are skipped, with a warning.
+        If set to `None`, every known season of every sport is loaded,
+        and season IDs in the seasons catalog that aren't mapped to a season
+        are skipped, with a warning (see `refresh_au_season_ids()`).
+
+    `datasets` (list, optional) = ("pbp", "player_box", "team_box"):
+        The datasets to load (`pbp`, `player_box` and/or `team_box`).
+
+    `max_workers` (int, optional) = 4:
+        The maximum number of games (of any sport or season)
+        that will be downloaded and parsed at the same time.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in (`"pandas"`, `"compact"` or `"arrow"`).
+
+    Returns
+    ----------
+    A dict of `{sport: {season: {dataset: DataFrame}}}`.
+    """
+    _au_check_output(output)
+
+    if isinstance(datasets, str):
+        datasets = [datasets]
+    datasets = list(dict.fromkeys(datasets))
+
+    if max_workers is None:
+        max_workers = 1
+    elif max_workers < 1:
+        raise ValueError('`max_workers` cannot be less than 1.')
+
+    plan = _au_load_plan(sports, seasons, datasets)
+    progress = get_au_progress()
+
+    # One task for every game of every season, in the order of `plan`.
+    tasks = []
+    remaining = {}
+
+    for sport, season, season_id, downloads in plan:
+        remaining[(sport, season)] = sum(len(games) for games in downloads.values())
+
+        if progress is not None:
+            progress.season_started(sport, season, remaining[(sport, season)])
+
+        for dataset, games in downloads.items():
+            load_game = _au_sync_game_loader(sport, season, season_id, dataset)
+
+            if progress is not None:
+                load_game = _au_track_game(load_game, progress, sport, season)
+
+            for game in games:
+                tasks.append((sport, season, dataset, load_game, game))
+
+    def run_task(task):
+        _, _, _, load_game, game = task
+        _, dfs = load_game(game)
+        return dfs
+
+    # Every season is listed in the order of `plan`, even if it has no games.
+    results = {}
+    for sport, season, _, _ in plan:
+        results.setdefault(sport, {})[season] = {}
+
+    game_dfs = {}
+    finished = set()
+
+    def finish_season(sport, season):
+        season_results = results[sport][season]
+
+        for name in datasets:
+            downloaded_dataset, k = AU_LOAD_DATASETS[name]
+            season_df = au_concat_games(
+                dfs[k] for dfs in game_dfs.get((sport, season, downloaded_dataset), []))
+            season_results[name] = _au_season_output(
+                season_df, sport, name, output)
+
+        for downloaded_dataset in _AU_LOAD_ENDPOINTS:
+            game_dfs.pop((sport, season, downloaded_dataset), None)
+
+        finished.add((sport, season))
+        if progress is not None:
+            progress.season_finished(sport, season)
+
+    try:
+        for sport, season, _, _ in plan:
+            if remaining[(sport, season)] == 0:
+                finish_season(sport, season)
+
+        for (sport, season, dataset, _, _), dfs in zip(
+                tasks, _au_imap_games(run_task, tasks, max_workers)):
+            game_dfs.setdefault((sport, season, dataset), []).append(dfs)
+            remaining[(sport, season)] -= 1
+
+            # A season is built as soon as its last game is downloaded,
+            # and the DataFrames of its games are released.
+            if remaining[(sport, season)] == 0:
+                finish_season(sport, season)
+    finally:
+        if progress is not None:
+            for sport, season in remaining:
+                if (sport, season) not in finished:
+                    progress.season_finished(sport, season)
+
+    return results
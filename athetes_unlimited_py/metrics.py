@@ -0,0 +1,344 @@
+import bisect
+import os
+import threading
+import time
+
+from athetes_unlimited_py.decode import get_au_json_backend
+from athetes_unlimited_py.utils import _au_parse_request
+
+##############################################################################
+##
+# Metrics
+##
+##############################################################################
+
+# name -> (type, help text, histogram buckets)
+_AU_METRICS = {
+    "au_requests_total": (
+        "counter",
+        "HTTP requests sent to auprosports.com, by response status.",
+        None),
+    "au_request_seconds": (
+        "histogram",
+        "Latency of every HTTP request (every attempt, including retries).",
+        (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)),
+    "au_request_retries_total": (
+        "counter",
+        "HTTP requests that were retried.",
+        None),
+    "au_response_bytes_total": (
+        "counter",
+        "Bytes received in HTTP response bodies.",
+        None),
+    "au_decode_seconds": (
+        "histogram",
+        "Time spent decoding JSON response bodies, by JSON backend.",
+        (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)),
+    "au_cache_hits_total": (
+        "counter",
+        "Responses read from the on-disk cache instead of being downloaded.",
+        None),
+    "au_parse_seconds": (
+        "histogram",
+        "Time spent parsing the JSON of one game into rows.",
+        (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)),
+    "au_aggregate_seconds": (
+        "histogram",
+        "Time spent calculating season stats from box scores.",
+        (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)),
+    "au_rows_total": (
+        "counter",
+        "Rows produced by parsing and aggregation.",
+        None),
+}
+
+_au_metrics = None
+
+
+class AUMetricsRegistry:
+    """
+    Keeps the counters and histograms recorded by every `get_au_*` function
+    while metrics are turned on (see `configure_au_metrics()`).
+
+    Every value is tagged with labels,
+    like the `sport`, `endpoint` and `season_id` of a request,
+    or the `sport`, `dataset` and `season` of a parsed game.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def inc(self, name: str, labels: dict, value: float = 1) -> None:
+        """
+        Adds `value` to the counter `name`.
+        """
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: dict, value: float) -> None:
+        """
+        Adds `value` to the histogram `name`.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        buckets = _AU_METRICS[name][2]
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = [[0] * (len(buckets) + 1), 0.0, 0]
+                self._histograms[key] = histogram
+
+            histogram[0][bisect.bisect_left(buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def reset(self) -> None:
+        """
+        Drops every value recorded so far.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Returns every value recorded so far, as a dict.
+
+        Counters are returned as `{name: {labels: value}}`,
+        and histograms as `{name: {labels: {"count": ..., "sum": ...}}}`,
+        where `labels` is a tuple of `(label, value)` tuples.
+        """
+        snapshot = {}
+
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                snapshot.setdefault(name, {})[labels] = value
+
+            for (name, labels), (_, total, count) in self._histograms.items():
+                snapshot.setdefault(name, {})[labels] = {
+                    "count": count,
+                    "sum": total,
+                }
+
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Returns every value recorded so far,
+        in the Prometheus text exposition format.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                k: (list(v[0]), v[1], v[2]) for k, v in self._histograms.items()
+            }
+
+        lines = []
+
+        for name, (metric_type, help_text, buckets) in _AU_METRICS.items():
+            if metric_type == "counter":
+                values = sorted(
+                    (labels, value) for (n, labels), value in counters.items()
+                    if n == name)
+            else:
+                values = sorted(
+                    (labels, value) for (n, labels), value in histograms.items()
+                    if n == name)
+
+            if len(values) == 0:
+                continue
+
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            for labels, value in values:
+                if metric_type == "counter":
+                    lines.append(f"{name}{_au_prometheus_labels(labels)} {value}")
+                    continue
+
+                bucket_counts, total, count = value
+                cumulative = 0
+
+                for bound, bucket_count in zip(buckets + (float("inf"),), bucket_counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket_labels = labels + (("le", le),)
+                    lines.append(
+                        f"{name}_bucket{_au_prometheus_labels(bucket_labels)} {cumulative}")
+
+                lines.append(f"{name}_sum{_au_prometheus_labels(labels)} {total}")
+                lines.append(f"{name}_count{_au_prometheus_labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _au_prometheus_labels(labels: tuple) -> str:
+    """
+    Formats a tuple of `(label, value)` tuples as Prometheus labels.
+    """
+    if len(labels) == 0:
+        return ""
+
+    parts = []
+    for label, value in labels:
+        value = str(value).replace("\\", "\\\\").replace(
+            "\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{label}="{value}"')
+
+    return "{" + ",".join(parts) + "}"
+
+
+def configure_au_metrics(enabled: bool = True) -> None:
+    """
+    Turns on (or off) the metrics recorded by every `get_au_*` function.
+    Metrics are off by default, and cost nothing while off.
+
+    While on, the latency, status, retries and response size of every request,
+    the time spent decoding JSON, the time spent parsing every game,
+    the rows produced, and the time spent calculating season stats
+    are recorded, tagged by sport, endpoint and season.
+
+    Parameters
+    ----------
+    `enabled` (bool, optional) = True:
+        If set to `False`, metrics are turned off,
+        and every value recorded so far is dropped.
+    """
+    global _au_metrics
+
+    if enabled == False:
+        _au_metrics = None
+    elif _au_metrics is None:
+        _au_metrics = AUMetricsRegistry()
+
+
+def get_au_metrics() -> AUMetricsRegistry | None:
+    """
+    Returns the `AUMetricsRegistry` metrics are recorded in,
+    or `None` if metrics are off.
+    """
+    return _au_metrics
+
+
+def write_au_metrics(path: str) -> None:
+    """
+    Saves a snapshot of every metric recorded so far to a file,
+    in the Prometheus text exposition format
+    (e.g. for the node_exporter textfile collector).
+    The file is replaced in one step, so it's never read half-written.
+
+    Parameters
+    ----------
+    `path` (str, mandatory):
+        The file the snapshot is written to.
+    """
+    if _au_metrics is None:
+        raise ValueError(
+            'Metrics are turned off. Turn them on with `configure_au_metrics()`.')
+
+    path = os.path.abspath(os.path.expanduser(path))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(_au_metrics.to_prometheus())
+
+    os.replace(temp_path, path)
+
+
+##############################################################################
+##
+# Instrumentation
+##
+##############################################################################
+
+def _au_request_labels(request: str) -> dict:
+    """
+    Returns the `sport`, `endpoint` and `season_id` labels of an API path.
+    """
+    parsed = _au_parse_request(request)
+
+    if parsed is None:
+        return {"sport": "", "endpoint": "other", "season_id": ""}
+
+    return {
+        "sport": parsed["sport"],
+        "endpoint": parsed["endpoint"],
+        "season_id": "" if parsed["season_id"] is None else str(parsed["season_id"]),
+    }
+
+
+def _au_record_request(
+        request: str,
+        status,
+        seconds: float,
+        num_bytes: int = 0,
+        retried: bool = False) -> None:
+    """
+    Records one HTTP request (one attempt) to `request`.
+    `status` is the HTTP status code, or the name of the exception that was raised.
+    """
+    labels = _au_request_labels(request)
+
+    _au_metrics.inc("au_requests_total", dict(labels, status=str(status)))
+    _au_metrics.observe("au_request_seconds", labels, seconds)
+
+    if num_bytes > 0:
+        _au_metrics.inc("au_response_bytes_total", labels, num_bytes)
+
+    if retried == True:
+        _au_metrics.inc("au_request_retries_total", labels)
+
+
+def _au_record_decode(request: str, seconds: float) -> None:
+    """
+    Records the time spent decoding the JSON of a response to `request`.
+    """
+    labels = dict(_au_request_labels(request), backend=get_au_json_backend())
+    _au_metrics.observe("au_decode_seconds", labels, seconds)
+
+
+def _au_record_cache_hit(request: str) -> None:
+    """
+    Records a response to `request` that was read from the on-disk cache.
+    """
+    _au_metrics.inc("au_cache_hits_total", _au_request_labels(request))
+
+
+def _au_count_rows(result) -> int:
+    """
+    Returns the number of rows in the result of a parser,
+    which can be a DataFrame, a list of rows, or a tuple of either.
+    """
+    if isinstance(result, tuple):
+        return sum(_au_count_rows(r) for r in result)
+
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+def _au_measure(stage: str, sport: str, dataset: str, season: int, func, *args, **kwargs):
+    """
+    Calls `func(*args, **kwargs)`, and if metrics are on,
+    records how long it took and how many rows it returned.
+    `stage` is either `"parse"` (one game) or `"aggregate"` (season stats).
+    """
+    if _au_metrics is None:
+        return func(*args, **kwargs)
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    seconds = time.perf_counter() - start
+
+    labels = {"sport": sport, "dataset": dataset, "season": str(season)}
+    _au_metrics.observe(f"au_{stage}_seconds", labels, seconds)
+    _au_metrics.inc(
+        "au_rows_total", dict(labels, stage=stage), _au_count_rows(result))
+
+    return result
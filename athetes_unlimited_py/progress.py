@@ -0,0 +1,173 @@
+import threading
+
+##############################################################################
+##
+# Progress hooks
+##
+##############################################################################
+
+_au_progress = None
+
+
+class AUProgress:
+    """
+    Receives progress events from every season-level function
+    (`get_au_*_season_pbp()`, `get_au_*_season_box()`, etc.).
+
+    Every method does nothing by default.
+    Subclass `AUProgress`, override the events you want,
+    and turn it on with `set_au_progress()`.
+
+    If a season is downloaded with more than 1 worker,
+    game events are called from the worker threads,
+    and can arrive in any order.
+
+    `sport` is the sport of the season (`basketball`, `lacrosse`, `softball`,
+    `aux_softball` or `volleyball`), `season` is the season,
+    and `game` is the game ID (PBP data) or game number (box scores) of a game.
+    """
+
+    def season_started(self, sport: str, season: int, total: int) -> None:
+        """
+        Called before the first game of a season is downloaded.
+        `total` is the number of games that will be downloaded.
+        """
+
+    def game_started(self, sport: str, season: int, game: int) -> None:
+        """
+        Called before a game is downloaded.
+        """
+
+    def game_fetched(self, sport: str, season: int, game: int) -> None:
+        """
+        Called once the JSON of a game has been downloaded
+        (or read from the cache), before it is parsed.
+        """
+
+    def game_parsed(self, sport: str, season: int, game: int) -> None:
+        """
+        Called once a game has been downloaded and parsed.
+        """
+
+    def game_failed(self, sport: str, season: int, game: int, error: Exception) -> None:
+        """
+        Called if a game could not be downloaded or parsed.
+        `error` is raised again after this is called.
+        """
+
+    def season_finished(self, sport: str, season: int) -> None:
+        """
+        Called once every game of a season has been downloaded,
+        or the season was stopped by an error.
+        """
+
+    def season_empty(self, sport: str, season: int, dataset: str) -> None:
+        """
+        Called if season stats can't be calculated,
+        because no game of the season has stats yet.
+        `dataset` is `player_stats` or `team_stats`,
+        and an empty DataFrame is returned for it.
+        """
+
+
+class AUTqdmProgress(AUProgress):
+    """
+    An `AUProgress` that shows one `tqdm` progress bar for every season,
+    updated once for every game.
+
+    Parameters
+    ----------
+    `**tqdm_kwargs`:
+        Extra arguments passed to `tqdm()` for every progress bar
+        (`leave`, `file`, `disable`, etc.).
+    """
+
+    def __init__(self, **tqdm_kwargs):
+        from tqdm import tqdm
+
+        self._tqdm = tqdm
+        self._tqdm_kwargs = tqdm_kwargs
+        self._bars = {}
+        self._lock = threading.Lock()
+
+    def season_started(self, sport: str, season: int, total: int) -> None:
+        with self._lock:
+            self._bars[(sport, season)] = self._tqdm(
+                total=total,
+                desc=f"{sport} {season}",
+                unit="game",
+                **self._tqdm_kwargs
+            )
+
+    def game_parsed(self, sport: str, season: int, game: int) -> None:
+        with self._lock:
+            bar = self._bars.get((sport, season))
+            if bar is not None:
+                bar.update(1)
+
+    def season_finished(self, sport: str, season: int) -> None:
+        with self._lock:
+            bar = self._bars.pop((sport, season), None)
+
+        if bar is not None:
+            bar.close()
+
+
+def set_au_progress(progress: AUProgress | None) -> None:
+    """
+    Sets the `AUProgress` every season-level function sends progress events to.
+    Progress events are off by default.
+
+    Parameters
+    ----------
+    `progress` (AUProgress, mandatory):
+        The progress hooks to use, like `AUTqdmProgress()`.
+        If set to `None`, progress events are turned off.
+    """
+    global _au_progress
+
+    _au_progress = progress
+
+
+def get_au_progress() -> AUProgress | None:
+    """
+    Returns the `AUProgress` set with `set_au_progress()`,
+    or `None` if progress events are off.
+    """
+    return _au_progress
+
+
+def _au_track_game(get_game, progress: AUProgress, sport: str, season: int):
+    """
+    Wraps the `get_game()` function of a season-level function,
+    so that `progress` is told when each game starts, is parsed, or fails.
+    """
+    def tracked_get_game(game):
+        progress.game_started(sport, season, game)
+
+        try:
+            result = get_game(game)
+        except Exception as e:
+            progress.game_failed(sport, season, game, e)
+            raise
+
+        progress.game_parsed(sport, season, game)
+        return result
+
+    return tracked_get_game
+
+
+def _au_game_fetched(sport: str, season: int, game: int) -> None:
+    """
+    Sends a `game_fetched` event, if progress events are on.
+    """
+    if _au_progress is not None:
+        _au_progress.game_fetched(sport, season, game)
+
+
+def _au_season_empty(sport: str, season: int, dataset: str) -> None:
+    """
+    Sends a `season_empty` event, if progress events are on.
+    """
+    if _au_progress is not None:
+        _au_progress.season_empty(sport, season, dataset)
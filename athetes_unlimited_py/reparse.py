@@ -0,0 +1,303 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pyarrow as pa
+
+from athetes_unlimited_py.cache import get_au_cache_dir
+from athetes_unlimited_py.decode import au_json_loads
+from athetes_unlimited_py.schemas import (
+    _AU_PANDAS_TYPES,
+    _au_frame_to_arrow,
+    get_au_schema,
+)
+from athetes_unlimited_py.season import (
+    AU_SEASON_SPORTS,
+    _au_api_sport,
+    get_au_season_id,
+    get_au_season_ids,
+    register_au_season,
+)
+from athetes_unlimited_py.sync import AU_SYNC_DATASETS, _au_sync_game_parser
+from athetes_unlimited_py.utils import _au_check_output
+
+##############################################################################
+##
+# Process-pool reparsing
+##
+##############################################################################
+
+
+def _au_reparse_files(root: str, sport: str, season_id: int, dataset: str) -> list:
+    """
+    Returns every raw payload of one dataset of a season found in `root`
+    (a payload folder or the cache folder), in game order.
+    """
+    endpoint = AU_SYNC_DATASETS[dataset][0]
+    folder = os.path.join(root, _au_api_sport(sport), endpoint, str(season_id))
+
+    if not os.path.isdir(folder):
+        return []
+
+    games = sorted(
+        int(f[:-len(".json")]) for f in os.listdir(folder)
+        if f.endswith(".json") and f[:-len(".json")].isdigit())
+
+    return [os.path.join(folder, f"{game}.json") for game in games]
+
+
+def _au_table_to_ipc(table: pa.Table) -> bytes:
+    """
+    Serializes a `pyarrow.Table` in the Arrow IPC stream format.
+    """
+    sink = pa.BufferOutputStream()
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def _au_table_from_ipc(buffer: bytes) -> pa.Table:
+    """
+    Reads a `pyarrow.Table` serialized by `_au_table_to_ipc()`,
+    without copying its data.
+    """
+    return pa.ipc.open_stream(pa.py_buffer(buffer)).read_all()
+
+
+def _au_reparse_game(
+        sport: str,
+        season: int,
+        season_id: int,
+        dataset: str,
+        path: str,
+        is_cached: bool) -> tuple:
+    """
+    Parses the raw payload of one game, in a worker process.
+
+    Returns a tuple with every DataFrame of `dataset`
+    as an Arrow IPC buffer, with the schema of its sport and dataset,
+    which is much cheaper to send back than a pickled DataFrame.
+    """
+    # The worker may not know about seasons the parent process found in the catalog.
+    if get_au_season_ids(sport).get(season) != season_id:
+        register_au_season(sport, season, season_id)
+
+    with open(path, "rb") as f:
+        json_data = au_json_loads(f.read())
+
+    if is_cached == True:
+        json_data = json_data["data"]
+
+    game = int(os.path.basename(path)[:-len(".json")])
+    parse_game = _au_sync_game_parser(sport, season, season_id, dataset)
+
+    return tuple(
+        _au_table_to_ipc(
+            _au_frame_to_arrow(df, get_au_schema(sport, name), consume=True))
+        for df, name in zip(parse_game(json_data, game), AU_SYNC_DATASETS[dataset][1])
+    )
+
+
+def _au_concat_tables(tables: list) -> pa.Table:
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def _au_reparse_output(table: pa.Table, output: str):
+    """
+    Converts a reparsed season to the format set by `output`.
+    """
+    if output == "arrow":
+        return table
+    elif output == "compact":
+        return table.to_pandas(types_mapper=_AU_PANDAS_TYPES.get)
+
+    # Categorical columns are only used with `output="compact"`.
+    return table.cast(pa.schema([
+        field.with_type(field.type.value_type)
+        if pa.types.is_dictionary(field.type) else field
+        for field in table.schema
+    ], metadata=table.schema.metadata)).to_pandas()
+
+
+def _au_reparse_season(
+        sport: str,
+        season: int,
+        dataset: str,
+        payload_dir: str = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        output: str = "arrow") -> tuple:
+    """
+    Reparses one dataset of a season.
+    Shared by `reparse_au_season_box()` and `reparse_au_season_pbp()`.
+    """
+    _au_check_output(output)
+
+    if sport not in AU_SEASON_SPORTS:
+        raise ValueError(
+            f'`sport` must be one of {AU_SEASON_SPORTS}, not `{sport}`.')
+
+    if payload_dir is not None:
+        root = os.path.abspath(os.path.expanduser(payload_dir))
+        is_cached = False
+    elif get_au_cache_dir() is not None:
+        root = get_au_cache_dir()
+        is_cached = True
+    else:
+        raise ValueError(
+            '`payload_dir` must be set if the on-disk cache is turned off '
+            '(see `configure_au_cache()`).')
+
+    if max_workers is not None and max_workers < 1:
+        raise ValueError('`max_workers` cannot be less than 1.')
+
+    season_id = get_au_season_id(sport, season)
+    paths = _au_reparse_files(root, sport, season_id, dataset)
+    names = AU_SYNC_DATASETS[dataset][1]
+
+    if len(paths) == 0:
+        return tuple(
+            _au_reparse_output(get_au_schema(sport, name).empty_table(), output)
+            for name in names
+        )
+
+    if executor is None:
+        max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        max_workers = os.cpu_count() or 1
+        pool = executor
+
+    try:
+        # Games are sent to workers in batches,
+        # so that small games don't cost one round trip each.
+        game_buffers = list(pool.map(
+            _au_reparse_game,
+            [sport] * len(paths),
+            [season] * len(paths),
+            [season_id] * len(paths),
+            [dataset] * len(paths),
+            paths,
+            [is_cached] * len(paths),
+            chunksize=max(1, len(paths) // (4 * max_workers))
+        ))
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+    return tuple(
+        _au_reparse_output(
+            _au_concat_tables([_au_table_from_ipc(b[k]) for b in game_buffers]),
+            output)
+        for k in range(len(names))
+    )
+
+
+def reparse_au_season_box(
+        sport: str,
+        season: int,
+        payload_dir: str = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        output: str = "arrow") -> tuple:
+    """
+    Parses the raw box score payloads of a season again,
+    without downloading anything (e.g. after a schema or parser change).
+
+    Games are parsed by a pool of processes, so parsing scales with the number of cores,
+    with the same parsers as `get_au_*_game_stats()` and `get_au_*_season_box()`.
+    Every worker sends its games back as Arrow IPC buffers (with the schema of
+    the sport, see `get_au_schema()`) instead of pickled DataFrames,
+    and they are combined without copying them again.
+
+    Raw payloads are read from a folder of recorded payloads
+    (see `configure_au_replay()`), or from the on-disk cache
+    (see `configure_au_cache()`). Only games found there are parsed.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season you want box scores from.
+
+    `payload_dir` (str, optional) = None:
+        The folder recorded payloads are read from.
+        If not set, payloads are read from the on-disk cache.
+
+    `max_workers` (int, optional) = None:
+        The number of processes games are parsed by.
+        If not set, one process is used for every core.
+        Not used if `executor` is set.
+
+    `executor` (concurrent.futures.Executor, optional) = None:
+        If set, games are parsed by this executor (e.g. a `ProcessPoolExecutor`
+        shared by every season being reparsed), which is not shut down.
+
+    `output` (str, optional) = "arrow":
+        The format the data is returned in.
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are returned.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are returned
+        (see `au_to_compact()`).
+        If set to `"pandas"`, pandas DataFrames are returned,
+        with the types pyarrow converts the schema of this sport to.
+
+    Returns
+    ----------
+    A tuple containing two `pyarrow.Table`s (or two pandas DataFrames).
+    The first contains player box score stats, and the second contains team box score stats from the season.
+    """
+    return _au_reparse_season(
+        sport, season, "box", payload_dir=payload_dir,
+        max_workers=max_workers, executor=executor, output=output)
+
+
+def reparse_au_season_pbp(
+        sport: str,
+        season: int,
+        payload_dir: str = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        output: str = "arrow"):
+    """
+    Same as `reparse_au_season_box()`, but for the play-by-play (PBP) data of a season,
+    with the same parsers as `get_au_*_pbp()` and `get_au_*_season_pbp()`.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season you want PBP data from.
+
+    `payload_dir` (str, optional) = None:
+        The folder recorded payloads are read from.
+        If not set, payloads are read from the on-disk cache.
+
+    `max_workers` (int, optional) = None:
+        The number of processes games are parsed by.
+        If not set, one process is used for every core.
+
+    `executor` (concurrent.futures.Executor, optional) = None:
+        If set, games are parsed by this executor, which is not shut down.
+
+    `output` (str, optional) = "arrow":
+        The format the data is returned in (`"arrow"`, `"compact"` or `"pandas"`).
+
+    Returns
+    ----------
+    A `pyarrow.Table` (or a pandas DataFrame) containing PBP data from the season.
+    """
+    season_pbp, = _au_reparse_season(
+        sport, season, "pbp", payload_dir=payload_dir,
+        max_workers=max_workers, executor=executor, output=output)
+    return season_pbp
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+
+from athetes_unlimited_py.decode import au_json_loads
+from athetes_unlimited_py.utils import _au_parse_request
+
+##############################################################################
+##
+# Record/replay
+##
+##############################################################################
+
+AU_REPLAY_MODES = ("record", "replay")
+
+_au_replay_settings = {
+    "payload_dir": None,
+    "mode": None,
+}
+_au_replay_lock = threading.Lock()
+
+
+def configure_au_replay(
+        payload_dir: str = None,
+        mode: str = "replay",
+        enabled: bool = True) -> None:
+    """
+    Turns on (or off) record/replay of API responses.
+    Record/replay is off by default.
+
+    In `"record"` mode, the JSON of every response (`seasons`, `by-game`
+    and `play-by-play`) is saved to `payload_dir` as it is downloaded.
+    In `"replay"` mode, responses are read from `payload_dir`,
+    and nothing is downloaded. A `FileNotFoundError` is raised
+    for responses that were never recorded.
+
+    Recorded payloads can also be served over HTTP
+    by an `AUStandInServer` (see `athetes_unlimited_py.server`).
+
+    Payloads are stored as:
+
+        <payload_dir>/<sport>/seasons.json
+        <payload_dir>/<sport>/by-game/<season_id>/<game_num>.json
+        <payload_dir>/<sport>/play-by-play/<season_id>/<game_id>.json
+
+    Parameters
+    ----------
+    `payload_dir` (str, optional) = None:
+        The folder payloads are saved to, or read from.
+        Mandatory if `enabled` is set to `True`
+        and record/replay has not been configured before.
+
+    `mode` (str, optional) = "replay":
+        Either `"record"` or `"replay"`.
+
+    `enabled` (bool, optional) = True:
+        If set to `False`, record/replay is turned off.
+        Recorded payloads are not deleted.
+    """
+    with _au_replay_lock:
+        if enabled == False:
+            _au_replay_settings["mode"] = None
+            return
+
+        if mode not in AU_REPLAY_MODES:
+            raise ValueError(
+                f'`mode` must be one of {AU_REPLAY_MODES}, not `{mode}`.')
+
+        if payload_dir is not None:
+            _au_replay_settings["payload_dir"] = os.path.abspath(
+                os.path.expanduser(payload_dir))
+        elif _au_replay_settings["payload_dir"] is None:
+            raise ValueError(
+                '`payload_dir` must be set to turn on record/replay.')
+
+        _au_replay_settings["mode"] = mode
+
+
+def get_au_replay_mode() -> str | None:
+    """
+    Returns `"record"` or `"replay"`, or `None` if record/replay is off.
+    """
+    return _au_replay_settings["mode"]
+
+
+def au_payload_path(
+        payload_dir: str,
+        sport: str,
+        endpoint: str,
+        season_id: int = None,
+        game: int = None) -> str:
+    """
+    Returns the file a recorded payload is stored in.
+
+    Parameters
+    ----------
+    `payload_dir` (str, mandatory):
+        The folder recorded payloads are stored in.
+
+    `sport` (str, mandatory):
+        The sport used by the API (`basketball`, `lacrosse`, `softball` or `volleyball`).
+
+    `endpoint` (str, mandatory):
+        `seasons`, `by-game` or `play-by-play`.
+
+    `season_id` (int, optional) = None:
+        The season ID of the game. Not used for `seasons`.
+
+    `game` (int, optional) = None:
+        The game number (`by-game`) or game ID (`play-by-play`) of the game.
+        Not used for `seasons`.
+
+    Returns
+    ----------
+    The path of the file.
+    """
+    if endpoint == "seasons":
+        return os.path.join(payload_dir, str(sport), "seasons.json")
+
+    return os.path.join(
+        payload_dir,
+        str(sport),
+        str(endpoint),
+        str(season_id),
+        f"{game}.json"
+    )
+
+
+def _au_request_payload_path(request: str) -> str | None:
+    """
+    Returns the file the payload of an API path is recorded in,
+    or `None` if `request` isn't an API path that can be recorded.
+    """
+    parsed = _au_parse_request(request)
+
+    if parsed is None:
+        return None
+
+    return au_payload_path(
+        _au_replay_settings["payload_dir"],
+        parsed["sport"],
+        parsed["endpoint"],
+        parsed["season_id"],
+        parsed["game"]
+    )
+
+
+def _read_au_replay(request: str) -> dict:
+    """
+    Returns the recorded payload of an API path.
+    """
+    path = _au_request_payload_path(request)
+
+    if path is None or not os.path.exists(path):
+        raise FileNotFoundError(
+            f'No recorded payload was found for `{request}` (expected `{path}`).')
+
+    with open(path, "rb") as f:
+        return au_json_loads(f.read())
+
+
+def _write_au_replay(request: str, json_data: dict) -> None:
+    """
+    Saves the payload of an API path, if it can be recorded.
+    """
+    path = _au_request_payload_path(request)
+
+    if path is None:
+        return
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first, so that other threads/processes
+    # never read a half-written file.
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(json_data, f)
+    os.replace(temp_path, path)
@@ -0,0 +1,1385 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from athetes_unlimited_py.utils import AU_OUTPUTS
+
+##############################################################################
+##
+# Column types
+##
+##############################################################################
+
+# Every season-level and game-level DataFrame is described by an explicit Arrow schema,
+# so that the same column always has the same (compact) type,
+# regardless of which games or seasons are in the data.
+_AU_ID = pa.int32()
+_AU_COUNT = pa.int32()
+_AU_SMALL_INT = pa.int16()
+_AU_RATE = pa.float32()
+_AU_INNINGS = pa.float64()
+_AU_FLAG = pa.bool_()
+_AU_CODE = pa.dictionary(pa.int32(), pa.string())
+_AU_TEXT = pa.string()
+
+# The values the API uses for yes/no flags.
+_AU_FLAG_VALUES = {
+    True: True,
+    False: False,
+    "Y": True,
+    "N": False,
+    "y": True,
+    "n": False,
+    "true": True,
+    "false": False,
+    "True": True,
+    "False": False,
+    "1": True,
+    "0": False,
+}
+
+
+##############################################################################
+##
+# Basketball
+##
+##############################################################################
+
+_AU_BASKETBALL_PBP_SCHEMA = pa.schema([
+    ("season", _AU_SMALL_INT),
+    ("game_id", _AU_ID),
+    ("game_number", _AU_SMALL_INT),
+    ("play_seq_num", _AU_SMALL_INT),
+    ("narrative", _AU_TEXT),
+    ("home_team_id", _AU_ID),
+    ("home_team_score", _AU_SMALL_INT),
+    ("away_team_id", _AU_ID),
+    ("away_team_score", _AU_SMALL_INT),
+    ("is_a_play", _AU_FLAG),
+    ("generates_point_audit_flag", _AU_FLAG),
+    ("has_error", _AU_FLAG),
+    ("player_id", _AU_ID),
+    ("team_id", _AU_ID),
+    ("action", _AU_CODE),
+    ("type", _AU_CODE),
+    ("quarter", _AU_SMALL_INT),
+    ("clock", _AU_TEXT),
+    ("assist", _AU_FLAG),
+    ("steal", _AU_FLAG),
+    ("block", _AU_FLAG),
+    ("turnover", _AU_FLAG),
+    ("jumper", _AU_FLAG),
+    ("dunk", _AU_FLAG),
+    ("tip_in", _AU_FLAG),
+    ("timeout", _AU_FLAG),
+    ("in_the_paint", _AU_FLAG),
+    ("on_fast_break", _AU_FLAG),
+    ("missed_three_pointer", _AU_FLAG),
+    ("made_three_pointer", _AU_FLAG),
+    ("missed_two_pointer", _AU_FLAG),
+    ("made_two_pointer", _AU_FLAG),
+    ("missed_free_throw", _AU_FLAG),
+    ("made_free_throw", _AU_FLAG),
+    ("offensive_rebound", _AU_FLAG),
+    ("defensive_rebound", _AU_FLAG),
+    ("shooting_foul_committed", _AU_FLAG),
+    ("shooting_foul_drawn", _AU_FLAG),
+    ("shooting_foul_drawn_by_player_id", _AU_ID),
+    ("personal_foul_committed", _AU_FLAG),
+    ("personal_foul_drawn", _AU_FLAG),
+    ("personal_foul_drawn_by_player_id", _AU_ID),
+    ("offensive_foul_committed", _AU_FLAG),
+    ("offensive_foul_drawn", _AU_FLAG),
+    ("offensive_foul_drawn_by_player_id", _AU_ID),
+    ("other_foul_committed", _AU_FLAG),
+    ("other_foul_drawn", _AU_FLAG),
+    ("other_foul_drawn_by_player_id", _AU_ID),
+    ("scoring_play", _AU_FLAG),
+])
+
+
+_AU_BASKETBALL_BOX_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("type", _AU_CODE),
+    ("teamId", _AU_ID),
+    ("homeTeamFlg", _AU_FLAG),
+    ("season", _AU_SMALL_INT),
+    ("season_id", _AU_ID),
+    ("week_number", _AU_SMALL_INT),
+    ("game_number", _AU_SMALL_INT),
+    ("season_type", _AU_CODE),
+    ("player_id", _AU_ID),
+    ("uniform_number", _AU_SMALL_INT),
+    ("uniform_number_display", _AU_CODE),
+    ("primary_position_lk", _AU_CODE),
+    ("secondary_position_lk", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("MIN", _AU_COUNT),
+    ("FGM", _AU_COUNT),
+    ("FGA", _AU_COUNT),
+    ("FG%", _AU_RATE),
+    ("3PM", _AU_COUNT),
+    ("3PA", _AU_COUNT),
+    ("3P%", _AU_RATE),
+    ("2PM", _AU_COUNT),
+    ("2PA", _AU_COUNT),
+    ("2P%", _AU_RATE),
+    ("FTM", _AU_COUNT),
+    ("FTA", _AU_COUNT),
+    ("FT%", _AU_RATE),
+    ("ORB", _AU_COUNT),
+    ("DRB", _AU_COUNT),
+    ("TRB", _AU_COUNT),
+    ("AST", _AU_COUNT),
+    ("STL", _AU_COUNT),
+    ("BLK", _AU_COUNT),
+    ("TOV", _AU_COUNT),
+    ("PTS", _AU_COUNT),
+    ("AU_PTS", _AU_COUNT),
+    ("eFG%", _AU_RATE),
+    ("TS%", _AU_RATE),
+    ("shootingFoulsCommitted", _AU_COUNT),
+    ("shootingFoulsDrawn", _AU_COUNT),
+    ("personalFoulsCommitted", _AU_COUNT),
+    ("personalFoulsDrawn", _AU_COUNT),
+    ("offensiveFoulsCommitted", _AU_COUNT),
+    ("offensiveFoulsDrawn", _AU_COUNT),
+    ("doubleDoubles", _AU_COUNT),
+    ("tripleDoubles", _AU_COUNT),
+    ("GmSc", _AU_RATE),
+])
+
+
+_AU_BASKETBALL_PLAYER_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("season_id", _AU_ID),
+    ("player_id", _AU_ID),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("MIN", _AU_COUNT),
+    ("FGM", _AU_COUNT),
+    ("FGA", _AU_COUNT),
+    ("FG%", _AU_RATE),
+    ("3PM", _AU_COUNT),
+    ("3PA", _AU_COUNT),
+    ("3P%", _AU_RATE),
+    ("2PM", _AU_COUNT),
+    ("2PA", _AU_COUNT),
+    ("2P%", _AU_RATE),
+    ("FTM", _AU_COUNT),
+    ("FTA", _AU_COUNT),
+    ("FT%", _AU_RATE),
+    ("ORB", _AU_COUNT),
+    ("DRB", _AU_COUNT),
+    ("TRB", _AU_COUNT),
+    ("AST", _AU_COUNT),
+    ("STL", _AU_COUNT),
+    ("BLK", _AU_COUNT),
+    ("TOV", _AU_COUNT),
+    ("PTS", _AU_COUNT),
+    ("AU_PTS", _AU_COUNT),
+    ("eFG%", _AU_RATE),
+    ("shootingFoulsCommitted", _AU_COUNT),
+    ("shootingFoulsDrawn", _AU_COUNT),
+    ("personalFoulsCommitted", _AU_COUNT),
+    ("personalFoulsDrawn", _AU_COUNT),
+    ("offensiveFoulsCommitted", _AU_COUNT),
+    ("offensiveFoulsDrawn", _AU_COUNT),
+    ("doubleDoubles", _AU_COUNT),
+    ("tripleDoubles", _AU_COUNT),
+])
+
+
+_AU_BASKETBALL_TEAM_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("season_id", _AU_ID),
+    ("teamId", _AU_ID),
+    ("G", _AU_SMALL_INT),
+    ("FGM", _AU_COUNT),
+    ("FGA", _AU_COUNT),
+    ("FG%", _AU_RATE),
+    ("3PM", _AU_COUNT),
+    ("3PA", _AU_COUNT),
+    ("3P%", _AU_RATE),
+    ("2PM", _AU_COUNT),
+    ("2PA", _AU_COUNT),
+    ("2P%", _AU_RATE),
+    ("FTM", _AU_COUNT),
+    ("FTA", _AU_COUNT),
+    ("FT%", _AU_RATE),
+    ("ORB", _AU_COUNT),
+    ("DRB", _AU_COUNT),
+    ("TRB", _AU_COUNT),
+    ("AST", _AU_COUNT),
+    ("STL", _AU_COUNT),
+    ("BLK", _AU_COUNT),
+    ("TOV", _AU_COUNT),
+    ("PTS", _AU_COUNT),
+    ("AU_PTS", _AU_COUNT),
+    ("eFG%", _AU_RATE),
+    ("shootingFoulsCommitted", _AU_COUNT),
+    ("shootingFoulsDrawn", _AU_COUNT),
+    ("personalFoulsCommitted", _AU_COUNT),
+    ("personalFoulsDrawn", _AU_COUNT),
+    ("offensiveFoulsCommitted", _AU_COUNT),
+    ("offensiveFoulsDrawn", _AU_COUNT),
+    ("doubleDoubles", _AU_COUNT),
+    ("tripleDoubles", _AU_COUNT),
+])
+
+
+##############################################################################
+##
+# Lacrosse
+##
+##############################################################################
+
+_AU_LACROSSE_PBP_SCHEMA = pa.schema([
+    ("season", _AU_SMALL_INT),
+    ("game_id", _AU_ID),
+    ("game_number", _AU_SMALL_INT),
+    ("game_report_id", _AU_ID),
+    ("play_seq_num", _AU_SMALL_INT),
+    ("action", _AU_CODE),
+    ("play_desc", _AU_TEXT),
+    ("player_id", _AU_ID),
+    ("team_id", _AU_ID),
+    ("period", _AU_SMALL_INT),
+    ("clock", _AU_TEXT),
+    ("home_team_id", _AU_ID),
+    ("home_team_score", _AU_SMALL_INT),
+    ("is_a_play", _AU_FLAG),
+    ("narrative_formatted", _AU_TEXT),
+    ("has_error", _AU_FLAG),
+    ("goals", _AU_SMALL_INT),
+    ("assists", _AU_SMALL_INT),
+    ("shots", _AU_SMALL_INT),
+    ("shots_on_goal", _AU_SMALL_INT),
+    ("assist_player_id", _AU_ID),
+    ("good_clear", _AU_SMALL_INT),
+    ("failed_clear", _AU_SMALL_INT),
+    ("disruptor_player_id", _AU_ID),
+    ("gw_goals", _AU_SMALL_INT),
+    ("pp_goals", _AU_SMALL_INT),
+    ("sh_goals", _AU_SMALL_INT),
+    ("ua_goals", _AU_SMALL_INT),
+    ("ot_goals", _AU_SMALL_INT),
+    ("en_goals", _AU_SMALL_INT),
+    ("gt_goals", _AU_SMALL_INT),
+    ("fg_goals", _AU_SMALL_INT),
+    ("shootout_goals", _AU_SMALL_INT),
+    ("penalties", _AU_SMALL_INT),
+    ("shot_clock_violations", _AU_SMALL_INT),
+    ("rcs", _AU_SMALL_INT),
+    ("ycs", _AU_SMALL_INT),
+    ("mn_penalties", _AU_SMALL_INT),
+    ("mj_penalties", _AU_SMALL_INT),
+    ("match_penalties", _AU_SMALL_INT),
+    ("fouls", _AU_SMALL_INT),
+    ("face_won", _AU_SMALL_INT),
+    ("face_lost", _AU_SMALL_INT),
+    ("gbs", _AU_SMALL_INT),
+    ("dc", _AU_SMALL_INT),
+    ("ct", _AU_SMALL_INT),
+    ("turnovers", _AU_SMALL_INT),
+    ("caused_turnover_player_id", _AU_ID),
+    ("caused_turnover_team", _AU_ID),
+    ("d_save", _AU_SMALL_INT),
+    ("minutes", _AU_SMALL_INT),
+    ("seconds", _AU_SMALL_INT),
+    ("goalie_time", _AU_TEXT),
+    ("ga", _AU_SMALL_INT),
+    ("saves", _AU_SMALL_INT),
+    ("goalie_player_id", _AU_ID),
+    ("shots_faced", _AU_SMALL_INT),
+    ("scoring_play", _AU_FLAG),
+])
+
+
+_AU_LACROSSE_BOX_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("weekNumber", _AU_SMALL_INT),
+    ("gameNumber", _AU_SMALL_INT),
+    ("seasonType", _AU_CODE),
+    ("teamId", _AU_ID),
+    ("playerId", _AU_ID),
+    ("uniformNumber", _AU_SMALL_INT),
+    ("uniformNumberDisplay", _AU_CODE),
+    ("primaryPositionLk", _AU_CODE),
+    ("secondaryPositionLk", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("periodsPlayed", _AU_SMALL_INT),
+    ("goals", _AU_COUNT),
+    ("assists", _AU_COUNT),
+    ("points", _AU_COUNT),
+    ("shots", _AU_COUNT),
+    ("turnovers", _AU_COUNT),
+    ("causedTurnovers", _AU_COUNT),
+    ("groundballs", _AU_COUNT),
+    ("shotPct", _AU_RATE),
+    ("twoPointGoals", _AU_COUNT),
+    ("drawControls", _AU_COUNT),
+    ("sogPct", _AU_RATE),
+    ("shotsSaved", _AU_COUNT),
+    ("shotsOnGoal", _AU_COUNT),
+    ("yellowCards", _AU_COUNT),
+    ("redCards", _AU_COUNT),
+    ("shotClockViolationsCommitted", _AU_COUNT),
+    ("shotClockViolationsDrawn", _AU_COUNT),
+    ("auTotalPoints", _AU_COUNT),
+    ("goalie_gamesPlayed", _AU_COUNT),
+    ("goalie_gamesStarted", _AU_COUNT),
+    ("goalie_goalsAgainst", _AU_COUNT),
+    ("goalie_saves", _AU_COUNT),
+    ("goalie_savePct", _AU_RATE),
+    ("goalie_shotsFaced", _AU_COUNT),
+    ("goalie_shotClockViolationsCommitted", _AU_COUNT),
+    ("goalie_shotClockViolationsDrawn", _AU_COUNT),
+])
+
+
+_AU_LACROSSE_PLAYER_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("playerId", _AU_ID),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("periodsPlayed", _AU_SMALL_INT),
+    ("goals", _AU_COUNT),
+    ("assists", _AU_COUNT),
+    ("points", _AU_COUNT),
+    ("shots", _AU_COUNT),
+    ("turnovers", _AU_COUNT),
+    ("causedTurnovers", _AU_COUNT),
+    ("groundballs", _AU_COUNT),
+    ("twoPointGoals", _AU_COUNT),
+    ("drawControls", _AU_COUNT),
+    ("shotsSaved", _AU_COUNT),
+    ("shotsOnGoal", _AU_COUNT),
+    ("yellowCards", _AU_COUNT),
+    ("redCards", _AU_COUNT),
+    ("shotClockViolationsCommitted", _AU_COUNT),
+    ("shotClockViolationsDrawn", _AU_COUNT),
+    ("auTotalPoints", _AU_COUNT),
+    ("goalie_gamesPlayed", _AU_COUNT),
+    ("goalie_gamesStarted", _AU_COUNT),
+    ("goalie_goalsAgainst", _AU_COUNT),
+    ("goalie_saves", _AU_COUNT),
+    ("goalie_shotsFaced", _AU_COUNT),
+    ("goalie_shotClockViolationsCommitted", _AU_COUNT),
+    ("goalie_shotClockViolationsDrawn", _AU_COUNT),
+    ("shotPct", _AU_RATE),
+    ("sogPct", _AU_RATE),
+    ("goalie_savePct", _AU_RATE),
+])
+
+
+_AU_LACROSSE_TEAM_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("teamId", _AU_ID),
+    ("G", _AU_SMALL_INT),
+    ("periodsPlayed", _AU_SMALL_INT),
+    ("goals", _AU_COUNT),
+    ("assists", _AU_COUNT),
+    ("points", _AU_COUNT),
+    ("shots", _AU_COUNT),
+    ("turnovers", _AU_COUNT),
+    ("causedTurnovers", _AU_COUNT),
+    ("groundballs", _AU_COUNT),
+    ("twoPointGoals", _AU_COUNT),
+    ("drawControls", _AU_COUNT),
+    ("shotsSaved", _AU_COUNT),
+    ("shotsOnGoal", _AU_COUNT),
+    ("yellowCards", _AU_COUNT),
+    ("redCards", _AU_COUNT),
+    ("shotClockViolationsCommitted", _AU_COUNT),
+    ("shotClockViolationsDrawn", _AU_COUNT),
+    ("auTotalPoints", _AU_COUNT),
+    ("goalie_gamesPlayed", _AU_COUNT),
+    ("goalie_gamesStarted", _AU_COUNT),
+    ("goalie_goalsAgainst", _AU_COUNT),
+    ("goalie_saves", _AU_COUNT),
+    ("goalie_shotsFaced", _AU_COUNT),
+    ("goalie_shotClockViolationsCommitted", _AU_COUNT),
+    ("goalie_shotClockViolationsDrawn", _AU_COUNT),
+    ("shotPct", _AU_RATE),
+    ("sogPct", _AU_RATE),
+    ("goalie_savePct", _AU_RATE),
+])
+
+
+##############################################################################
+##
+# Volleyball
+##
+##############################################################################
+
+_AU_VOLLEYBALL_PBP_SCHEMA = pa.schema([
+    ("season", _AU_SMALL_INT),
+    ("game_id", _AU_ID),
+    ("game_number", _AU_SMALL_INT),
+    ("play_seq_num", _AU_SMALL_INT),
+    ("narrative_formatted", _AU_TEXT),
+    ("start_time", _AU_TEXT),
+    ("end_time", _AU_TEXT),
+    ("set_number", _AU_SMALL_INT),
+    ("set_status_lk", _AU_CODE),
+    ("rally_number", _AU_SMALL_INT),
+    ("play_code", _AU_CODE),
+    ("play_text", _AU_TEXT),
+    ("player_id", _AU_ID),
+    ("serve_ace", _AU_FLAG),
+    ("serve_error", _AU_FLAG),
+    ("serve_continue", _AU_FLAG),
+    ("attack_kill", _AU_FLAG),
+    ("attack_error", _AU_FLAG),
+    ("attack_continue", _AU_FLAG),
+    ("pass_good", _AU_FLAG),
+    ("pass_error", _AU_FLAG),
+    ("pass_continue", _AU_FLAG),
+    ("dig_dig", _AU_FLAG),
+    ("dig_continue", _AU_FLAG),
+    ("block_continue", _AU_FLAG),
+    ("block_stuff", _AU_FLAG),
+    ("set_assist", _AU_FLAG),
+    ("set_error", _AU_FLAG),
+    ("set_continue", _AU_FLAG),
+    ("home_team_id", _AU_ID),
+    ("home_team_score", _AU_SMALL_INT),
+    ("away_team_id", _AU_ID),
+    ("away_team_Score", _AU_SMALL_INT),
+    ("scoring_team_id", _AU_ID),
+])
+
+
+_AU_VOLLEYBALL_BOX_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("week_number", _AU_SMALL_INT),
+    ("game_number", _AU_SMALL_INT),
+    ("season_type", _AU_CODE),
+    ("playerId", _AU_ID),
+    ("uniformNumber", _AU_SMALL_INT),
+    ("uniformNumberDisplay", _AU_CODE),
+    ("primaryPositionLk", _AU_CODE),
+    ("secondaryPositionLk", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("player_id", _AU_ID),
+    ("uniform_number", _AU_SMALL_INT),
+    ("uniform_number_display", _AU_CODE),
+    ("primary_position_lk", _AU_CODE),
+    ("secondary_position_lk", _AU_CODE),
+    ("team_id", _AU_ID),
+    ("sets_played", _AU_SMALL_INT),
+    ("kills", _AU_COUNT),
+    ("kills_per_set", _AU_RATE),
+    ("attack_errors", _AU_COUNT),
+    ("attack_attempts", _AU_COUNT),
+    ("attack_percentage", _AU_RATE),
+    ("assists", _AU_COUNT),
+    ("assists_per_set", _AU_RATE),
+    ("setting_errors", _AU_COUNT),
+    ("service_errors", _AU_COUNT),
+    ("service_aces", _AU_COUNT),
+    ("service_aces_per_set", _AU_RATE),
+    ("total_reception_attempts", _AU_COUNT),
+    ("reception_errors", _AU_COUNT),
+    ("positive_reception_pct", _AU_RATE),
+    ("digs", _AU_COUNT),
+    ("digs_per_set", _AU_RATE),
+    ("blocks", _AU_COUNT),
+    ("blocks_per_set", _AU_RATE),
+    ("au_total_points", _AU_COUNT),
+])
+
+
+_AU_VOLLEYBALL_PLAYER_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("playerId", _AU_ID),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("sets_played", _AU_SMALL_INT),
+    ("kills", _AU_COUNT),
+    ("attack_errors", _AU_COUNT),
+    ("attack_attempts", _AU_COUNT),
+    ("assists", _AU_COUNT),
+    ("setting_errors", _AU_COUNT),
+    ("service_errors", _AU_COUNT),
+    ("service_aces", _AU_COUNT),
+    ("total_reception_attempts", _AU_COUNT),
+    ("reception_errors", _AU_COUNT),
+    ("digs", _AU_COUNT),
+    ("blocks", _AU_COUNT),
+    ("au_total_points", _AU_COUNT),
+    ("kills_per_set", _AU_RATE),
+    ("attack_percentage", _AU_RATE),
+    ("assists_per_set", _AU_RATE),
+    ("service_aces_per_set", _AU_RATE),
+    ("digs_per_set", _AU_RATE),
+    ("blocks_per_set", _AU_RATE),
+])
+
+
+_AU_VOLLEYBALL_TEAM_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("team_id", _AU_ID),
+    ("G", _AU_SMALL_INT),
+    ("sets_played", _AU_SMALL_INT),
+    ("kills", _AU_COUNT),
+    ("attack_errors", _AU_COUNT),
+    ("attack_attempts", _AU_COUNT),
+    ("assists", _AU_COUNT),
+    ("setting_errors", _AU_COUNT),
+    ("service_errors", _AU_COUNT),
+    ("service_aces", _AU_COUNT),
+    ("total_reception_attempts", _AU_COUNT),
+    ("reception_errors", _AU_COUNT),
+    ("digs", _AU_COUNT),
+    ("blocks", _AU_COUNT),
+    ("au_total_points", _AU_COUNT),
+    ("kills_per_set", _AU_RATE),
+    ("attack_percentage", _AU_RATE),
+    ("assists_per_set", _AU_RATE),
+    ("service_aces_per_set", _AU_RATE),
+    ("digs_per_set", _AU_RATE),
+    ("blocks_per_set", _AU_RATE),
+])
+
+
+##############################################################################
+##
+# Softball
+##
+##############################################################################
+
+_AU_SOFTBALL_PBP_SCHEMA = pa.schema([
+    ("season", _AU_SMALL_INT),
+    ("game_id", _AU_ID),
+    ("game_number", _AU_SMALL_INT),
+    ("play_seq_num", _AU_SMALL_INT),
+    ("narrative", _AU_TEXT),
+    ("home_team_id", _AU_ID),
+    ("home_team_score", _AU_SMALL_INT),
+    ("away_team_id", _AU_ID),
+    ("away_team_score", _AU_SMALL_INT),
+    ("offensive_team_id", _AU_ID),
+    ("offensive_team_score", _AU_SMALL_INT),
+    ("defensive_team_id", _AU_ID),
+    ("defensive_team_score", _AU_SMALL_INT),
+    ("inning", _AU_SMALL_INT),
+    ("top_bottom_flag", _AU_CODE),
+    ("outs", _AU_SMALL_INT),
+    ("winning_team_id", _AU_ID),
+    ("action", _AU_CODE),
+    ("hit_location", _AU_TEXT),
+    ("hit_location_description", _AU_TEXT),
+    ("batter_id", _AU_ID),
+    ("pitcher_id", _AU_ID),
+])
+
+
+_AU_SOFTBALL_PLAYER_BOX_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("weekNumber", _AU_SMALL_INT),
+    ("gameNumber", _AU_SMALL_INT),
+    ("seasonType", _AU_CODE),
+    ("playerId", _AU_ID),
+    ("uniformNumber", _AU_SMALL_INT),
+    ("uniformNumberDisplay", _AU_CODE),
+    ("primaryPositionLk", _AU_CODE),
+    ("secondaryPositionLk", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("batting_AB", _AU_COUNT),
+    ("batting_R", _AU_COUNT),
+    ("batting_H", _AU_COUNT),
+    ("batting_2B", _AU_COUNT),
+    ("batting_3B", _AU_COUNT),
+    ("batting_HR", _AU_COUNT),
+    ("batting_RBI", _AU_COUNT),
+    ("batting_BB", _AU_COUNT),
+    ("batting_HBP", _AU_COUNT),
+    ("batting_K", _AU_COUNT),
+    ("batting_SB", _AU_COUNT),
+    ("batting_SBA", _AU_COUNT),
+    ("batting_CS", _AU_COUNT),
+    ("batting_BA", _AU_RATE),
+    ("batting_OBP", _AU_RATE),
+    ("batting_SLG", _AU_RATE),
+    ("batting_TB", _AU_COUNT),
+    ("batting_SF", _AU_COUNT),
+    ("batting_SH", _AU_COUNT),
+    ("week", _AU_SMALL_INT),
+    ("game_num", _AU_SMALL_INT),
+    ("G", _AU_SMALL_INT),
+    ("GS", _AU_SMALL_INT),
+    ("pitching_W", _AU_COUNT),
+    ("pitching_L", _AU_COUNT),
+    ("pitching_ERA", _AU_RATE),
+    ("pitching_SHO", _AU_COUNT),
+    ("pitching_CG", _AU_COUNT),
+    ("pitching_SV", _AU_COUNT),
+    ("pitching_IP_str", _AU_TEXT),
+    ("pitching_IP", _AU_INNINGS),
+    ("pitching_OUTS", _AU_COUNT),
+    ("pitching_QS", _AU_COUNT),
+    ("pitching_H", _AU_COUNT),
+    ("pitching_R", _AU_COUNT),
+    ("pitching_ER", _AU_COUNT),
+    ("pitching_HR", _AU_COUNT),
+    ("pitching_BB", _AU_COUNT),
+    ("pitching_SO", _AU_COUNT),
+    ("pitching_HBP", _AU_COUNT),
+    ("pitching_WP", _AU_COUNT),
+    ("pitching_WHIP", _AU_RATE),
+    ("pitching_H9", _AU_RATE),
+    ("pitching_HR9", _AU_RATE),
+    ("pitching_BB9", _AU_RATE),
+    ("pitching_SO9", _AU_RATE),
+    ("pitching_SO/BB", _AU_RATE),
+    ("pitching_RA9", _AU_RATE),
+    ("pitching_PI", _AU_COUNT),
+    ("pitching_PI_balls", _AU_COUNT),
+    ("pitching_PI_strikes", _AU_COUNT),
+    ("pitcing_game_score", _AU_RATE),
+    ("AU_POINTS", _AU_COUNT),
+    ("fielding_position", _AU_CODE),
+    ("fielding_IP_str", _AU_TEXT),
+    ("fielding_IP", _AU_INNINGS),
+    ("fielding_OUTS", _AU_COUNT),
+    ("fielding_PO", _AU_COUNT),
+    ("fielding_A", _AU_COUNT),
+    ("fielding_E", _AU_COUNT),
+    ("fielding_DP", _AU_COUNT),
+    ("fielding_FLD%", _AU_RATE),
+    ("fielding_CS", _AU_COUNT),
+    ("fielding_CS%", _AU_RATE),
+    ("fielding_TC", _AU_COUNT),
+    ("fielding_CH", _AU_COUNT),
+    ("fielding_RF/9", _AU_RATE),
+    ("type", _AU_CODE),
+    ("teamId", _AU_ID),
+    ("homeTeamFlg", _AU_FLAG),
+    # Stored as a string, like `season_type` in every other sport,
+    # so that box scores of multiple sports can be read as one dataset.
+    ("season_type", _AU_CODE),
+    ("batting_PA", _AU_COUNT),
+])
+
+
+_AU_SOFTBALL_TEAM_BOX_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("weekNumber", _AU_SMALL_INT),
+    ("gameNumber", _AU_SMALL_INT),
+    ("seasonType", _AU_CODE),
+    ("playerId", _AU_ID),
+    ("uniformNumber", _AU_SMALL_INT),
+    ("uniformNumberDisplay", _AU_CODE),
+    ("primaryPositionLk", _AU_CODE),
+    ("secondaryPositionLk", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("week", _AU_SMALL_INT),
+    ("game_num", _AU_SMALL_INT),
+    # Stored as a string, like `season_type` in every other sport,
+    # so that box scores of multiple sports can be read as one dataset.
+    ("season_type", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("GS", _AU_SMALL_INT),
+    ("batting_PA", _AU_COUNT),
+    ("batting_AB", _AU_COUNT),
+    ("batting_R", _AU_COUNT),
+    ("batting_H", _AU_COUNT),
+    ("batting_2B", _AU_COUNT),
+    ("batting_3B", _AU_COUNT),
+    ("batting_HR", _AU_COUNT),
+    ("batting_RBI", _AU_COUNT),
+    ("batting_BB", _AU_COUNT),
+    ("batting_HBP", _AU_COUNT),
+    ("batting_K", _AU_COUNT),
+    ("batting_SB", _AU_COUNT),
+    ("batting_SBA", _AU_COUNT),
+    ("batting_CS", _AU_COUNT),
+    ("batting_BA", _AU_RATE),
+    ("batting_OBP", _AU_RATE),
+    ("batting_SLG", _AU_RATE),
+    ("batting_TB", _AU_COUNT),
+    ("batting_SF", _AU_COUNT),
+    ("batting_SH", _AU_COUNT),
+    ("AU_POINTS", _AU_COUNT),
+    ("pitching_H", _AU_COUNT),
+    ("pitching_R", _AU_COUNT),
+    ("pitching_ER", _AU_COUNT),
+    ("pitching_HR", _AU_COUNT),
+    ("pitching_BB", _AU_COUNT),
+    ("pitching_SO", _AU_COUNT),
+    ("pitching_HBP", _AU_COUNT),
+    ("pitching_WP", _AU_COUNT),
+    ("pitching_WHIP", _AU_RATE),
+    ("pitching_H9", _AU_RATE),
+    ("pitching_HR9", _AU_RATE),
+    ("pitching_BB9", _AU_RATE),
+    ("pitching_SO9", _AU_RATE),
+    ("pitching_SO/BB", _AU_RATE),
+    ("pitching_RA9", _AU_RATE),
+    ("pitching_PI", _AU_COUNT),
+    ("pitching_PI_balls", _AU_COUNT),
+    ("pitching_PI_strikes", _AU_COUNT),
+    ("fielding_position", _AU_CODE),
+    ("fielding_IP_str", _AU_TEXT),
+    ("fielding_IP", _AU_INNINGS),
+    ("fielding_OUTS", _AU_COUNT),
+    ("fielding_PO", _AU_COUNT),
+    ("fielding_A", _AU_COUNT),
+    ("fielding_E", _AU_COUNT),
+    ("fielding_DP", _AU_COUNT),
+    ("fielding_FLD%", _AU_RATE),
+    ("fielding_CS", _AU_COUNT),
+    ("fielding_CS%", _AU_RATE),
+    ("fielding_TC", _AU_COUNT),
+    ("fielding_CH", _AU_COUNT),
+    ("fielding_RF/9", _AU_RATE),
+    ("type", _AU_CODE),
+    ("teamId", _AU_ID),
+    ("homeTeamFlg", _AU_FLAG),
+])
+
+
+_AU_SOFTBALL_PLAYER_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("playerId", _AU_ID),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("full_name", _AU_CODE),
+    ("G", _AU_SMALL_INT),
+    ("GS", _AU_SMALL_INT),
+    ("AU_POINTS", _AU_COUNT),
+    ("batting_PA", _AU_COUNT),
+    ("batting_AB", _AU_COUNT),
+    ("batting_R", _AU_COUNT),
+    ("batting_H", _AU_COUNT),
+    ("batting_2B", _AU_COUNT),
+    ("batting_3B", _AU_COUNT),
+    ("batting_HR", _AU_COUNT),
+    ("batting_RBI", _AU_COUNT),
+    ("batting_BB", _AU_COUNT),
+    ("batting_HBP", _AU_COUNT),
+    ("batting_K", _AU_COUNT),
+    ("batting_SB", _AU_COUNT),
+    ("batting_SBA", _AU_COUNT),
+    ("batting_CS", _AU_COUNT),
+    ("batting_TB", _AU_COUNT),
+    ("batting_SF", _AU_COUNT),
+    ("batting_SH", _AU_COUNT),
+    ("pitching_W", _AU_COUNT),
+    ("pitching_L", _AU_COUNT),
+    ("pitching_SHO", _AU_COUNT),
+    ("pitching_CG", _AU_COUNT),
+    ("pitching_QS", _AU_COUNT),
+    ("pitching_SV", _AU_COUNT),
+    ("pitching_IP_str", _AU_TEXT),
+    ("pitching_IP", _AU_INNINGS),
+    ("pitching_OUTS", _AU_COUNT),
+    ("pitching_H", _AU_COUNT),
+    ("pitching_R", _AU_COUNT),
+    ("pitching_ER", _AU_COUNT),
+    ("pitching_HR", _AU_COUNT),
+    ("pitching_BB", _AU_COUNT),
+    ("pitching_SO", _AU_COUNT),
+    ("pitching_HBP", _AU_COUNT),
+    ("pitching_WP", _AU_COUNT),
+    ("pitching_PI", _AU_COUNT),
+    ("pitching_PI_balls", _AU_COUNT),
+    ("pitching_PI_strikes", _AU_COUNT),
+    ("fielding_IP_str", _AU_TEXT),
+    ("fielding_IP", _AU_INNINGS),
+    ("fielding_OUTS", _AU_COUNT),
+    ("fielding_PO", _AU_COUNT),
+    ("fielding_A", _AU_COUNT),
+    ("fielding_E", _AU_COUNT),
+    ("fielding_DP", _AU_COUNT),
+    ("fielding_CS", _AU_COUNT),
+    ("fielding_TC", _AU_COUNT),
+    ("batting_BA", _AU_RATE),
+    ("batting_OBP", _AU_RATE),
+    ("batting_SLG", _AU_RATE),
+    ("batting_OPS", _AU_RATE),
+    ("batting_OPS+", _AU_RATE),
+    ("batting_SecA", _AU_RATE),
+    ("batting_BB%", _AU_RATE),
+    ("batting_K%", _AU_RATE),
+    ("batting_ISO", _AU_RATE),
+    ("batting_BABIP", _AU_RATE),
+    ("batting_PSN", _AU_RATE),
+    ("pitching_ERA", _AU_RATE),
+    ("pitching_ERA+", _AU_RATE),
+    ("pitching_FIP", _AU_RATE),
+    ("pitching_FIP-", _AU_RATE),
+    ("pitching_WHIP", _AU_RATE),
+    ("pitching_H9", _AU_RATE),
+    ("pitching_HR9", _AU_RATE),
+    ("pitching_BB9", _AU_RATE),
+    ("pitching_SO9", _AU_RATE),
+    ("pitching_SO/BB", _AU_RATE),
+    ("pitching_RA9", _AU_RATE),
+    ("fielding_FLD%", _AU_RATE),
+    ("fielding_CH", _AU_COUNT),
+    ("fielding_RF/9", _AU_RATE),
+])
+
+
+_AU_SOFTBALL_TEAM_STATS_SCHEMA = pa.schema([
+    ("sport", _AU_CODE),
+    ("api_version", _AU_CODE),
+    ("season", _AU_SMALL_INT),
+    ("seasonId", _AU_ID),
+    ("teamId", _AU_ID),
+    ("G", _AU_SMALL_INT),
+    ("AU_POINTS", _AU_COUNT),
+    ("batting_PA", _AU_COUNT),
+    ("batting_AB", _AU_COUNT),
+    ("batting_R", _AU_COUNT),
+    ("batting_H", _AU_COUNT),
+    ("batting_2B", _AU_COUNT),
+    ("batting_3B", _AU_COUNT),
+    ("batting_HR", _AU_COUNT),
+    ("batting_RBI", _AU_COUNT),
+    ("batting_BB", _AU_COUNT),
+    ("batting_HBP", _AU_COUNT),
+    ("batting_K", _AU_COUNT),
+    ("batting_SB", _AU_COUNT),
+    ("batting_SBA", _AU_COUNT),
+    ("batting_CS", _AU_COUNT),
+    ("batting_TB", _AU_COUNT),
+    ("batting_SF", _AU_COUNT),
+    ("batting_SH", _AU_COUNT),
+    ("pitching_W", _AU_COUNT),
+    ("pitching_L", _AU_COUNT),
+    ("pitching_SHO", _AU_COUNT),
+    ("pitching_CG", _AU_COUNT),
+    ("pitching_QS", _AU_COUNT),
+    ("pitching_SV", _AU_COUNT),
+    ("pitching_IP_str", _AU_TEXT),
+    ("pitching_IP", _AU_INNINGS),
+    ("pitching_OUTS", _AU_COUNT),
+    ("pitching_H", _AU_COUNT),
+    ("pitching_R", _AU_COUNT),
+    ("pitching_ER", _AU_COUNT),
+    ("pitching_HR", _AU_COUNT),
+    ("pitching_BB", _AU_COUNT),
+    ("pitching_SO", _AU_COUNT),
+    ("pitching_HBP", _AU_COUNT),
+    ("pitching_WP", _AU_COUNT),
+    ("pitching_PI", _AU_COUNT),
+    ("pitching_PI_balls", _AU_COUNT),
+    ("pitching_PI_strikes", _AU_COUNT),
+    ("fielding_IP_str", _AU_TEXT),
+    ("fielding_IP", _AU_INNINGS),
+    ("fielding_OUTS", _AU_COUNT),
+    ("fielding_PO", _AU_COUNT),
+    ("fielding_A", _AU_COUNT),
+    ("fielding_E", _AU_COUNT),
+    ("fielding_DP", _AU_COUNT),
+    ("fielding_CS", _AU_COUNT),
+    ("fielding_TC", _AU_COUNT),
+    ("batting_BA", _AU_RATE),
+    ("batting_OBP", _AU_RATE),
+    ("batting_SLG", _AU_RATE),
+    ("batting_OPS", _AU_RATE),
+    ("batting_OPS+", _AU_RATE),
+    ("batting_SecA", _AU_RATE),
+    ("batting_BB%", _AU_RATE),
+    ("batting_K%", _AU_RATE),
+    ("batting_ISO", _AU_RATE),
+    ("batting_BABIP", _AU_RATE),
+    ("batting_PSN", _AU_RATE),
+    ("pitching_ERA", _AU_RATE),
+    ("pitching_ERA+", _AU_RATE),
+    ("pitching_FIP", _AU_RATE),
+    ("pitching_FIP-", _AU_RATE),
+    ("pitching_WHIP", _AU_RATE),
+    ("pitching_H9", _AU_RATE),
+    ("pitching_HR9", _AU_RATE),
+    ("pitching_BB9", _AU_RATE),
+    ("pitching_SO9", _AU_RATE),
+    ("pitching_SO/BB", _AU_RATE),
+    ("pitching_RA9", _AU_RATE),
+    ("fielding_FLD%", _AU_RATE),
+    ("fielding_CH", _AU_COUNT),
+    ("fielding_RF/9", _AU_RATE),
+])
+
+
+##############################################################################
+##
+# Rosters
+##
+##############################################################################
+
+# The participation data returned with `return_participation_data=True`
+# (see `au_parse_game_roster()`), which is the same for every sport.
+_AU_ROSTER_SCHEMA = pa.schema([
+    ("season", _AU_SMALL_INT),
+    ("game_id", _AU_ID),
+    ("competitor_id", _AU_ID),
+    ("competitor_color", _AU_CODE),
+    ("competitor_name", _AU_CODE),
+    ("player_id", _AU_ID),
+    ("captain_flag", _AU_FLAG),
+    ("display_name", _AU_CODE),
+    ("first_name", _AU_CODE),
+    ("last_name", _AU_CODE),
+    ("current_roster_status_description", _AU_CODE),
+    ("current_rosterStatus_comments", _AU_TEXT),
+    ("current_rosterStatus_transactionType", _AU_CODE),
+    ("current_rosterStatus_rosterStatusLk", _AU_CODE),
+    ("is_voting_flg", _AU_FLAG),
+    ("can_be_voted_for_flg", _AU_FLAG),
+    ("has_voted_flag", _AU_FLAG),
+    ("uniform_number", _AU_CODE),
+    ("is_nominated_flag", _AU_FLAG),
+    ("nominated_flag", _AU_FLAG),
+    ("player_url", _AU_TEXT),
+    ("image_url", _AU_TEXT),
+])
+
+
+##############################################################################
+##
+# Schema registry
+##
+##############################################################################
+
+AU_SCHEMAS = {
+    "basketball": {
+        "pbp": _AU_BASKETBALL_PBP_SCHEMA,
+        "player_box": _AU_BASKETBALL_BOX_SCHEMA,
+        "team_box": _AU_BASKETBALL_BOX_SCHEMA,
+        "box": _AU_BASKETBALL_BOX_SCHEMA,
+        "player_stats": _AU_BASKETBALL_PLAYER_STATS_SCHEMA,
+        "team_stats": _AU_BASKETBALL_TEAM_STATS_SCHEMA,
+    },
+    "lacrosse": {
+        "pbp": _AU_LACROSSE_PBP_SCHEMA,
+        "player_box": _AU_LACROSSE_BOX_SCHEMA,
+        "team_box": _AU_LACROSSE_BOX_SCHEMA,
+        "box": _AU_LACROSSE_BOX_SCHEMA,
+        "player_stats": _AU_LACROSSE_PLAYER_STATS_SCHEMA,
+        "team_stats": _AU_LACROSSE_TEAM_STATS_SCHEMA,
+    },
+    "volleyball": {
+        "pbp": _AU_VOLLEYBALL_PBP_SCHEMA,
+        "player_box": _AU_VOLLEYBALL_BOX_SCHEMA,
+        "team_box": _AU_VOLLEYBALL_BOX_SCHEMA,
+        "box": _AU_VOLLEYBALL_BOX_SCHEMA,
+        "player_stats": _AU_VOLLEYBALL_PLAYER_STATS_SCHEMA,
+        "team_stats": _AU_VOLLEYBALL_TEAM_STATS_SCHEMA,
+    },
+    "softball": {
+        "pbp": _AU_SOFTBALL_PBP_SCHEMA,
+        "player_box": _AU_SOFTBALL_PLAYER_BOX_SCHEMA,
+        "team_box": _AU_SOFTBALL_TEAM_BOX_SCHEMA,
+        # Player and team game stats in one DataFrame
+        # (`get_player_and_team_stats=True`).
+        "box": pa.schema(
+            list(_AU_SOFTBALL_PLAYER_BOX_SCHEMA) + [
+                field for field in _AU_SOFTBALL_TEAM_BOX_SCHEMA
+                if field.name not in _AU_SOFTBALL_PLAYER_BOX_SCHEMA.names
+            ]
+        ),
+        "player_stats": _AU_SOFTBALL_PLAYER_STATS_SCHEMA,
+        "team_stats": _AU_SOFTBALL_TEAM_STATS_SCHEMA,
+    },
+}
+for _au_sport_schemas in AU_SCHEMAS.values():
+    _au_sport_schemas["roster"] = _AU_ROSTER_SCHEMA
+del _au_sport_schemas
+
+# AUX softball uses the same API (and columns) as AU softball.
+AU_SCHEMAS["aux_softball"] = AU_SCHEMAS["softball"]
+
+
+def get_au_schema(sport: str, dataset: str) -> pa.Schema:
+    """
+    Returns the Arrow schema used for a season-level or game-level dataset.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the dataset (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `dataset` (str, mandatory):
+        The dataset (`pbp`, `player_box`, `team_box`,
+        `player_stats`, `team_stats`,
+        `box` (player and team game stats in one DataFrame) or `roster`).
+
+    Returns
+    ----------
+    A `pyarrow.Schema`. The sport and dataset are stored in the schema's metadata.
+    """
+    try:
+        schema = AU_SCHEMAS[sport][dataset]
+    except KeyError:
+        raise ValueError(
+            f'There is no schema for the `{dataset}` dataset of `{sport}`.')
+
+    return schema.with_metadata({"sport": sport, "dataset": dataset})
+
+
+##############################################################################
+##
+# Conversion
+##
+##############################################################################
+
+
+def _au_column_to_arrow(values: pd.Series, arrow_type: pa.DataType) -> pa.Array:
+    """
+    Converts one DataFrame column to an Arrow array of `arrow_type`.
+    Values that can't be read as `arrow_type` become nulls.
+    """
+    if pa.types.is_dictionary(arrow_type) or pa.types.is_string(arrow_type):
+        # Whole numbers stored as floats (because of missing values)
+        # are saved as "1", not "1.0".
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype("Int64")
+
+        array = pa.array(values.astype("string"), from_pandas=True)
+        array = array.cast(pa.string())
+
+        if pa.types.is_dictionary(arrow_type):
+            array = array.dictionary_encode()
+
+        return array
+
+    if pa.types.is_boolean(arrow_type):
+        if not pd.api.types.is_bool_dtype(values):
+            values = values.map(_AU_FLAG_VALUES)
+        return pa.array(values, type=arrow_type, from_pandas=True)
+
+    values = pd.to_numeric(values, errors="coerce")
+    return pa.array(values, from_pandas=True).cast(arrow_type)
+
+
+def _au_frame_to_arrow(df: pd.DataFrame, schema: pa.Schema, consume: bool = False) -> pa.Table:
+    """
+    Converts a DataFrame to a `pyarrow.Table` with `schema`,
+    one column at a time.
+
+    Columns in `schema` that are not in `df` are filled with nulls.
+    Columns in `df` that are not in `schema` are kept,
+    with the type Arrow infers for them.
+
+    If `consume` is set to `True`, each column is dropped from `df`
+    as soon as it is converted, so the DataFrame and the table
+    are never fully held in memory at the same time.
+    """
+    num_rows = len(df)
+    arrays = []
+    fields = []
+
+    for field in schema:
+        if field.name not in df.columns:
+            arrays.append(pa.nulls(num_rows, type=field.type))
+            fields.append(field)
+            continue
+
+        values = df.pop(field.name) if consume else df[field.name]
+
+        try:
+            arrays.append(_au_column_to_arrow(values, field.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f'Column `{field.name}` can\'t be stored as `{field.type}`: {e}')
+
+        fields.append(field)
+        del values
+
+    for column in [c for c in df.columns if c not in schema.names]:
+        values = df.pop(column) if consume else df[column]
+
+        try:
+            array = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array(values.astype("string"), from_pandas=True)
+
+        arrays.append(array)
+        fields.append(pa.field(str(column), array.type))
+        del values
+
+    return pa.Table.from_arrays(
+        arrays,
+        schema=pa.schema(fields, metadata=schema.metadata)
+    )
+
+
+def au_to_arrow(df: pd.DataFrame, sport: str, dataset: str) -> pa.Table:
+    """
+    Converts a season-level or game-level DataFrame to a `pyarrow.Table`,
+    using the schema of that sport and dataset.
+
+    Parameters
+    ----------
+    `df` (pandas.DataFrame, mandatory):
+        The DataFrame returned by one of the season-level or game-level functions.
+        `df` is not modified.
+
+    `sport` (str, mandatory):
+        The sport of `df` (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `dataset` (str, mandatory):
+        The dataset in `df` (`pbp`, `player_box`, `team_box`,
+        `player_stats`, `team_stats`,
+        `box` (player and team game stats in one DataFrame) or `roster`).
+
+    Returns
+    ----------
+    A `pyarrow.Table` with the schema returned by `get_au_schema(sport, dataset)`.
+    """
+    return _au_frame_to_arrow(df, get_au_schema(sport, dataset))
+
+
+# Arrow type -> the pandas type of a column with `output="compact"`.
+# Floats are kept as NumPy floats (missing values are NaN),
+# and dictionaries become categoricals.
+_AU_PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+    pa.string(): pd.StringDtype(),
+}
+
+
+def _au_pandas_dtype(arrow_type: pa.DataType):
+    """
+    Returns the pandas type of a column with `output="compact"`.
+    """
+    if pa.types.is_dictionary(arrow_type):
+        return pd.CategoricalDtype()
+    elif arrow_type in _AU_PANDAS_TYPES:
+        return _AU_PANDAS_TYPES[arrow_type]
+
+    return np.dtype(arrow_type.to_pandas_dtype())
+
+
+def get_au_dtypes(sport: str, dataset: str) -> dict:
+    """
+    Returns the pandas type of every column of a season-level or game-level dataset
+    with `output="compact"` (see `au_to_compact()`).
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `dataset` (str, mandatory):
+        The dataset (`pbp`, `player_box`, `team_box`,
+        `player_stats`, `team_stats`,
+        `box` (player and team game stats in one DataFrame) or `roster`).
+
+    Returns
+    ----------
+    A dict of `{column: dtype}`, derived from `get_au_schema(sport, dataset)`.
+    """
+    return {
+        field.name: _au_pandas_dtype(field.type)
+        for field in get_au_schema(sport, dataset)
+    }
+
+
+def _au_frame_to_compact(df: pd.DataFrame, schema: pa.Schema, consume: bool = False) -> pd.DataFrame:
+    """
+    Converts every column of `df` that is in `schema` to its compact pandas type
+    (see `_au_pandas_dtype()`), with the same rules as `_au_frame_to_arrow()`.
+    Columns that are not in `schema` are left as they are.
+
+    If `consume` is set to `True`, `df` is converted in place.
+    Otherwise, `df` is not modified.
+    """
+    if consume == False:
+        df = df.copy(deep=False)
+
+    for field in schema:
+        if field.name not in df.columns:
+            continue
+
+        try:
+            array = _au_column_to_arrow(df[field.name], field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f'Column `{field.name}` can\'t be stored as `{field.type}`: {e}')
+
+        values = array.to_pandas(types_mapper=_AU_PANDAS_TYPES.get)
+        values.index = df.index
+        df[field.name] = values
+
+    return df
+
+
+def au_to_compact(df: pd.DataFrame, sport: str, dataset: str) -> pd.DataFrame:
+    """
+    Converts a season-level or game-level DataFrame to compact pandas types,
+    using the schema of that sport and dataset.
+    This is what the season-level and game-level functions return with `output="compact"`.
+
+    Counts and IDs become nullable integers (`Int16`/`Int32`),
+    rates become `float32`, flags (like `homeTeamFlg`) become nullable booleans,
+    repeated strings (names, positions, `sport`, etc.) become categoricals,
+    which use a fraction of the memory of `object` and `float64` columns,
+    and other text (like play descriptions) becomes the nullable `string` type.
+
+    Parameters
+    ----------
+    `df` (pandas.DataFrame, mandatory):
+        The DataFrame returned by one of the season-level or game-level functions.
+        `df` is not modified.
+
+    `sport` (str, mandatory):
+        The sport of `df` (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `dataset` (str, mandatory):
+        The dataset in `df` (`pbp`, `player_box`, `team_box`,
+        `player_stats`, `team_stats`,
+        `box` (player and team game stats in one DataFrame) or `roster`).
+
+    Returns
+    ----------
+    A pandas DataFrame with the types returned by `get_au_dtypes(sport, dataset)`.
+    """
+    return _au_frame_to_compact(df, get_au_schema(sport, dataset))
+
+
+def _au_with_sport_column(table: pa.Table, sport: str) -> pa.Table:
+    """
+    Makes sure `table` has a `sport` column, filling it with `sport` if
+    the column is missing or empty.
+    """
+    sport_array = pa.DictionaryArray.from_arrays(
+        pa.array(np.zeros(table.num_rows, dtype=np.int32)),
+        pa.array([sport])
+    )
+    sport_field = pa.field("sport", _AU_CODE)
+
+    if "sport" not in table.column_names:
+        return table.append_column(sport_field, sport_array)
+
+    index = table.column_names.index("sport")
+    if table.column(index).null_count == table.num_rows:
+        return table.set_column(index, sport_field, sport_array)
+
+    return table
+
+
+def au_to_parquet(
+        data,
+        path: str,
+        partition_by: list = None,
+        sport: str = None,
+        dataset: str = None) -> None:
+    """
+    Saves season-level data as Parquet.
+
+    Parameters
+    ----------
+    `data` (pandas.DataFrame or pyarrow.Table, mandatory):
+        The data you want to save. Either a DataFrame returned by one of the
+        season-level functions, or a `pyarrow.Table` returned by one
+        of those functions with `output="arrow"`.
+
+    `path` (str, mandatory):
+        The folder the Parquet dataset is written to.
+        If `partition_by` is empty, this is the Parquet file that is written.
+
+    `partition_by` (list, optional) = None:
+        The columns the dataset is partitioned (split into folders) by.
+        Defaults to `["sport", "season"]`.
+        Partitions that are written again replace the existing files in them.
+
+    `sport` (str, optional) = None:
+        The sport of `data`. Mandatory if `data` is a pandas DataFrame.
+
+    `dataset` (str, optional) = None:
+        The dataset in `data` (`pbp`, `player_box`, `team_box`,
+        `player_stats`, `team_stats`,
+        `box` (player and team game stats in one DataFrame) or `roster`).
+        Mandatory if `data` is a pandas DataFrame.
+    """
+    import pyarrow.parquet as pq
+
+    if partition_by is None:
+        partition_by = ["sport", "season"]
+
+    if isinstance(data, pd.DataFrame):
+        if sport is None or dataset is None:
+            raise ValueError(
+                '`sport` and `dataset` must be set when `data` is a pandas DataFrame.')
+        data = au_to_arrow(data, sport, dataset)
+
+    if sport is None and data.schema.metadata is not None:
+        sport = data.schema.metadata.get(b"sport", b"").decode() or None
+
+    if "sport" in partition_by and sport is not None:
+        data = _au_with_sport_column(data, sport)
+
+    missing_columns = [c for c in partition_by if c not in data.column_names]
+    if len(missing_columns) > 0:
+        raise ValueError(
+            f'Can\'t partition by {missing_columns}, because those columns are not in `data`.')
+
+    if len(partition_by) == 0:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        pq.write_table(data, path)
+        return
+
+    pq.write_to_dataset(
+        data,
+        root_path=path,
+        partition_cols=list(partition_by),
+        existing_data_behavior="delete_matching"
+    )
@@ -0,0 +1,593 @@
+import importlib
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from athetes_unlimited_py.cache import _au_cache_settings, _au_season_is_over
+from athetes_unlimited_py.client import get_au_season_catalog
+from athetes_unlimited_py.metrics import _au_measure
+
+##############################################################################
+##
+# Season datasets
+##
+##############################################################################
+
+AU_SEASON_SPORTS = (
+    "basketball",
+    "lacrosse",
+    "softball",
+    "aux_softball",
+    "volleyball",
+)
+
+# Sports whose season team stats are calculated from the player box scores,
+# instead of the team box scores.
+_AU_TEAM_STATS_FROM_PLAYER_BOX = (
+    "basketball",
+    "softball",
+    "aux_softball",
+)
+
+
+class AUSeason:
+    """
+    The data of one Athletes Unlimited (AU) season,
+    downloaded the first time it is used, and kept in memory after that.
+
+    Box scores are downloaded once for both `player_box` and `team_box`,
+    and `player_stats` and `team_stats` are calculated from them,
+    so each game of the season is only downloaded once.
+    PBP data is only downloaded if `pbp` is used.
+
+    The data is downloaded again the next time it is used if the season's games
+    in the seasons catalog have changed (the catalog is kept in memory for
+    `catalog_ttl` seconds, see `configure_au_client()`), or if the season
+    wasn't over when its data was downloaded, and that was more than
+    `in_progress_ttl` seconds ago (see `configure_au_cache()`).
+    During a live season, the catalog lists games before they are played,
+    so their results are only found by downloading them again.
+    If the on-disk cache is on, finished games are read from it.
+    Call `refresh()` to download everything again.
+
+    Every `AUSeason` keeps its own data, and its memory is freed with it.
+    `get_au_season()` returns an `AUSeason` shared by every caller.
+
+    DataFrames returned by an `AUSeason` are shared by every use of it,
+    and should be copied (with `.copy()`) before they are modified.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of this season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+    """
+
+    def __init__(self, sport: str, season: int, max_workers: int = 1):
+        if sport not in AU_SEASON_SPORTS:
+            raise ValueError(
+                f'`sport` must be one of {AU_SEASON_SPORTS}, not `{sport}`.')
+
+        self.sport = sport
+        self.season = season
+        self.max_workers = max_workers
+
+        self._lock = threading.RLock()
+        self._data = {}
+        self._game_ids = None
+        self._loaded_at = None
+        self._was_over = False
+
+    def __repr__(self) -> str:
+        return f"AUSeason(sport={self.sport!r}, season={self.season!r})"
+
+    def _get_function(self, kind: str):
+        """
+        Returns one of the functions of this season's sport module.
+        The module is imported here, since every sport module imports this one.
+        """
+        module = importlib.import_module(f"athetes_unlimited_py.{self.sport}")
+
+        if self.sport == "aux_softball":
+            prefix = "aux_softball"
+        else:
+            prefix = f"au_{self.sport}"
+
+        if kind.endswith("_from_box"):
+            return getattr(module, f"_{prefix}_{kind}")
+
+        return getattr(module, f"get_{prefix}_{kind}")
+
+    def _get_game_ids(self) -> tuple:
+        """
+        Returns the game IDs this season has in the seasons catalog.
+        """
+        season_id = get_au_season_id(self.sport, self.season)
+        catalog = get_au_season_catalog(_au_api_sport(self.sport))
+
+        for i in catalog['data']:
+            if i['seasonId'] == season_id:
+                return tuple(i['gameIds'])
+
+        return ()
+
+    def _is_stale(self, game_ids: tuple) -> bool:
+        """
+        Returns `True` if the data of this season has to be downloaded again.
+        """
+        if game_ids != self._game_ids:
+            return True
+
+        if self._loaded_at is None or self._was_over == True:
+            return False
+
+        return time.time() - self._loaded_at >= _au_cache_settings["in_progress_ttl"]
+
+    def _get(self, key: str, load):
+        """
+        Returns the data saved under `key`, loading it with `load()` first
+        if it hasn't been loaded yet, or if it's stale (see `_is_stale()`).
+        """
+        with self._lock:
+            game_ids = self._get_game_ids()
+
+            if self._is_stale(game_ids):
+                self._data.clear()
+                self._game_ids = game_ids
+                self._loaded_at = None
+
+            if key not in self._data:
+                if self._loaded_at is None:
+                    self._loaded_at = time.time()
+                    self._was_over = _au_season_is_over(
+                        _au_api_sport(self.sport),
+                        get_au_season_id(self.sport, self.season))
+
+                self._data[key] = load()
+
+            return self._data[key]
+
+    def _load_box(self) -> tuple:
+        return self._get_function("season_box")(
+            self.season, max_workers=self.max_workers)
+
+    def _load_player_stats(self) -> pd.DataFrame:
+        return _au_measure(
+            "aggregate", self.sport, "player_stats", self.season,
+            self._get_function("season_player_stats_from_box"),
+            self.player_box.copy(), self.season)
+
+    def _load_team_stats(self) -> pd.DataFrame:
+        if self.sport in _AU_TEAM_STATS_FROM_PLAYER_BOX:
+            game_stats_df = self.player_box
+        else:
+            game_stats_df = self.team_box
+
+        return _au_measure(
+            "aggregate", self.sport, "team_stats", self.season,
+            self._get_function("season_team_stats_from_box"),
+            game_stats_df.copy(), self.season)
+
+    def _load_pbp(self) -> pd.DataFrame:
+        return self._get_function("season_pbp")(
+            self.season, max_workers=self.max_workers)
+
+    @property
+    def player_box(self) -> pd.DataFrame:
+        """
+        The player box scores of every game in this season.
+        """
+        return self._get("box", self._load_box)[0]
+
+    @property
+    def team_box(self) -> pd.DataFrame:
+        """
+        The team box scores of every game in this season.
+        """
+        return self._get("box", self._load_box)[1]
+
+    @property
+    def player_stats(self) -> pd.DataFrame:
+        """
+        The season player stats of this season.
+        """
+        return self._get("player_stats", self._load_player_stats)
+
+    @property
+    def team_stats(self) -> pd.DataFrame:
+        """
+        The season team stats of this season.
+        """
+        return self._get("team_stats", self._load_team_stats)
+
+    @property
+    def pbp(self) -> pd.DataFrame:
+        """
+        The play-by-play (PBP) data of every game in this season.
+        """
+        return self._get("pbp", self._load_pbp)
+
+    def refresh(self) -> None:
+        """
+        Drops all data of this season,
+        so that it is downloaded again the next time it is used.
+        """
+        with self._lock:
+            self._data.clear()
+            self._game_ids = None
+            self._loaded_at = None
+
+
+# The number of seasons `get_au_season()` keeps at once.
+# When a season is added past this, the one used the longest time ago is dropped.
+_AU_SEASONS_MAX_SIZE = 4
+
+# (sport, season) -> AUSeason, from the least to the most recently used.
+_au_seasons = OrderedDict()
+_au_seasons_lock = threading.Lock()
+
+
+def get_au_season(sport: str, season: int, max_workers: int = 1) -> AUSeason:
+    """
+    Returns the `AUSeason` of a sport and season,
+    which is shared by every call to this function
+    (and by the `get_au_*_season_player_stats()`
+    and `get_au_*_season_team_stats()` functions),
+    so getting both the player and team stats of a season
+    downloads its box scores once.
+
+    Up to 4 seasons are kept,
+    and the season used the longest time ago is dropped first.
+    A kept season is still downloaded again when its data is stale
+    (see `AUSeason`).
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time,
+        if the season's data has to be downloaded.
+
+    Returns
+    ----------
+    An `AUSeason`.
+    """
+    with _au_seasons_lock:
+        au_season = _au_seasons.get((sport, season))
+
+        if au_season is None:
+            au_season = AUSeason(sport, season, max_workers=max_workers)
+            _au_seasons[(sport, season)] = au_season
+
+            while len(_au_seasons) > _AU_SEASONS_MAX_SIZE:
+                _au_seasons.popitem(last=False)
+        else:
+            _au_seasons.move_to_end((sport, season))
+
+    au_season.max_workers = max_workers
+    return au_season
+
+
+def clear_au_seasons(sport: str = None) -> None:
+    """
+    Drops every `AUSeason` kept by `get_au_season()`,
+    freeing the memory used by their data.
+
+    Parameters
+    ----------
+    `sport` (str, optional) = None:
+        If set, only seasons of this sport are dropped.
+    """
+    with _au_seasons_lock:
+        for key in list(_au_seasons.keys()):
+            if sport is None or key[0] == sport:
+                del _au_seasons[key]
+
+
+##############################################################################
+##
+# Season IDs
+##
+##############################################################################
+
+# The season IDs known when this version was released, by sport and season.
+# Seasons added after that must be added with `register_au_season()`
+# (see `refresh_au_season_ids()`).
+_AU_KNOWN_SEASON_IDS = {
+    "basketball": {2022: 6, 2023: 73, 2024: 171},
+    "lacrosse": {2021: 5, 2022: 17, 2023: 105},
+    "softball": {2020: 2, 2021: 4, 2022: 13, 2023: 14},
+    "aux_softball": {2022: 39, 2023: 106, 2024: 172},
+    "volleyball": {2021: 3, 2022: 11, 2023: 138},
+}
+
+# The fields of every entry of a seasons catalog (`api/seasons/{sport}/v1`):
+# `seasonId` is the season ID, and `gameIds` lists the game IDs of that season.
+# Entries don't have the season (year) of their season ID,
+# and AUX softball seasons are listed in the softball catalog,
+# so a season ID can only be mapped to a season if it's known
+# (see `_AU_KNOWN_SEASON_IDS` and `register_au_season()`).
+_AU_CATALOG_FIELDS = ("seasonId", "gameIds")
+
+# sport -> {season: season_id}
+_au_season_ids = {
+    sport: dict(season_ids) for sport, season_ids in _AU_KNOWN_SEASON_IDS.items()
+}
+# API sport -> {season_id: season}
+_au_id_seasons = {}
+# API sport -> season IDs found in the seasons catalog that aren't mapped to a season
+# (see `refresh_au_season_ids()`)
+_au_unmapped_season_ids = {}
+_au_season_ids_lock = threading.Lock()
+
+
+def _au_api_sport(sport: str) -> str:
+    """
+    Returns the sport used by the API for `sport`
+    (AUX softball uses the softball API).
+    """
+    if sport == "aux_softball":
+        return "softball"
+    return sport
+
+
+def _au_index_season_ids() -> None:
+    """
+    Rebuilds the season ID -> season lookup from `_au_season_ids`.
+    Must be called with `_au_season_ids_lock` held.
+    """
+    _au_id_seasons.clear()
+
+    for sport, season_ids in _au_season_ids.items():
+        id_seasons = _au_id_seasons.setdefault(_au_api_sport(sport), {})
+        for season, season_id in season_ids.items():
+            id_seasons[season_id] = season
+
+
+_au_index_season_ids()
+
+
+def _au_check_season_sport(sport: str) -> None:
+    if sport not in AU_SEASON_SPORTS:
+        raise ValueError(
+            f'`sport` must be one of {AU_SEASON_SPORTS}, not `{sport}`.')
+
+
+def register_au_season(sport: str, season: int, season_id: int) -> None:
+    """
+    Adds (or replaces) the season ID of a season,
+    for seasons that are not known by this version.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season.
+
+    `season_id` (int, mandatory):
+        The season ID of the season in the API.
+    """
+    _au_check_season_sport(sport)
+
+    with _au_season_ids_lock:
+        _au_season_ids[sport][int(season)] = int(season_id)
+        _au_index_season_ids()
+
+        unmapped_ids = _au_unmapped_season_ids.get(_au_api_sport(sport))
+        if unmapped_ids is not None and int(season_id) in unmapped_ids:
+            unmapped_ids.remove(int(season_id))
+
+
+def _au_catalog_season_id(api_sport: str, entry: dict) -> int:
+    """
+    Returns the season ID of a seasons catalog entry.
+    Raises a `ValueError()` if the entry doesn't have the fields of a seasons catalog entry.
+    """
+    if not isinstance(entry, dict) or any(key not in entry for key in _AU_CATALOG_FIELDS):
+        raise ValueError(
+            f'The seasons catalog of {api_sport} has an entry that is missing '
+            f'{" or ".join(f"`{key}`" for key in _AU_CATALOG_FIELDS)}:\n\t{entry}')
+
+    return entry['seasonId']
+
+
+def refresh_au_season_ids(sport: str = None) -> dict:
+    """
+    Checks the seasons catalog (`api/seasons/{sport}/v1`)
+    for season IDs that aren't known by this package.
+
+    Every entry of the seasons catalog has a `seasonId` and the `gameIds` of that season,
+    but not the season (year) of the season ID,
+    and AUX softball seasons are listed in the softball catalog.
+    Because of that, season IDs added after this version was released
+    can't be mapped to a season from the catalog.
+    They are kept as unmapped season IDs (see `get_au_unmapped_season_ids()`),
+    until they are mapped with `register_au_season()`.
+
+    Parameters
+    ----------
+    `sport` (str, optional) = None:
+        If set, only seasons of this sport are checked.
+        Checking `softball` or `aux_softball` checks both.
+
+    Returns
+    ----------
+    A dict of `{api_sport: [season_id, ...]}` with the unmapped season IDs of every sport checked
+    (`softball` for both softball and AUX softball).
+    If the seasons catalog has an entry without a `seasonId` or `gameIds`,
+    a `ValueError()` exception will be raised.
+    """
+    if sport is None:
+        api_sports = sorted({_au_api_sport(s) for s in AU_SEASON_SPORTS})
+    else:
+        _au_check_season_sport(sport)
+        api_sports = [_au_api_sport(sport)]
+
+    catalogs = {
+        api_sport: get_au_season_catalog(api_sport) for api_sport in api_sports
+    }
+    unmapped = {}
+
+    with _au_season_ids_lock:
+        for api_sport, catalog in catalogs.items():
+            season_ids = [
+                _au_catalog_season_id(api_sport, entry)
+                for entry in catalog.get('data') or []
+            ]
+            _au_unmapped_season_ids[api_sport] = [
+                season_id for season_id in season_ids
+                if season_id not in _au_id_seasons.get(api_sport, {})
+            ]
+            unmapped[api_sport] = list(_au_unmapped_season_ids[api_sport])
+
+    return unmapped
+
+
+def get_au_unmapped_season_ids(sport: str) -> list:
+    """
+    Returns the season IDs in the seasons catalog of a sport
+    that aren't mapped to a season (see `refresh_au_season_ids()`).
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+        `softball` and `aux_softball` share one seasons catalog,
+        and return the same season IDs.
+
+    Returns
+    ----------
+    A list of season IDs, which can be mapped to a season with `register_au_season()`.
+    """
+    return refresh_au_season_ids(sport)[_au_api_sport(sport)]
+
+
+def _au_unmapped_season_ids_note(sport: str) -> str:
+    """
+    Returns a line for season ID errors, naming the unmapped season IDs of `sport`
+    found the last time its seasons catalog was checked.
+    Only uses what is already in memory.
+    """
+    unmapped_ids = _au_unmapped_season_ids.get(_au_api_sport(sport))
+
+    if not unmapped_ids:
+        return ''
+
+    return (
+        f'\nThe seasons catalog also has season IDs that aren\'t mapped to a season: {unmapped_ids}.'
+        '\nUse `register_au_season()` to map them.')
+
+
+def get_au_season_ids(sport: str) -> dict:
+    """
+    Returns every season ID known for a sport.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    Returns
+    ----------
+    A dict of `{season: season_id}`, in order of season.
+    """
+    _au_check_season_sport(sport)
+    return dict(sorted(_au_season_ids[sport].items()))
+
+
+def get_au_season_id(sport: str, season: int) -> int:
+    """
+    Returns the season ID of a season.
+
+    Only the season IDs in memory are used.
+    Seasons added after this version was released can be added with `register_au_season()`.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season you want a season ID for.
+        If there isn't a season ID for `season`, a `ValueError()` exception will be raised.
+
+    Returns
+    ----------
+    The season ID of the season.
+    """
+    _au_check_season_sport(sport)
+    season_id = _au_season_ids[sport].get(season)
+
+    if season_id is None:
+        raise ValueError(
+            f'[season] can only be one of {sorted(_au_season_ids[sport])} '
+            f'at this time for {sport}.\nYou entered :\n\t{season}'
+            + _au_unmapped_season_ids_note(sport))
+
+    return season_id
+
+
+def get_au_season_year(sport: str, season_id: int) -> int:
+    """
+    Returns the season of a season ID.
+
+    Only the season IDs in memory are used.
+    Season IDs added after this version was released can be added with `register_au_season()`.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season ID (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+        `softball` and `aux_softball` season IDs can be looked up with either.
+
+    `season_id` (int, mandatory):
+        The season ID you want a season for.
+        If there isn't a season for `season_id`, a `ValueError()` exception will be raised.
+
+    Returns
+    ----------
+    The season of the season ID.
+    """
+    _au_check_season_sport(sport)
+    api_sport = _au_api_sport(sport)
+    season = _au_id_seasons.get(api_sport, {}).get(season_id)
+
+    if season is None:
+        raise ValueError(
+            f'[season_id] can only be one of {sorted(_au_id_seasons.get(api_sport, {}))} '
+            f'at this time for {sport}.\nYou entered :\n\t{season_id}'
+            + _au_unmapped_season_ids_note(sport))
+
+    return season
+
+
+def _au_game_seasons(sport: str, json_data: dict) -> dict:
+    """
+    Returns a dict of `{season_id: season}` for every season ID in a box score,
+    so that the season of every row is found once per game, instead of once per row.
+    """
+    return {
+        season_id: get_au_season_year(sport, season_id)
+        for season_id in {i['seasonId'] for i in json_data['data']}
+    }
@@ -0,0 +1,279 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from athetes_unlimited_py.replay import au_payload_path
+from athetes_unlimited_py.utils import _au_parse_request
+
+##############################################################################
+##
+# Stand-in API server
+##
+##############################################################################
+
+AU_STAND_IN_ERROR_STATUSES = (500, 502, 503, 504)
+
+
+class _AUStandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves recorded payloads at `/proxy.php?request=<API path>`,
+    the same way the auprosports.com API proxy does.
+    """
+
+    server_version = "AUStandIn/1.0"
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+
+        if url.path != "/proxy.php":
+            return self._send(404, {"error": f"Unknown path `{url.path}`."})
+
+        request = parse_qs(url.query).get("request", [""])[0]
+        parsed = _au_parse_request(request)
+
+        server._au_sleep()
+
+        if server._au_inject_error() == True:
+            status = random.choice(server.error_statuses)
+            server._au_count("errors")
+            return self._send(status, {"error": "Injected error."})
+
+        if parsed is None:
+            server._au_count("not_found")
+            return self._send(404, {"error": f"Unknown API path `{request}`."})
+
+        path = au_payload_path(
+            server.payload_dir,
+            parsed["sport"],
+            parsed["endpoint"],
+            parsed["season_id"],
+            parsed["game"]
+        )
+
+        if not os.path.exists(path):
+            server._au_count("not_found")
+            return self._send(404, {"error": f"No recorded payload for `{request}`."})
+
+        with open(path, "rb") as f:
+            body = f.read()
+
+        server._au_count("served")
+        self._send(200, body)
+
+    def _send(self, status: int, body) -> None:
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose == True:
+            super().log_message(format, *args)
+
+
+class AUStandInServer(ThreadingHTTPServer):
+    """
+    A local stand-in for the auprosports.com API proxy,
+    which serves payloads recorded with `configure_au_replay(mode="record")`
+    (or `benchmarks/record_payloads.py`).
+
+    Point the client at it with
+    `configure_au_client(base_url=server.base_url)`
+    to run benchmarks and load tests with no network,
+    with as much latency and as many errors as needed.
+
+    Parameters
+    ----------
+    `payload_dir` (str, mandatory):
+        The folder recorded payloads are read from.
+
+    `host` (str, optional) = "127.0.0.1":
+        The host the server listens on.
+
+    `port` (int, optional) = 0:
+        The port the server listens on.
+        If set to `0`, a free port is picked.
+
+    `latency` (float, optional) = 0.0:
+        Seconds every response is delayed by.
+
+    `jitter` (float, optional) = 0.0:
+        Up to this many seconds are randomly added to `latency`.
+
+    `error_rate` (float, optional) = 0.0:
+        The share of requests (from `0.0` to `1.0`)
+        that are answered with one of `error_statuses`
+        instead of the recorded payload.
+
+    `error_statuses` (tuple, optional) = (500, 502, 503, 504):
+        The HTTP status codes injected errors are picked from.
+
+    `seed` (int, optional) = None:
+        If set, the latency and errors are the same on every run.
+
+    `verbose` (bool, optional) = False:
+        If set to `True`, every request is logged to stderr.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+            self,
+            payload_dir: str,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            error_statuses: tuple = AU_STAND_IN_ERROR_STATUSES,
+            seed: int = None,
+            verbose: bool = False):
+        if latency < 0 or jitter < 0:
+            raise ValueError('`latency` and `jitter` cannot be less than 0.')
+        elif error_rate < 0 or error_rate > 1:
+            raise ValueError('`error_rate` must be between 0 and 1.')
+        elif error_rate > 0 and len(error_statuses) == 0:
+            raise ValueError('`error_statuses` cannot be empty.')
+
+        self.payload_dir = os.path.abspath(os.path.expanduser(payload_dir))
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.verbose = verbose
+        self.stats = {"served": 0, "errors": 0, "not_found": 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+        super().__init__((host, port), _AUStandInHandler)
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL to pass to `configure_au_client(base_url=...)`.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/proxy.php?request="
+
+    def start(self) -> "AUStandInServer":
+        """
+        Starts serving requests in a background thread, and returns the server.
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="AUStandInServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops serving requests, and closes the server.
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _au_sleep(self) -> None:
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def _au_inject_error(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _au_count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+
+def start_au_stand_in_server(payload_dir: str, **kwargs) -> AUStandInServer:
+    """
+    Starts an `AUStandInServer` in a background thread, and returns it.
+    Every keyword argument is passed to `AUStandInServer`.
+
+    Stop it with `server.stop()`, or use it as a context manager:
+
+        with AUStandInServer("payloads", latency=0.05, error_rate=0.1) as server:
+            configure_au_client(base_url=server.base_url)
+            ...
+
+    Parameters
+    ----------
+    `payload_dir` (str, mandatory):
+        The folder recorded payloads are read from.
+
+    Returns
+    ----------
+    The running `AUStandInServer`.
+    """
+    return AUStandInServer(payload_dir, **kwargs).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="A local stand-in for the auprosports.com API proxy.")
+    parser.add_argument("payload_dir",
+                        help="The folder recorded payloads are read from.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds every response is delayed by.")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Up to this many seconds are randomly added to the latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="The share of requests answered with a 5xx error.")
+    parser.add_argument("--error-statuses", type=int, nargs="+",
+                        default=list(AU_STAND_IN_ERROR_STATUSES))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    server = AUStandInServer(
+        args.payload_dir,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_statuses=args.error_statuses,
+        seed=args.seed,
+        verbose=not args.quiet
+    )
+
+    print(f"Serving `{server.payload_dir}` at {server.base_url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,28 @@
-import json
-import time
 # from urllib.request import urlopen
+from collections.abc import Iterator
 
 import pandas as pd
-import requests
-from tqdm import tqdm
 
-from athetes_unlimited_py.utils import raise_html_status_code
+from athetes_unlimited_py.client import get_au_json, get_au_season_catalog
+from athetes_unlimited_py.metrics import _au_measure
+from athetes_unlimited_py.progress import _au_game_fetched, _au_season_empty
+from athetes_unlimited_py.season import (
+    _au_game_seasons,
+    get_au_season,
+    get_au_season_id,
+    get_au_season_year,
+)
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_game_pbp_output,
+    _au_game_stats_output,
+    _au_season_output,
+    au_chunk_games,
+    au_concat_game_pairs,
+    au_concat_games,
+    au_imap_games,
+    au_parse_game_roster,
+)
 
 ##############################################################################
 ##
@@ -29,34 +45,7 @@ def get_au_softball_season(season_id: int) -> int:
     ----------
     The proper season corresponding to an Athletes Unlimited softball season ID.
     """
-    # season = 0
-
-    if season_id == 2:
-        season = 2020
-        return season
-    elif season_id == 4:
-        season = 2021
-        return season
-    elif season_id == 13:  # AUX = 39, non-AUX = 13
-        season = 2022
-        return season
-    elif season_id == 39:
-        season = 2022
-        return season
-    elif season_id == 14:  # AUX = 106, non-AUX = 14
-        season = 2023
-        return season
-    elif season_id == 106:
-        season = 2023
-        return season
-    elif season_id == 172:
-        season = 2024
-        return season
-    else:
-        raise ValueError(
-            '[season] can only be 2022 or 2023 at this time for softball.' +
-            f'\nYou entered :\n\t{season_id}'
-        )
+    return get_au_season_year("softball", season_id)
 
 
 def get_au_softball_season_id(season: int) -> int:
@@ -76,24 +65,8 @@ def get_au_softball_season_id(season: int) -> int:
     The proper season ID corresponding
     to an Athletes Unlimited softball season.
     """
-    seasonId = 0
-
-    if season == 2020:
-        seasonId = 2
-        return seasonId
-    elif season == 2021:
-        seasonId = 4
-        return seasonId
-    elif season == 2022:
-        seasonId = 13
-        return seasonId
-    elif season == 2023:
-        seasonId = 14
-        return seasonId
-    else:
-        raise ValueError(
-            '[season] can only be 2022 or 2023 at this time for softball.' +
-            f'\nYou entered :\n\t{season}')
+    return get_au_season_id("softball", season)
+
 
 ##############################################################################
 ##
@@ -102,12 +75,440 @@ def get_au_softball_season_id(season: int) -> int:
 ##############################################################################
 
 
+def _flatten_au_softball_game_stats(json_data: dict) -> tuple:
+    """
+    Flattens the JSON returned by the Athletes Unlimited (AU) softball box score API
+    into one dict per player/team.
+
+    Stats that are calculated from other stats (WHIP, H9, game score, RF/9, etc.)
+    are left as `None`, and are calculated for every row at once
+    by `_au_softball_box_from_rows()`.
+
+    Parameters
+    ----------
+    `json_data` (dict, mandatory):
+        The JSON of a `by-game` API response.
+
+    Returns
+    ----------
+    A tuple containing two lists of dicts. The first contains player stats for this game,
+    and the second contains team stats for this game.
+    """
+    player_rows = []
+    team_rows = []
+
+    sport = json_data['metaSport']['sport']
+    api_version = json_data['metaSport']['version']
+    seasons = _au_game_seasons("softball", json_data)
+
+    for i in json_data['data']:
+        row = {'sport': sport, 'api_version': api_version}
+
+        ###################################################################
+        # Player/Team info
+        ###################################################################
+        season = seasons[i['seasonId']]
+        row['season'] = season
+        row['seasonId'] = i['seasonId']
+        row['weekNumber'] = 0
+        row['gameNumber'] = 0
+        row['seasonType'] = ""
+
+        row['playerId'] = i['playerId']
+        row['uniformNumber'] = i['uniformNumber']
+        row['uniformNumberDisplay'] = str(i['uniformNumberDisplay'])
+
+        row['primaryPositionLk'] = i['primaryPositionLk']
+        row['secondaryPositionLk'] = i['secondaryPositionLk']
+        row['first_name'] = str(i['firstName']).replace('\u2019', '\'')
+        row['last_name'] = str(i['lastName']).replace('\u2019', '\'')
+        row['full_name'] = f"{i['firstName']} {i['lastName']}".replace(
+            '\u2019', '\'')
+
+        ###################################################################
+        # Catching Stats
+        # An endpoint sugests that this is a thing in their API, but no data can be found here.
+        ###################################################################
+
+        ###################################################################
+        # Batting Stats
+        ###################################################################
+        if len(i['battingStats']) > 0:
+            row['week'] = i['battingStats'][0]['weekNumber']
+            row['game_num'] = i['battingStats'][0]['gameNumber']
+            row['season_type'] = i['battingStats'][0]['gamesStarted']
+            row['G'] = i['battingStats'][0]['gamesPlayed']
+            row['GS'] = i['battingStats'][0]['gamesStarted']
+            row['batting_PA'] = 0
+            row['batting_AB'] = i['battingStats'][0]['atBat']
+            row['batting_R'] = i['battingStats'][0]['runs']
+            row['batting_H'] = i['battingStats'][0]['hits']
+            row['batting_2B'] = i['battingStats'][0]['doubles']
+            row['batting_3B'] = i['battingStats'][0]['triples']
+            row['batting_HR'] = i['battingStats'][0]['homeRuns']
+            row['batting_RBI'] = i['battingStats'][0]['runsBattedIn']
+            row['batting_BB'] = i['battingStats'][0]['baseonBalls']
+            row['batting_HBP'] = i['battingStats'][0]['hitByPitch']
+            row['batting_K'] = i['battingStats'][0]['strikeOuts']
+            row['batting_SB'] = i['battingStats'][0]['stolenBases']
+            row['batting_SBA'] = i['battingStats'][0]['stolenBasesAttempts']
+            row['batting_CS'] = i['battingStats'][0]['caughtStealing']
+            row['batting_BA'] = i['battingStats'][0]['battingAverage']
+            row['batting_OBP'] = i['battingStats'][0]['onBasePercentage']
+            row['batting_SLG'] = i['battingStats'][0]['sluggingPercentage']
+            row['batting_TB'] = i['battingStats'][0]['totalBases']
+            row['batting_SF'] = i['battingStats'][0]['sacrificeFly']
+            row['batting_SH'] = i['battingStats'][0]['sacrificeHit']
+            row['AU_POINTS'] = i['battingStats'][0]['auTotalPoints']
+
+        else:
+            row['batting_AB'] = None
+            row['batting_R'] = None
+            row['batting_H'] = None
+            row['batting_2B'] = None
+            row['batting_3B'] = None
+            row['batting_HR'] = None
+            row['batting_RBI'] = None
+            row['batting_BB'] = None
+            row['batting_HBP'] = None
+            row['batting_K'] = None
+            row['batting_SB'] = None
+            row['batting_SBA'] = None
+            row['batting_CS'] = None
+            row['batting_BA'] = None
+            row['batting_OBP'] = None
+            row['batting_SLG'] = None
+            row['batting_TB'] = None
+            row['batting_SF'] = None
+            row['batting_SH'] = None
+
+        ###################################################################
+        # Pitching Stats
+        ###################################################################
+
+        if len(i['pitchingStats']) > 0:
+            row['week'] = i['pitchingStats'][0]['weekNumber']
+            row['game_num'] = i['pitchingStats'][0]['gameNumber']
+
+            row['G'] = i['pitchingStats'][0]['appearances']
+            row['GS'] = i['pitchingStats'][0]['gamesStarted']
+            row['pitching_W'] = i['pitchingStats'][0]['wins']
+            row['pitching_L'] = i['pitchingStats'][0]['losses']
+            row['pitching_ERA'] = i['pitchingStats'][0]['earnedRunAverage']
+            row['pitching_SHO'] = i['pitchingStats'][0]['shutout']
+            row['pitching_CG'] = i['pitchingStats'][0]['completeGames']
+            row['pitching_SV'] = i['pitchingStats'][0]['saves']
+            if i['pitchingStats'][0]['inningsPitched'] is None:
+                row['pitching_IP_str'] = None
+            else:
+                row['pitching_IP_str'] = str(
+                    i['pitchingStats'][0]['inningsPitched'])
+
+            row['pitching_IP'] = None
+            row['pitching_OUTS'] = None
+
+            row['pitching_QS'] = 0
+            row['pitching_H'] = i['pitchingStats'][0]['hits']
+            row['pitching_R'] = i['pitchingStats'][0]['runs']
+            row['pitching_ER'] = i['pitchingStats'][0]['earnedRuns']
+            row['pitching_HR'] = i['pitchingStats'][0]['homeRuns']
+            row['pitching_BB'] = i['pitchingStats'][0]['baseOnBalls']
+            row['pitching_SO'] = i['pitchingStats'][0]['strikeOuts']
+            row['pitching_HBP'] = i['pitchingStats'][0]['hitByPitch']
+            row['pitching_WP'] = i['pitchingStats'][0]['wildPitch']
+            row['pitching_WHIP'] = None
+            row['pitching_H9'] = None
+            row['pitching_HR9'] = None
+            row['pitching_BB9'] = None
+            row['pitching_SO9'] = None
+            row['pitching_SO/BB'] = None
+            row['pitching_RA9'] = None
+            row['pitching_PI'] = i['pitchingStats'][0]['numberOfPitches']
+            row['pitching_PI_balls'] = i['pitchingStats'][0]['balls']
+            row['pitching_PI_strikes'] = i['pitchingStats'][0]['strikes']
+            row['pitcing_game_score'] = None
+            row['AU_POINTS'] = i['pitchingStats'][0]['auTotalPoints']
+        else:
+            row['pitching_H'] = None
+            row['pitching_R'] = None
+            row['pitching_ER'] = None
+            row['pitching_HR'] = None
+            row['pitching_BB'] = None
+            row['pitching_SO'] = None
+            row['pitching_HBP'] = None
+            row['pitching_WP'] = None
+            row['pitching_WHIP'] = None
+            row['pitching_H9'] = None
+            row['pitching_HR9'] = None
+            row['pitching_BB9'] = None
+            row['pitching_SO9'] = None
+            row['pitching_SO/BB'] = None
+            row['pitching_RA9'] = None
+            row['pitching_PI'] = None
+            row['pitching_PI_balls'] = None
+            row['pitching_PI_strikes'] = None
+
+        ###################################################################
+        # Fielding Stats
+        ###################################################################
+        if len(i['fieldingStats']) > 0:
+            row['week'] = i['fieldingStats'][0]['weekNumber']
+            row['game_num'] = i['fieldingStats'][0]['gameNumber']
+
+            row['G'] = i['fieldingStats'][0]['gamesPlayed']
+            row['fielding_position'] = i['fieldingStats'][0]['position']
+            row['fielding_IP_str'] = i['fieldingStats'][0]['inningsPlayed']
+            row['fielding_IP'] = None
+            row['fielding_OUTS'] = None
+
+            row['fielding_PO'] = i['fieldingStats'][0]['putOuts']
+            row['fielding_A'] = i['fieldingStats'][0]['assists']
+            row['fielding_E'] = i['fieldingStats'][0]['errors']
+            row['fielding_DP'] = i['fieldingStats'][0]['doublePlays']
+            row['fielding_FLD%'] = i['fieldingStats'][0]['fieldingPercent']
+            row['fielding_CS'] = i['fieldingStats'][0]['caughtStealing']
+            row['fielding_CS%'] = i['fieldingStats'][0]['caughtStealingPercentage']
+            row['fielding_TC'] = i['fieldingStats'][0]['totalChances']
+
+            row['fielding_CH'] = None
+            row['fielding_RF/9'] = None
+        else:
+            row['fielding_position'] = None
+            row['fielding_IP_str'] = None
+            row['fielding_IP'] = None
+            row['fielding_OUTS'] = None
+            row['fielding_PO'] = None
+            row['fielding_A'] = None
+            row['fielding_E'] = None
+            row['fielding_DP'] = None
+            row['fielding_FLD%'] = None
+            row['fielding_CS'] = None
+            row['fielding_CS%'] = None
+            row['fielding_TC'] = None
+
+            row['fielding_CH'] = None
+            row['fielding_RF/9'] = None
+
+        ###################################################################
+        # Save the data to the correct DataFrame
+        ###################################################################
+
+        row['type'] = i['type']
+        row['teamId'] = i['teamId']
+
+        if i['homeTeamFlg'] == True:
+            row['homeTeamFlg'] = 1
+        else:
+            row['homeTeamFlg'] = 0
+
+        if i['type'] == "Team":
+            team_rows.append(row)
+        else:
+            player_rows.append(row)
+
+    return player_rows, team_rows
+
+
+def au_softball_innings_to_outs(innings) -> pd.Series:
+    """
+    Converts innings pitched/played in the `6.1`/`6.2` format
+    (6 1/3 and 6 2/3 innings) into outs (`19` and `20`), for an entire column at once.
+
+    Innings are stored as outs, so that they can be summed over a season
+    without the rounding errors of `6.333` + `6.667`.
+
+    Parameters
+    ----------
+    `innings` (pandas.Series, mandatory):
+        Innings as strings or numbers (e.g. `"6.2"`, `6.2` or `7`).
+        Innings with real decimals (e.g. `6.333`) are rounded to the nearest out.
+
+    Returns
+    ----------
+    A pandas Series of outs (`Int64`). Innings that can't be converted become `<NA>`.
+    """
+    text = pd.Series(innings).astype(str).str.strip()
+    parts = text.str.extract(r'^(\d+)(?:\.([012]))?$')
+
+    outs = pd.to_numeric(parts[0], errors='coerce') * 3 + \
+        pd.to_numeric(parts[1], errors='coerce').fillna(0)
+    outs = outs.fillna((pd.to_numeric(text, errors='coerce') * 3).round())
+
+    return outs.astype('Int64')
+
+
+def au_softball_outs_to_innings(outs) -> pd.Series:
+    """
+    Converts outs (`20`) into innings in the `6.2` format, for display.
+    The reverse of `au_softball_innings_to_outs()`.
+
+    Parameters
+    ----------
+    `outs` (pandas.Series, mandatory):
+        Outs, as whole numbers.
+
+    Returns
+    ----------
+    A pandas Series of strings (e.g. `"6.2"`). Missing outs become `None`.
+    """
+    outs = pd.to_numeric(pd.Series(outs), errors='coerce')
+    innings = (outs // 3).astype('Int64').astype(str) + '.' + \
+        (outs % 3).astype('Int64').astype(str)
+
+    return innings.astype(object).where(outs.notna(), None)
+
+
+def _au_softball_season_innings(finished_df: pd.DataFrame) -> None:
+    """
+    Rebuilds `pitching_IP_str`/`pitching_IP` and `fielding_IP_str`/`fielding_IP`
+    out of the outs summed over a season, in place.
+    They are inserted right before their `_OUTS` column,
+    so that season stats keep the column order of the box scores and of `get_au_schema()`.
+    """
+    for prefix in ('pitching', 'fielding'):
+        outs = finished_df[f'{prefix}_OUTS']
+        position = finished_df.columns.get_loc(f'{prefix}_OUTS')
+        finished_df.insert(position, f'{prefix}_IP', outs / 3)
+        finished_df.insert(
+            position, f'{prefix}_IP_str', au_softball_outs_to_innings(outs))
+
+
+def _au_softball_box_from_rows(rows: list, is_player_stats: bool = True) -> pd.DataFrame:
+    """
+    Builds a pandas DataFrame out of rows from `_flatten_au_softball_game_stats()`,
+    and calculates every derived batting, pitching and fielding stat
+    for all rows at once.
+
+    Parameters
+    ----------
+    `rows` (list, mandatory):
+        Player or team rows from one or more games.
+
+    `is_player_stats` (bool, optional) = True:
+        If set to `True`, quality starts (`pitching_QS`) will be calculated.
+
+    Returns
+    ----------
+    A pandas DataFrame containing the box score stats of every row in `rows`.
+    """
+    stats_df = pd.DataFrame(rows)
+
+    if len(stats_df) == 0:
+        return stats_df
+
+    def stat(col: str) -> pd.Series:
+        return pd.to_numeric(stats_df[col], errors='coerce')
+
+    ###################################################################
+    # Batting Stats
+    ###################################################################
+    if 'batting_PA' in stats_df.columns:
+        stats_df['batting_PA'] = stat('batting_AB') + stat('batting_BB') + \
+            stat('batting_HBP') + stat('batting_SF') + stat('batting_SH')
+
+    ###################################################################
+    # Pitching Stats
+    ###################################################################
+    if 'pitching_IP' in stats_df.columns:
+        stats_df['pitching_OUTS'] = au_softball_innings_to_outs(
+            stats_df['pitching_IP_str'])
+
+        pitching_OUTS = stats_df['pitching_OUTS'].astype('float')
+        stats_df['pitching_IP'] = pitching_OUTS / 3
+        pitching_H = stat('pitching_H')
+        pitching_R = stat('pitching_R')
+        pitching_ER = stat('pitching_ER')
+        pitching_BB = stat('pitching_BB')
+        pitching_SO = stat('pitching_SO')
+
+        # Every rate is calculated from outs (3 outs = 1 inning, 27 outs = 9 innings).
+        stats_df['pitching_WHIP'] = (3 * (pitching_BB + pitching_H)) / pitching_OUTS
+        stats_df['pitching_H9'] = (27 * pitching_H) / pitching_OUTS
+        stats_df['pitching_HR9'] = (27 * stat('pitching_HR')) / pitching_OUTS
+        stats_df['pitching_BB9'] = (27 * pitching_BB) / pitching_OUTS
+        stats_df['pitching_SO9'] = (27 * pitching_SO) / pitching_OUTS
+        stats_df['pitching_SO/BB'] = pitching_SO / pitching_BB
+        stats_df['pitching_RA9'] = 27 * (pitching_R / pitching_OUTS)
+        stats_df['pitcing_game_score'] = 50 + pitching_OUTS + pitching_SO - (pitching_H * 2) - (
+            pitching_ER * 4) - ((pitching_R - pitching_ER) * 2) - pitching_BB
+
+        if is_player_stats == True:
+            stats_df.loc[(pitching_OUTS >= 18) & (
+                stat('GS') == 1) & (pitching_ER <= 3), 'pitching_QS'] = 1
+
+    ###################################################################
+    # Fielding Stats
+    ###################################################################
+    if 'fielding_IP' in stats_df.columns:
+        stats_df['fielding_OUTS'] = au_softball_innings_to_outs(
+            stats_df['fielding_IP_str'])
+
+        fielding_OUTS = stats_df['fielding_OUTS'].astype('float')
+        stats_df['fielding_IP'] = fielding_OUTS / 3
+
+        fielding_PO = stat('fielding_PO')
+        fielding_A = stat('fielding_A')
+
+        stats_df['fielding_CH'] = fielding_PO + \
+            fielding_A + stat('fielding_E')
+        stats_df['fielding_RF/9'] = (
+            27 * (fielding_PO + fielding_A)) / fielding_OUTS
+
+    return stats_df
+
+
+def _parse_au_softball_game_stats(json_data: dict) -> tuple:
+    """
+    Parses the JSON returned by the Athletes Unlimited (AU) softball box score API.
+
+    Parameters
+    ----------
+    `json_data` (dict, mandatory):
+        The JSON of a `by-game` API response.
+
+    Returns
+    ----------
+    A tuple containing two pandas DataFrames. The first contains player stats for this game,
+    and the second contains team stats for this game.
+    """
+    player_rows, team_rows = _flatten_au_softball_game_stats(json_data)
+
+    player_stats_df = _au_softball_box_from_rows(player_rows)
+    team_stats_df = _au_softball_box_from_rows(
+        team_rows, is_player_stats=False)
+
+    return player_stats_df, team_stats_df
+
+
+def _au_softball_game_stats_request(season_id: int, game_num: int) -> tuple:
+    """
+    Returns the API request and cache key of the box score of a softball game.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    return (
+        f"/api/stats/softball/v1/{season_id}/by-game/{game_num}?statType=batting%26statType=pitching%26statType=fielding",
+        ("softball", "by-game", season_id, game_num),
+    )
+
+
+def _get_au_softball_game_stats_json(season_id: int, game_num: int) -> dict:
+    """
+    Downloads the box score JSON of an Atheltes Unlimited (AU) softball game.
+    """
+    if game_num < 1:
+        raise ValueError('`game_num` cannot be less than 0.')
+
+    request, cache_key = _au_softball_game_stats_request(season_id, game_num)
+    return get_au_json(request, cache_key=cache_key)
+
+
 def get_au_softball_game_stats(
         season_id: int,
         game_num: int,
         get_team_stats: bool = False,
         get_player_and_team_stats: bool = False,
-        rename_cols: bool = False) -> pd.DataFrame():
+        rename_cols: bool = False,
+        output: str = "pandas") -> pd.DataFrame:
     """
     Retrieves the player and/or team game stats
     for an Atheltes Unlimited (AU) softball game.
@@ -137,289 +538,120 @@ def get_au_softball_game_stats(
         `get_softball_game_stats()` will have no change
         in functionality at this time if `rename_cols` is set to `True`.
 
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
     Returns
     ----------
     A pandas DataFrame containing player and/or team stats
     for a given AU game within a given AU season ID.
     """
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
-    player_stats_df = pd.DataFrame()
-    team_stats_df = pd.DataFrame()
-    row_df = pd.DataFrame()
+    _au_check_output(output)
 
     # season_id = get_au_softball_season_id(season)
     # season = get_au_softball_season(season_id)
 
-    if game_num < 1:
-        raise ValueError('`game_num` cannot be less than 0.')
-
-    # Yes, the key is literaly the int of the Epoch time at the time of the GET request.
-    key = int(time.time())
-
-    url = f"https://auprosports.com/proxy.php?request=/api/stats/softball/v1/{season_id}/by-game/{
-        game_num}?statType=batting%26statType=pitching%26statType=fielding%26k={key}"
+    json_data = _get_au_softball_game_stats_json(season_id, game_num)
+    player_stats_df, team_stats_df = _parse_au_softball_game_stats(json_data)
 
-    response = requests.get(url, headers=headers)
-    raise_html_status_code(response.status_code)
+    return _au_game_stats_output(
+        player_stats_df,
+        team_stats_df,
+        "softball",
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats,
+        output=output
+    )
 
-    json_data = json.loads(response.text)
 
-    sport = json_data['metaSport']['sport']
-    api_version = json_data['metaSport']['version']
+def _parse_au_softball_pbp(json_data: dict, season: int, game_id: int, return_participation_data=False):
+    """
+    Parses the JSON returned by the Athletes Unlimited (AU) softball play-by-play (PBP) API.
 
-    for i in tqdm(json_data['data']):
-        row_df = pd.DataFrame(
-            {'sport': sport, 'api_version': api_version}, index=[0])
+    Parameters
+    ----------
+    `json_data` (dict, mandatory):
+        The JSON of a `play-by-play` API response.
 
-        ###################################################################
-        # Player/Team info
-        ###################################################################
-        season = get_au_softball_season(i['seasonId'])
-        row_df['season'] = season
-        row_df['seasonId'] = i['seasonId']
-        row_df['weekNumber'] = 0
-        row_df['gameNumber'] = 0
-        row_df['seasonType'] = ""
-
-        row_df['playerId'] = i['playerId']
-        row_df['uniformNumber'] = i['uniformNumber']
-        row_df['uniformNumberDisplay'] = str(i['uniformNumberDisplay'])
-
-        row_df['primaryPositionLk'] = i['primaryPositionLk']
-        row_df['secondaryPositionLk'] = i['secondaryPositionLk']
-        row_df['first_name'] = str(i['firstName']).replace('\u2019', '\'')
-        row_df['last_name'] = str(i['lastName']).replace('\u2019', '\'')
-        row_df['full_name'] = f"{i['firstName']} {i['lastName']}".replace(
-            '\u2019', '\'')
+    `season` (int, mandatory):
+        The season this game was played in.
 
-        ###################################################################
-        # Catching Stats
-        # An endpoint sugests that this is a thing in their API, but no data can be found here.
-        ###################################################################
+    `game_id` (int, mandatory):
+        The game ID of this game.
 
-        ###################################################################
-        # Batting Stats
-        ###################################################################
-        if len(i['battingStats']) > 0:
-            row_df['week'] = i['battingStats'][0]['weekNumber']
-            row_df['game_num'] = i['battingStats'][0]['gameNumber']
-            row_df['season_type'] = i['battingStats'][0]['gamesStarted']
-            row_df['G'] = i['battingStats'][0]['gamesPlayed']
-            row_df['GS'] = i['battingStats'][0]['gamesStarted']
-            row_df['batting_PA'] = 0
-            row_df['batting_AB'] = i['battingStats'][0]['atBat']
-            row_df['batting_R'] = i['battingStats'][0]['runs']
-            row_df['batting_H'] = i['battingStats'][0]['hits']
-            row_df['batting_2B'] = i['battingStats'][0]['doubles']
-            row_df['batting_3B'] = i['battingStats'][0]['triples']
-            row_df['batting_HR'] = i['battingStats'][0]['homeRuns']
-            row_df['batting_RBI'] = i['battingStats'][0]['runsBattedIn']
-            row_df['batting_BB'] = i['battingStats'][0]['baseonBalls']
-            row_df['batting_HBP'] = i['battingStats'][0]['hitByPitch']
-            row_df['batting_K'] = i['battingStats'][0]['strikeOuts']
-            row_df['batting_SB'] = i['battingStats'][0]['stolenBases']
-            row_df['batting_SBA'] = i['battingStats'][0]['stolenBasesAttempts']
-            row_df['batting_CS'] = i['battingStats'][0]['caughtStealing']
-            row_df['batting_BA'] = i['battingStats'][0]['battingAverage']
-            row_df['batting_OBP'] = i['battingStats'][0]['onBasePercentage']
-            row_df['batting_SLG'] = i['battingStats'][0]['sluggingPercentage']
-            row_df['batting_TB'] = i['battingStats'][0]['totalBases']
-            row_df['batting_SF'] = i['battingStats'][0]['sacrificeFly']
-            row_df['batting_SH'] = i['battingStats'][0]['sacrificeHit']
-            row_df['AU_POINTS'] = i['battingStats'][0]['auTotalPoints']
-
-            row_df['batting_PA'] = row_df['batting_AB'] + row_df['batting_BB'] + \
-                row_df['batting_HBP'] + \
-                row_df['batting_SF'] + row_df['batting_SH']
-        else:
-            row_df['batting_AB'] = None
-            row_df['batting_R'] = None
-            row_df['batting_H'] = None
-            row_df['batting_2B'] = None
-            row_df['batting_3B'] = None
-            row_df['batting_HR'] = None
-            row_df['batting_RBI'] = None
-            row_df['batting_BB'] = None
-            row_df['batting_HBP'] = None
-            row_df['batting_K'] = None
-            row_df['batting_SB'] = None
-            row_df['batting_SBA'] = None
-            row_df['batting_CS'] = None
-            row_df['batting_BA'] = None
-            row_df['batting_OBP'] = None
-            row_df['batting_SLG'] = None
-            row_df['batting_TB'] = None
-            row_df['batting_SF'] = None
-            row_df['batting_SH'] = None
+    `return_participation_data` (bool, optional) = `False`:
+        If set to `True`, a secondary pandas DataFrame containing roster information will be returned.
 
-        ###################################################################
-        # Pitching Stats
-        ###################################################################
+    Returns
+    ----------
+    The same data returned by `get_au_softball_pbp()`.
+    """
+    plays = []
 
-        if len(i['pitchingStats']) > 0:
-            row_df['week'] = i['pitchingStats'][0]['weekNumber']
-            row_df['game_num'] = i['pitchingStats'][0]['gameNumber']
-
-            row_df['G'] = i['pitchingStats'][0]['appearances']
-            row_df['GS'] = i['pitchingStats'][0]['gamesStarted']
-            row_df['pitching_W'] = i['pitchingStats'][0]['wins']
-            row_df['pitching_L'] = i['pitchingStats'][0]['losses']
-            row_df['pitching_ERA'] = i['pitchingStats'][0]['earnedRunAverage']
-            row_df['pitching_SHO'] = i['pitchingStats'][0]['shutout']
-            row_df['pitching_CG'] = i['pitchingStats'][0]['completeGames']
-            row_df['pitching_SV'] = i['pitchingStats'][0]['saves']
-            row_df['pitching_IP_str'] = str(
-                i['pitchingStats'][0]['inningsPitched'])
-            row_df['pitching_IP_str'] = row_df['pitching_IP_str'].replace(
-                'None', None)
-
-            try:
-                row_df['pitching_IP'] = float(str(i['pitchingStats'][0]['inningsPitched']).replace(
-                    '.1', '.333').replace('.2', '.667'))
-            except:
-                row_df['pitching_IP'] = None
-
-            row_df['pitching_QS'] = 0
-            row_df['pitching_H'] = i['pitchingStats'][0]['hits']
-            row_df['pitching_R'] = i['pitchingStats'][0]['runs']
-            row_df['pitching_ER'] = i['pitchingStats'][0]['earnedRuns']
-            row_df['pitching_HR'] = i['pitchingStats'][0]['homeRuns']
-            row_df['pitching_BB'] = i['pitchingStats'][0]['baseOnBalls']
-            row_df['pitching_SO'] = i['pitchingStats'][0]['strikeOuts']
-            row_df['pitching_HBP'] = i['pitchingStats'][0]['hitByPitch']
-            row_df['pitching_WP'] = i['pitchingStats'][0]['wildPitch']
-            row_df['pitching_WHIP'] = (
-                row_df['pitching_BB'] + row_df['pitching_H']) / row_df['pitching_IP']
-            row_df['pitching_H9'] = (
-                9 * row_df['pitching_H']) / row_df['pitching_IP']
-            row_df['pitching_HR9'] = (
-                9 * row_df['pitching_HR']) / row_df['pitching_IP']
-            row_df['pitching_BB9'] = (
-                9 * row_df['pitching_BB']) / row_df['pitching_IP']
-            row_df['pitching_SO9'] = (
-                9 * row_df['pitching_SO']) / row_df['pitching_IP']
-            row_df['pitching_SO/BB'] = row_df['pitching_SO'] / \
-                row_df['pitching_BB']
-            row_df['pitching_RA9'] = 9 * \
-                (row_df['pitching_R'] / row_df['pitching_IP'])
-            row_df['pitching_PI'] = i['pitchingStats'][0]['numberOfPitches']
-            row_df['pitching_PI_balls'] = i['pitchingStats'][0]['balls']
-            row_df['pitching_PI_strikes'] = i['pitchingStats'][0]['strikes']
-            row_df['pitcing_game_score'] = 50 + (row_df['pitching_IP'] * 3) + row_df['pitching_SO'] - (row_df['pitching_H'] * 2) - (
-                row_df['pitching_ER'] * 4) - ((row_df['pitching_R'] - row_df['pitching_ER']) * 2) - row_df['pitching_BB']
-            row_df['AU_POINTS'] = i['pitchingStats'][0]['auTotalPoints']
-        else:
-            row_df['pitching_H'] = None
-            row_df['pitching_R'] = None
-            row_df['pitching_ER'] = None
-            row_df['pitching_HR'] = None
-            row_df['pitching_BB'] = None
-            row_df['pitching_SO'] = None
-            row_df['pitching_HBP'] = None
-            row_df['pitching_WP'] = None
-            row_df['pitching_WHIP'] = None
-            row_df['pitching_H9'] = None
-            row_df['pitching_HR9'] = None
-            row_df['pitching_BB9'] = None
-            row_df['pitching_SO9'] = None
-            row_df['pitching_SO/BB'] = None
-            row_df['pitching_RA9'] = None
-            row_df['pitching_PI'] = None
-            row_df['pitching_PI_balls'] = None
-            row_df['pitching_PI_strikes'] = None
+    for i in json_data['data'][0]['plays']:
+        plays.append({
+            'season': season,
+            'game_id': game_id,
+            'game_number': i['gameNumber'],
+            'play_seq_num': i['playSeqno'],
+            'narrative': i['narrative'],
+            'home_team_id': i['homeTeamId'],
+            'home_team_score': i['homeTeamScore'],
+            'away_team_id': i['awayTeamId'],
+            'away_team_score': i['awayTeamScore'],
+            'offensive_team_id': i['offensiveTeamId'],
+            'offensive_team_score': i['offensiveTeamScore'],
+            'defensive_team_id': i['defensiveTeamId'],
+            'defensive_team_score': i['defensiveTeamScore'],
+            'inning': i['inning'],
+            'top_bottom_flag': i['topBottomFlg'],
+            'outs': i['outs'],
+            'winning_team_id': i['winningTeamId'],
+            'action': i['action'],
+            'hit_location': i['hitLocation'],
+            'hit_location_description': i['hitLocationDescription'],
+            'batter_id': i['batterId'],
+            'pitcher_id': i['pitcherId'],
+        })
+
+    game_pbp_df = pd.DataFrame(plays)
+    del plays
 
-        ###################################################################
-        # Fielding Stats
-        ###################################################################
-        if len(i['fieldingStats']) > 0:
-            row_df['week'] = i['fieldingStats'][0]['weekNumber']
-            row_df['game_num'] = i['fieldingStats'][0]['gameNumber']
-
-            row_df['G'] = i['fieldingStats'][0]['gamesPlayed']
-            row_df['fielding_position'] = i['fieldingStats'][0]['position']
-            row_df['fielding_IP_str'] = i['fieldingStats'][0]['inningsPlayed']
-
-            try:
-                row_df['fielding_IP'] = float(str(i['fieldingStats'][0]['inningsPlayed']).replace(
-                    '.1', '.333').replace('.2', '.667'))
-            except:
-                row_df['fielding_IP'] = None
-
-            row_df['fielding_PO'] = i['fieldingStats'][0]['putOuts']
-            row_df['fielding_A'] = i['fieldingStats'][0]['assists']
-            row_df['fielding_E'] = i['fieldingStats'][0]['errors']
-            row_df['fielding_DP'] = i['fieldingStats'][0]['doublePlays']
-            row_df['fielding_FLD%'] = i['fieldingStats'][0]['fieldingPercent']
-            row_df['fielding_CS'] = i['fieldingStats'][0]['caughtStealing']
-            row_df['fielding_CS%'] = i['fieldingStats'][0]['caughtStealingPercentage']
-            row_df['fielding_TC'] = i['fieldingStats'][0]['totalChances']
-
-            row_df['fielding_CH'] = row_df['fielding_PO'] + \
-                row_df['fielding_A'] + row_df['fielding_E']
-            row_df['fielding_RF/9'] = (9 * (row_df['fielding_PO'] +
-                                       row_df['fielding_A'])) / row_df['fielding_IP']
-        else:
-            row_df['fielding_position'] = None
-            row_df['fielding_IP_str'] = None
-            row_df['fielding_IP'] = None
-            row_df['fielding_PO'] = None
-            row_df['fielding_A'] = None
-            row_df['fielding_E'] = None
-            row_df['fielding_DP'] = None
-            row_df['fielding_FLD%'] = None
-            row_df['fielding_CS'] = None
-            row_df['fielding_CS%'] = None
-            row_df['fielding_TC'] = None
-
-            row_df['fielding_CH'] = None
-            row_df['fielding_RF/9'] = None
+    if return_participation_data == True:
+        roster_df = au_parse_game_roster(json_data, season, game_id)
+        return game_pbp_df, roster_df
 
-        ###################################################################
-        # Save the data to the correct DataFrame
-        ###################################################################
+    else:
+        return game_pbp_df
 
-        row_df['type'] = i['type']
-        row_df['teamId'] = i['teamId']
+def _au_softball_pbp_request(season_id: int, game_id: int) -> tuple:
+    """
+    Returns the API request and cache key of the play-by-play (PBP) data of a softball game.
+    Shared by the sync and async (`athetes_unlimited_py.aio`) clients.
+    """
+    return (
+        f"/api/play-by-play/softball/v1/event/{season_id}/game/{game_id}",
+        ("softball", "play-by-play", season_id, game_id),
+    )
 
-        if i['homeTeamFlg'] == True:
-            row_df['homeTeamFlg'] = 1
-        else:
-            row_df['homeTeamFlg'] = 0
 
-        if i['type'] == "Team":
-            team_stats_df = pd.concat(
-                [team_stats_df, row_df], ignore_index=True)
-        else:
-            player_stats_df = pd.concat(
-                [player_stats_df, row_df], ignore_index=True)
-
-        del row_df
-    try:
-        player_stats_df.loc[(player_stats_df['pitching_IP'] >= 6) & (
-            player_stats_df['GS'] == 1) & (player_stats_df['pitching_ER'] <= 3), 'pitching_QS'] = 1
-    except:
-        print('No pitching stats found in this game.')
-    ###################################################################
-    # Once we're done, return the correct dataframe.
-    ###################################################################
+def _get_au_softball_pbp_json(season_id: int, game_id: int) -> dict:
+    """
+    Downloads the play-by-play (PBP) JSON of an Atheltes Unlimited (AU) softball game.
+    """
+    if game_id < 1:
+        raise ValueError('`game_id` cannot be less than 0.')
 
-    if get_player_and_team_stats == True:
-        stats_df = pd.concat(
-            [player_stats_df, team_stats_df], ignore_index=True)
-        del player_stats_df, team_stats_df
-        return stats_df
-    elif get_team_stats == True:
-        del player_stats_df
-        return team_stats_df
-    else:
-        del team_stats_df
-        return player_stats_df
+    request, cache_key = _au_softball_pbp_request(season_id, game_id)
+    return get_au_json(request, cache_key=cache_key)
 
 
-def get_au_softball_pbp(season_id: int, game_id: int, return_participation_data=False) -> pd.DataFrame():
+def get_au_softball_pbp(season_id: int, game_id: int, return_participation_data=False, output: str = "pandas") -> pd.DataFrame:
     """
     Retrieves the play-by-play (PBP) data for an Atheltes Unlimited (AU) softball game.
 
@@ -436,258 +668,403 @@ def get_au_softball_pbp(season_id: int, game_id: int, return_participation_data=
         If set to `True`, `get_au_softball_pbp()` will return a secondary pandas DataFrame
         containing roster information for this AU softball game.
 
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+        If `return_participation_data` is set to `True`, both DataFrames are returned in this format.
+
     Returns
     ----------
     A pandas DataFrame containing PBP data for a given AU game ID within a given AU season ID.
     If `return_participation_data` is set to `True`, an additional pandas DataFrame containing roster data for this game will be returned as well.
     """
-
+    _au_check_output(output)
     # season_id = get_au_softball_season_id(season)
     season = get_au_softball_season(season_id)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
-    game_pbp_df = pd.DataFrame()
-    roster_df = pd.DataFrame()
-    row_df = pd.DataFrame()
+    json_data = _get_au_softball_pbp_json(season_id, game_id)
 
-    if game_id < 1:
-        raise ValueError('`game_id` cannot be less than 0.')
+    pbp = _parse_au_softball_pbp(
+        json_data,
+        season,
+        game_id,
+        return_participation_data=return_participation_data
+    )
+    return _au_game_pbp_output(pbp, "softball", output)
+
+##############################################################################
+##
+# Season Functions
+##
+##############################################################################
 
-    # Yes, the key is literaly the int of the Epoch time at the time of the GET request.
-    key = int(time.time())
-    url = f"https://auprosports.com/proxy.php?request=/api/play-by-play/softball/v1/event/{
-        season_id}/game/{game_id}?k={key}"
 
-    response = requests.get(url, headers=headers)
-    raise_html_status_code(response.status_code)
+def _au_softball_season_pbp_games(season: int, max_workers: int = 1):
+    """
+    Yields the PBP data of every game in an Atheltes Unlimited (AU) softball season, one game at a time.
+    Shared by `get_au_softball_season_pbp()` and `iter_au_softball_season_pbp()`.
+    """
+    seasonId = get_au_softball_season_id(season)
+    sport_json_data = get_au_season_catalog("softball")
 
-    json_data = json.loads(response.text)
+    for i in sport_json_data['data']:
+        # print(i)
+        if i['seasonId'] == seasonId:
+            pbp_season = get_au_softball_season(seasonId)
 
-    del headers, key
+            def get_game(j):
+                json_data = _get_au_softball_pbp_json(seasonId, j)
+                _au_game_fetched("softball", season, j)
+                return _au_measure(
+                    "parse", "softball", "pbp", season,
+                    _parse_au_softball_pbp, json_data, pbp_season, j)
 
-    for i in json_data['data'][0]['plays']:
-        row_df = pd.DataFrame(
-            {'season': season, 'game_id': game_id}, index=[0])
-
-        row_df['game_number'] = i['gameNumber']
-        row_df['play_seq_num'] = i['playSeqno']
-        row_df['narrative'] = i['narrative']
-        row_df['home_team_id'] = i['homeTeamId']
-        row_df['home_team_score'] = i['homeTeamScore']
-        row_df['away_team_id'] = i['awayTeamId']
-        row_df['away_team_score'] = i['awayTeamScore']
-        row_df['offensive_team_id'] = i['offensiveTeamId']
-        row_df['offensive_team_score'] = i['offensiveTeamScore']
-        row_df['defensive_team_id'] = i['defensiveTeamId']
-        row_df['defensive_team_score'] = i['defensiveTeamScore']
-        row_df['inning'] = i['inning']
-        row_df['top_bottom_flag'] = i['topBottomFlg']
-        row_df['outs'] = i['outs']
-        row_df['winning_team_id'] = i['winningTeamId']
-        row_df['action'] = i['action']
-        row_df['hit_location'] = i['hitLocation']
-        row_df['hit_location_description'] = i['hitLocationDescription']
-        row_df['batter_id'] = i['batterId']
-        row_df['pitcher_id'] = i['pitcherId']
-
-        game_pbp_df = pd.concat([game_pbp_df, row_df])
-        del row_df
+            yield from au_imap_games(
+                get_game, i['gameIds'], max_workers,
+                sport="softball", season=season)
 
-    if return_participation_data == True:
 
-        for i in json_data['data'][0]['competitors']:
-
-            competitor_id = i['competitorId']
-            competitor_color = i['color']
-            competitor_name = i['name']
-
-            for j in i['players']:
-                row_df = pd.DataFrame({
-                    'season': season,
-                    'game_id': game_id,
-                    'competitor_id': competitor_id,
-                    'competitor_color': competitor_color,
-                    'competitor_name': competitor_name
-                },
-                    index=[0]
-                )
-
-                row_df['competitor_id'] = j['competitorId']
-                row_df['player_id'] = j['playerId']
-                row_df['captain_flag'] = j['captainFlg']
-                row_df['display_name'] = j['displayName']
-                row_df['first_name'] = j['firstName']
-                row_df['last_name'] = j['lastName']
-                row_df['current_roster_status_description'] = j['currentRosterStatus']['description']
-                row_df['current_rosterStatus_comments'] = j['currentRosterStatus']['comments']
-                row_df['current_rosterStatus_transactionType'] = j['currentRosterStatus']['transactionType']
-                row_df['current_rosterStatus_rosterStatusLk'] = j['currentRosterStatus']['rosterStatusLk']
-                row_df['is_voting_flg'] = j['isVotingFlg']
-                row_df['can_be_voted_for_flg'] = j['canBeVotedForFlg']
-                row_df['has_voted_flag'] = j['hasVotedFlg']
-                row_df['uniform_number'] = str(j['uniformNumber'])
-                row_df['is_nominated_flag'] = j['isNominatedFlg']
-                row_df['nominated_flag'] = j['nominatedFlg']
-                row_df['player_url'] = j['resourceUrl']
-                row_df['image_url'] = j['imageResource']['imageUrl']
-
-                roster_df = pd.concat([roster_df, row_df], ignore_index=True)
-            del row_df
-
-        del json_data
-        return game_pbp_df, roster_df
+def get_au_softball_season_pbp(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) softball season, get and parse all play-by-play (PBP) data for an AU softball season.
 
-    else:
-        del json_data, roster_df
-        return game_pbp_df
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want PBP data from.
 
-##############################################################################
-##
-# Season Functions
-##
-##############################################################################
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_softball_season_pbp()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing PBP data from a AU season.
 
-def get_au_softball_season_pbp(season: int) -> pd.DataFrame():
     """
-    Given an Atheltes Unlimited (AU) softball season, get and parse all play-by-play (PBP) data for an AU softball season.
+    _au_check_output(output)
+    season_pbp_df = au_concat_games(
+        _au_softball_season_pbp_games(season, max_workers),
+        chunk_size=chunk_size
+    )
+
+    return _au_season_output(season_pbp_df, "softball", "pbp", output)
+
+
+def iter_au_softball_season_pbp(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[pd.DataFrame]:
+    """
+    Same as `get_au_softball_season_pbp()`, but yields the play-by-play (PBP) data of an AU softball season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning one DataFrame once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU softball season you want PBP data from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded DataFrame.
+        By default, one DataFrame is yielded for every game.
+
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`), so every chunk has the same columns and types.
+
     Returns
     ----------
-    A pandas DataFrame containing PBP data from a AU season.
-
+    A generator of pandas DataFrames (or `pyarrow.Table`s) containing PBP data from a AU season.
     """
-    season_pbp_df = pd.DataFrame()
-    seasonId = get_au_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"}
+    _au_check_output(output)
+
+    return (
+        _au_season_output(pbp_df, "softball", "pbp", output)
+        for pbp_df in au_chunk_games(
+            _au_softball_season_pbp_games(season, max_workers), chunk_size)
+    )
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+
+def _au_softball_season_box_rows(
+        season: int,
+        season_id: int,
+        max_workers: int = 1,
+        sport: str = "softball"):
+    """
+    Downloads every box score in an Atheltes Unlimited (AU) softball season ID once,
+    and yields the flattened `(player_rows, team_rows)` of every game, one game at a time.
+    Shared by the AU and AUX softball season box score functions.
+    `sport` is the sport sent with progress events (see `set_au_progress()`).
+    """
+    sport_json_data = get_au_season_catalog("softball")
 
     for i in sport_json_data['data']:
         # print(i)
-        if i['seasonId'] == seasonId:
+        if i['seasonId'] == season_id:
             len_game_ids = len(i['gameIds'])
 
-            count = 0
-            for j in tqdm(i['gameIds']):
-                count += 1
-                print(f'\nOn game {count} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+            def get_game(j):
+                json_data = _get_au_softball_game_stats_json(season_id, j)
+                _au_game_fetched(sport, season, j)
+                return _au_measure(
+                    "parse", sport, "box", season,
+                    _flatten_au_softball_game_stats, json_data)
 
-                game_df = get_au_softball_pbp(seasonId, j)
+            yield from au_imap_games(
+                get_game, range(1, len_game_ids+1), max_workers,
+                sport=sport, season=season)
 
-                season_pbp_df = pd.concat(
-                    [season_pbp_df, game_df], ignore_index=True)
-                del game_df
 
-    return season_pbp_df
+def _get_au_softball_season_box(
+        season: int,
+        season_id: int,
+        max_workers: int = 1,
+        chunk_size: int = None,
+        sport: str = "softball") -> tuple:
+    """
+    Builds the player and team box scores of an entire AU softball season ID at once
+    (or every `chunk_size` games, if `chunk_size` is set),
+    from one download of every game.
+    """
+    return au_concat_game_pairs(
+        _au_softball_box_chunks(
+            _au_softball_season_box_rows(season, season_id, max_workers, sport=sport),
+            chunk_size=chunk_size
+        )
+    )
 
 
-def get_au_softball_season_player_box(season: int) -> pd.DataFrame():
+def _au_softball_box_chunks(game_rows, chunk_size: int = None):
+    """
+    Given the flattened `(player_rows, team_rows)` of multiple games,
+    yields `(player_df, team_df)` box scores built from every `chunk_size` games
+    (or from every game at once, if `chunk_size` is not set).
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
+
+    player_rows = []
+    team_rows = []
+    len_games = 0
+
+    for player_rows_in_game, team_rows_in_game in game_rows:
+        player_rows.extend(player_rows_in_game)
+        team_rows.extend(team_rows_in_game)
+        len_games += 1
+
+        if chunk_size is not None and len_games >= chunk_size:
+            yield (
+                _au_softball_box_from_rows(player_rows, is_player_stats=True),
+                _au_softball_box_from_rows(team_rows, is_player_stats=False)
+            )
+            player_rows = []
+            team_rows = []
+            len_games = 0
+
+    if len_games > 0:
+        yield (
+            _au_softball_box_from_rows(player_rows, is_player_stats=True),
+            _au_softball_box_from_rows(team_rows, is_player_stats=False)
+        )
+
+
+def get_au_softball_season_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> tuple:
     """
     Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
-    This returns all player game stats, and does not return season stats or game averages.
+    Every game is downloaded once, and both the player and team game stats are returned.
 
     Parameters
     ----------
     `season` (int, mandatory):
-        The AU softball season you want player box scores from.
+        The AU softball season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_softball_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, pandas DataFrames are returned.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are returned
+        (see `get_au_schema()`).
 
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A tuple containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats from a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
+    _au_check_output(output)
     seasonId = get_au_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    season_player_df, season_team_df = _get_au_softball_season_box(
+        season, seasonId, max_workers=max_workers, chunk_size=chunk_size)
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
+    return (
+        _au_season_output(season_player_df, "softball", "player_box", output),
+        _au_season_output(season_team_df, "softball", "team_box", output)
+    )
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == seasonId:
-            len_game_ids = len(i['gameIds'])
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+def iter_au_softball_season_box(season: int, max_workers: int = 1, chunk_size: int = 1, output: str = "pandas") -> Iterator[tuple]:
+    """
+    Same as `get_au_softball_season_box()`, but yields the player and team box scores of an AU softball season
+    as soon as every game (or every `chunk_size` games) is downloaded and parsed,
+    instead of returning them once the entire season is downloaded.
+    Only the games being downloaded and the chunk being yielded are held in memory.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always yielded in the same order, regardless of how many workers are used.
 
-                game_df = get_au_softball_game_stats(
-                    seasonId, j, get_team_stats=False)
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every yielded tuple.
+        By default, one tuple is yielded for every game.
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+    `output` (str, optional) = "pandas":
+        The format the data is yielded in.
+        If set to `"pandas"`, pandas DataFrames are yielded.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are yielded
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are yielded
+        (see `get_au_schema()`).
 
-    return season_stats_df
+    Returns
+    ----------
+    A generator of tuples containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats.
+    """
+    _au_check_output(output)
 
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
 
-def get_au_softball_season_team_box(season: int) -> pd.DataFrame():
+    seasonId = get_au_softball_season_id(season)
+
+    return (
+        (
+            _au_season_output(player_df, "softball", "player_box", output),
+            _au_season_output(team_df, "softball", "team_box", output)
+        )
+        for player_df, team_df in _au_softball_box_chunks(
+            _au_softball_season_box_rows(season, seasonId, max_workers),
+            chunk_size=chunk_size)
+    )
+
+
+def get_au_softball_season_player_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
     """
     Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
     This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_au_softball_season_box()`.
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU softball season you want player box scores from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_softball_season_box()`.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing player box score stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
 
     """
-    season_stats_df = pd.DataFrame()
-    seasonId = get_au_softball_season_id(season)
-    url = "https://auprosports.com/proxy.php?request=api/seasons/softball/v1"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
+    player_box_df, _ = get_au_softball_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return player_box_df
 
-    response = requests.get(url, headers=headers)
-    sport_json_data = json.loads(response.text)
 
-    for i in sport_json_data['data']:
-        # print(i)
-        if i['seasonId'] == seasonId:
-            len_game_ids = len(i['gameIds'])
+def get_au_softball_season_team_box(season: int, max_workers: int = 1, chunk_size: int = None, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) softball season, get and parse all box-score game stats for an AU softball season.
+    This returns all player game stats, and does not return season stats or game averages.
+    To get both the player and team box scores with one download of every game, use `get_au_softball_season_box()`.
 
-            for j in tqdm(range(1, len_game_ids+1)):
-                print(f'\nOn game {j} of {len_game_ids} for {season}.')
-                # try:
-                #     game_df = get_softball_game_stats(season,j)
-                # except:
-                #     print(f'Couldn\'t parse game stats for game #{j}.')
-                #     time.sleep(10)
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want player box scores from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
 
-                game_df = get_au_softball_game_stats(
-                    seasonId, j, get_team_stats=True)
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame as they are downloaded,
+        which limits how many games are held in memory at once.
+        If not set, every game is combined in one step once the season is downloaded.
+        To only hold `chunk_size` games in memory at once, use `iter_au_softball_season_box()`.
 
-                season_stats_df = pd.concat(
-                    [season_stats_df, game_df], ignore_index=True)
-                del game_df
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
 
-    return season_stats_df
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing player box score stats a AU season.
+
+    """
+    _, team_box_df = get_au_softball_season_box(
+        season, max_workers=max_workers, chunk_size=chunk_size, output=output)
+    return team_box_df
 
 ##############################################################################
 ##
@@ -696,21 +1073,11 @@ def get_au_softball_season_team_box(season: int) -> pd.DataFrame():
 ##############################################################################
 
 
-def get_au_softball_season_player_stats(season: int) -> pd.DataFrame():
+def _au_softball_season_player_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) softball season, get all season player stats for an AU softball season.
-
-    Parameters
-    ----------
-    `season` (int, mandatory):
-        The AU softball season you want season player stats from.
-
-    Returns
-    ----------
-    A pandas DataFrame containing season player stats a AU season.
-
+    Given Athletes Unlimited (AU) softball box score stats for a season, calculates season player stats.
+    Used by `get_au_softball_season_player_stats()`.
     """
-    game_stats_df = get_au_softball_season_player_box(season)
     # ['sport', 'api_version', 'season', 'seasonId', 'weekNumber',
     #    'gameNumber', 'seasonType', 'playerId', 'uniformNumber',
     #    'uniformNumberDisplay', 'primaryPositionLk', 'secondaryPositionLk',
@@ -740,17 +1107,18 @@ def get_au_softball_season_player_stats(season: int) -> pd.DataFrame():
                                                  'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA',
                                                  'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH',
                                                  'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS',
-                                                 'pitching_SV', 'pitching_IP',
+                                                 'pitching_SV', 'pitching_OUTS',
                                                  'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB',
                                                  'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls',
                                                  'pitching_PI_strikes',
-                                                 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
+                                                 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
                                                  'fielding_CS', 'fielding_TC'
                                              ]].sum()
 
-        finished_df[['G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
-            'G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
-        finished_df['pitching_IP'] = finished_df['pitching_IP'].astype('float')
+        finished_df[['G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
+            'G', 'GS', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
+        # Innings are summed as outs, and converted back once.
+        _au_softball_season_innings(finished_df)
         # Batting
         finished_df.loc[finished_df['batting_AB'] >= 1,
                         'batting_BA'] = finished_df['batting_H'] / finished_df['batting_AB']
@@ -795,39 +1163,39 @@ def get_au_softball_season_player_stats(season: int) -> pd.DataFrame():
         finished_df['batting_PSN'] = finished_df['batting_PSN'].round(3)
 
         # Pitching
-        finished_df['pitching_ERA'] = 9 * \
-            (finished_df['pitching_ER'] / finished_df['pitching_IP'])
+        finished_df['pitching_ERA'] = 27 * \
+            (finished_df['pitching_ER'] / finished_df['pitching_OUTS'])
         finished_df['pitching_ERA'] = finished_df['pitching_ERA'].round(3)
 
         finished_df['pitching_ERA+'] = None
         finished_df['pitching_FIP'] = None
         finished_df['pitching_FIP-'] = None
         finished_df['pitching_WHIP'] = (
-            finished_df['pitching_BB'] + finished_df['pitching_H']) / finished_df['pitching_IP']
+            3 * (finished_df['pitching_BB'] + finished_df['pitching_H'])) / finished_df['pitching_OUTS']
         finished_df['pitching_WHIP'] = finished_df['pitching_WHIP'].round(3)
 
         finished_df['pitching_H9'] = (
-            9 * finished_df['pitching_H']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_H']) / finished_df['pitching_OUTS']
         finished_df['pitching_H9'] = finished_df['pitching_H9'].round(3)
 
         finished_df['pitching_HR9'] = (
-            9 * finished_df['pitching_HR']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_HR']) / finished_df['pitching_OUTS']
         finished_df['pitching_HR9'] = finished_df['pitching_HR9'].round(3)
 
         finished_df['pitching_BB9'] = (
-            9 * finished_df['pitching_BB']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_BB']) / finished_df['pitching_OUTS']
         finished_df['pitching_BB9'] = finished_df['pitching_BB9'].round(3)
 
         finished_df['pitching_SO9'] = (
-            9 * finished_df['pitching_SO']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_SO']) / finished_df['pitching_OUTS']
         finished_df['pitching_SO9'] = finished_df['pitching_SO9'].round(3)
 
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO'] / \
             finished_df['pitching_BB']
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO/BB'].round(3)
 
-        finished_df['pitching_RA9'] = 9 * \
-            (finished_df['pitching_R'] / finished_df['pitching_IP'])
+        finished_df['pitching_RA9'] = 27 * \
+            (finished_df['pitching_R'] / finished_df['pitching_OUTS'])
         finished_df['pitching_RA9'] = finished_df['pitching_RA9'].round(3)
 
         # Fielding
@@ -842,8 +1210,8 @@ def get_au_softball_season_player_stats(season: int) -> pd.DataFrame():
         # finished_df['fielding_CS%'] = 0
         # finished_df['fielding_CS%'] = finished_df['fielding_CS%'].round(3)
 
-        finished_df['fielding_RF/9'] = (9 * (finished_df['fielding_PO'] +
-                                        finished_df['fielding_A'])) / finished_df['fielding_IP']
+        finished_df['fielding_RF/9'] = (27 * (finished_df['fielding_PO'] +
+                                         finished_df['fielding_A'])) / finished_df['fielding_OUTS']
         finished_df['fielding_RF/9'] = finished_df['fielding_RF/9'].round(3)
 
         # finished_df.to_csv('test.csv')
@@ -851,25 +1219,48 @@ def get_au_softball_season_player_stats(season: int) -> pd.DataFrame():
         # print(game_stats_df.columns)
         return finished_df
     else:
-        print(f'No AU softball stats found so far in {season}')
+        _au_season_empty("softball", season, "player_stats")
         return pd.DataFrame()
 
 
-def get_au_softball_season_team_stats(season: int) -> pd.DataFrame():
+def get_au_softball_season_player_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
     """
-    Given an Atheltes Unlimited (AU) softball season, get all season team stats for an AU softball season.
+    Given an Atheltes Unlimited (AU) softball season, get all season player stats for an AU softball season.
+    Box scores are downloaded once per season, and are shared with `get_au_softball_season_team_stats()` (see `get_au_season()`).
 
     Parameters
     ----------
     `season` (int, mandatory):
         The AU softball season you want season player stats from.
 
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
     Returns
     ----------
-    A pandas DataFrame containing season player stats a AU season.
+    A pandas DataFrame (or a `pyarrow.Table`) containing season player stats a AU season.
 
     """
-    game_stats_df = get_au_softball_season_player_box(season)
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "softball", season, max_workers=max_workers).player_stats.copy()
+    return _au_season_output(season_stats_df, "softball", "player_stats", output)
+
+
+def _au_softball_season_team_stats_from_box(game_stats_df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """
+    Given Athletes Unlimited (AU) softball box score stats for a season, calculates season team stats.
+    Used by `get_au_softball_season_team_stats()`.
+    """
     # ['sport', 'api_version', 'season', 'seasonId', 'weekNumber',
     #    'gameNumber', 'seasonType', 'playerId', 'uniformNumber',
     #    'uniformNumberDisplay', 'primaryPositionLk', 'secondaryPositionLk',
@@ -898,17 +1289,18 @@ def get_au_softball_season_team_stats(season: int) -> pd.DataFrame():
             'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA',
             'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH',
             'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS',
-            'pitching_SV', 'pitching_IP',
+            'pitching_SV', 'pitching_OUTS',
             'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB',
             'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls',
             'pitching_PI_strikes',
-            'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
+            'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP',
             'fielding_CS', 'fielding_TC'
         ]].sum()
 
-        finished_df[['G',  'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
-            'G', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_IP', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
-        finished_df['pitching_IP'] = finished_df['pitching_IP'].astype('float')
+        finished_df[['G',  'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']] = finished_df[[
+            'G', 'AU_POINTS', 'batting_PA', 'batting_AB', 'batting_R', 'batting_H', 'batting_2B', 'batting_3B', 'batting_HR', 'batting_RBI', 'batting_BB', 'batting_HBP', 'batting_K', 'batting_SB', 'batting_SBA', 'batting_CS', 'batting_TB', 'batting_SF', 'batting_SH', 'pitching_W', 'pitching_L', 'pitching_SHO', 'pitching_CG', 'pitching_QS', 'pitching_SV', 'pitching_OUTS', 'pitching_H', 'pitching_R', 'pitching_ER', 'pitching_HR', 'pitching_BB', 'pitching_SO', 'pitching_HBP', 'pitching_WP', 'pitching_PI', 'pitching_PI_balls', 'pitching_PI_strikes', 'fielding_OUTS', 'fielding_PO', 'fielding_A', 'fielding_E', 'fielding_DP', 'fielding_CS', 'fielding_TC']].astype('int')
+        # Innings are summed as outs, and converted back once.
+        _au_softball_season_innings(finished_df)
         # Batting
         finished_df.loc[finished_df['batting_AB'] >= 1,
                         'batting_BA'] = finished_df['batting_H'] / finished_df['batting_AB']
@@ -953,39 +1345,39 @@ def get_au_softball_season_team_stats(season: int) -> pd.DataFrame():
         finished_df['batting_PSN'] = finished_df['batting_PSN'].round(3)
 
         # Pitching
-        finished_df['pitching_ERA'] = 9 * \
-            (finished_df['pitching_ER'] / finished_df['pitching_IP'])
+        finished_df['pitching_ERA'] = 27 * \
+            (finished_df['pitching_ER'] / finished_df['pitching_OUTS'])
         finished_df['pitching_ERA'] = finished_df['pitching_ERA'].round(3)
 
         finished_df['pitching_ERA+'] = None
         finished_df['pitching_FIP'] = None
         finished_df['pitching_FIP-'] = None
         finished_df['pitching_WHIP'] = (
-            finished_df['pitching_BB'] + finished_df['pitching_H']) / finished_df['pitching_IP']
+            3 * (finished_df['pitching_BB'] + finished_df['pitching_H'])) / finished_df['pitching_OUTS']
         finished_df['pitching_WHIP'] = finished_df['pitching_WHIP'].round(3)
 
         finished_df['pitching_H9'] = (
-            9 * finished_df['pitching_H']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_H']) / finished_df['pitching_OUTS']
         finished_df['pitching_H9'] = finished_df['pitching_H9'].round(3)
 
         finished_df['pitching_HR9'] = (
-            9 * finished_df['pitching_HR']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_HR']) / finished_df['pitching_OUTS']
         finished_df['pitching_HR9'] = finished_df['pitching_HR9'].round(3)
 
         finished_df['pitching_BB9'] = (
-            9 * finished_df['pitching_BB']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_BB']) / finished_df['pitching_OUTS']
         finished_df['pitching_BB9'] = finished_df['pitching_BB9'].round(3)
 
         finished_df['pitching_SO9'] = (
-            9 * finished_df['pitching_SO']) / finished_df['pitching_IP']
+            27 * finished_df['pitching_SO']) / finished_df['pitching_OUTS']
         finished_df['pitching_SO9'] = finished_df['pitching_SO9'].round(3)
 
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO'] / \
             finished_df['pitching_BB']
         finished_df['pitching_SO/BB'] = finished_df['pitching_SO/BB'].round(3)
 
-        finished_df['pitching_RA9'] = 9 * \
-            (finished_df['pitching_R'] / finished_df['pitching_IP'])
+        finished_df['pitching_RA9'] = 27 * \
+            (finished_df['pitching_R'] / finished_df['pitching_OUTS'])
         finished_df['pitching_RA9'] = finished_df['pitching_RA9'].round(3)
 
         # Fielding
@@ -1000,8 +1392,8 @@ def get_au_softball_season_team_stats(season: int) -> pd.DataFrame():
         # finished_df['fielding_CS%'] = 0
         # finished_df['fielding_CS%'] = finished_df['fielding_CS%'].round(3)
 
-        finished_df['fielding_RF/9'] = (9 * (finished_df['fielding_PO'] +
-                                        finished_df['fielding_A'])) / finished_df['fielding_IP']
+        finished_df['fielding_RF/9'] = (27 * (finished_df['fielding_PO'] +
+                                         finished_df['fielding_A'])) / finished_df['fielding_OUTS']
         finished_df['fielding_RF/9'] = finished_df['fielding_RF/9'].round(3)
 
         # finished_df.to_csv('test.csv')
@@ -1010,5 +1402,38 @@ def get_au_softball_season_team_stats(season: int) -> pd.DataFrame():
         return finished_df
 
     else:
-        print(f'No AU softball stats found so far in {season}')
+        _au_season_empty("softball", season, "team_stats")
         return pd.DataFrame()
+
+
+def get_au_softball_season_team_stats(season: int, max_workers: int = 1, output: str = "pandas") -> pd.DataFrame:
+    """
+    Given an Atheltes Unlimited (AU) softball season, get all season team stats for an AU softball season.
+    Box scores are downloaded once per season, and are shared with `get_au_softball_season_player_stats()` (see `get_au_season()`).
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The AU softball season you want season player stats from.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        Games are always returned in the same order, regardless of how many workers are used.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, a pandas DataFrame is returned.
+        If set to `"compact"`, a pandas DataFrame with compact types for this sport is returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, a `pyarrow.Table` with a fixed schema for this sport is returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing season player stats a AU season.
+
+    """
+    _au_check_output(output)
+    season_stats_df = get_au_season(
+        "softball", season, max_workers=max_workers).team_stats.copy()
+    return _au_season_output(season_stats_df, "softball", "team_stats", output)
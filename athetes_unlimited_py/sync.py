@@ -0,0 +1,445 @@
+import hashlib
+import importlib
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from athetes_unlimited_py.cache import _au_game_data_since, _au_game_is_final
+from athetes_unlimited_py.client import get_au_season_catalog
+from athetes_unlimited_py.metrics import _au_measure
+from athetes_unlimited_py.progress import _au_game_fetched
+from athetes_unlimited_py.season import (
+    AU_SEASON_SPORTS,
+    _au_api_sport,
+    get_au_season_id,
+)
+from athetes_unlimited_py.utils import (
+    _au_check_output,
+    _au_season_output,
+    au_concat_games,
+    au_imap_games,
+)
+
+##############################################################################
+##
+# Incremental season sync
+##
+##############################################################################
+
+# dataset -> (API endpoint, the DataFrames stored for it)
+AU_SYNC_DATASETS = {
+    "box": ("by-game", ("player_box", "team_box")),
+    "pbp": ("play-by-play", ("pbp",)),
+}
+
+_au_sync_locks = {}
+_au_sync_locks_lock = threading.Lock()
+
+
+def _au_sync_lock(sync_dir: str, sport: str, season: int) -> threading.Lock:
+    """
+    Returns the lock that stops two threads
+    from syncing the same season into the same folder at once.
+    """
+    key = _au_sync_season_dir(sync_dir, sport, season)
+
+    with _au_sync_locks_lock:
+        lock = _au_sync_locks.get(key)
+
+        if lock is None:
+            lock = threading.Lock()
+            _au_sync_locks[key] = lock
+
+    return lock
+
+
+def _au_sync_season_dir(sync_dir: str, sport: str, season: int) -> str:
+    return os.path.join(
+        os.path.abspath(os.path.expanduser(sync_dir)), sport, str(season))
+
+
+def _au_sync_manifest_path(sync_dir: str, sport: str, season: int) -> str:
+    return os.path.join(
+        _au_sync_season_dir(sync_dir, sport, season), "manifest.json")
+
+
+def _au_sync_frame_path(sync_dir: str, sport: str, season: int, name: str) -> str:
+    return os.path.join(
+        _au_sync_season_dir(sync_dir, sport, season), f"{name}.pkl")
+
+
+def _au_atomic_write(path: str, write) -> None:
+    """
+    Calls `write(temp_path)`, then moves the temporary file to `path`,
+    so that other threads/processes never read a half-written file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    write(temp_path)
+    os.replace(temp_path, path)
+
+
+def get_au_sync_manifest(sport: str, season: int, sync_dir: str) -> dict:
+    """
+    Returns the manifest of a season synced with
+    `sync_au_season_box()` or `sync_au_season_pbp()`.
+
+    For every dataset (`box` or `pbp`), the manifest lists every game
+    that has been downloaded, in order, with:
+    - `game`: the game number (`box`) or game ID (`pbp`),
+    - `final`: `True` if the game is finished, and will never be downloaded again,
+    - `data_since`: when the game was first downloaded with plays or stats
+      (Epoch time), or `None` if it hasn't started yet,
+    - `digest`: a hash of the JSON the game was last parsed from,
+    - `fetched_at`: when the game was last downloaded (Epoch time),
+    - `rows`: the number of rows the game has in every stored DataFrame.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season.
+
+    `sync_dir` (str, mandatory):
+        The folder synced seasons are stored in.
+
+    Returns
+    ----------
+    The manifest, as a dict.
+    If the season has never been synced, an empty manifest is returned.
+    """
+    path = _au_sync_manifest_path(sync_dir, sport, season)
+
+    if not os.path.exists(path):
+        return {
+            "sport": sport,
+            "season": season,
+            "season_id": None,
+            "datasets": {},
+        }
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _au_sync_module(name: str):
+    """
+    Returns a sport module, which is only imported once a season is synced.
+    """
+    return importlib.import_module(f"athetes_unlimited_py.{name}")
+
+
+def _au_sync_games(sport: str, season: int, dataset: str) -> tuple:
+    """
+    Returns a tuple of `(season_id, games)`, where `games` is
+    every game number (`box`) or game ID (`pbp`) of a season,
+    according to the seasons catalog.
+    """
+    season_id = get_au_season_id(sport, season)
+
+    for i in get_au_season_catalog(_au_api_sport(sport))['data']:
+        if i['seasonId'] == season_id:
+            if dataset == "box":
+                return season_id, list(range(1, len(i['gameIds']) + 1))
+            return season_id, list(i['gameIds'])
+
+    return season_id, []
+
+
+def _au_sync_game_parser(sport: str, season: int, season_id: int, dataset: str):
+    """
+    Returns a function that parses the JSON of one game of a season,
+    the same way the `get_au_*_season_box()` and `get_au_*_season_pbp()`
+    functions do, and returns a tuple of every DataFrame stored for `dataset`.
+    """
+    api_sport = _au_api_sport(sport)
+    api_module = _au_sync_module(api_sport)
+
+    if dataset == "box":
+        parse = getattr(api_module, f"_parse_au_{api_sport}_game_stats")
+
+        def parse_game(json_data, game):
+            player_df, team_df = parse(json_data)
+            if sport == "aux_softball":
+                player_df['sport'] = 'aux_softball'
+                team_df['sport'] = 'aux_softball'
+            return player_df, team_df
+    else:
+        parse = getattr(api_module, f"_parse_au_{api_sport}_pbp")
+
+        if sport == "basketball":
+            pbp_season = season
+        else:
+            pbp_season = getattr(api_module, f"get_au_{api_sport}_season")(season_id)
+
+        def parse_game(json_data, game):
+            return (parse(json_data, pbp_season, game),)
+
+    return parse_game
+
+
+def _au_sync_game_loader(sport: str, season: int, season_id: int, dataset: str):
+    """
+    Returns a function that downloads and parses one game of a season
+    (see `_au_sync_game_parser()`), and returns a tuple of `(json_data, dfs)`,
+    where `dfs` is a tuple of every DataFrame stored for `dataset`.
+    """
+    api_sport = _au_api_sport(sport)
+    api_module = _au_sync_module(api_sport)
+    parse_game = _au_sync_game_parser(sport, season, season_id, dataset)
+
+    if dataset == "box":
+        get_json = getattr(api_module, f"_get_au_{api_sport}_game_stats_json")
+    else:
+        get_json = getattr(api_module, f"_get_au_{api_sport}_pbp_json")
+
+    def load_game(game):
+        json_data = get_json(season_id, game)
+        _au_game_fetched(sport, season, game)
+        return json_data, _au_measure(
+            "parse", sport, dataset, season, parse_game, json_data, game)
+
+    return load_game
+
+
+def _au_json_digest(json_data: dict) -> str:
+    return hashlib.sha1(
+        json.dumps(json_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _au_sync_entry_is_final(entry: dict) -> bool:
+    """
+    Returns `True` if a manifest entry is a finished game.
+    Manifests written by older versions may have games with no data
+    marked as final, so entries without `data_since` are downloaded again.
+    """
+    return entry["final"] == True and entry.get("data_since") is not None
+
+
+def _au_sync_season(
+        sport: str,
+        season: int,
+        sync_dir: str,
+        dataset: str,
+        max_workers: int = 1) -> tuple:
+    """
+    Syncs one dataset of a season, and returns every stored DataFrame of it.
+    Shared by `sync_au_season_box()` and `sync_au_season_pbp()`.
+    """
+    if sport not in AU_SEASON_SPORTS:
+        raise ValueError(
+            f'`sport` must be one of {AU_SEASON_SPORTS}, not `{sport}`.')
+
+    endpoint, names = AU_SYNC_DATASETS[dataset]
+    api_sport = _au_api_sport(sport)
+
+    with _au_sync_lock(sync_dir, sport, season):
+        manifest = get_au_sync_manifest(sport, season, sync_dir)
+        entries = manifest["datasets"].get(dataset, {}).get("games", [])
+        frame_paths = [
+            _au_sync_frame_path(sync_dir, sport, season, name) for name in names
+        ]
+
+        season_id, games = _au_sync_games(sport, season, dataset)
+        previous_entries = {entry["game"]: entry for entry in entries}
+
+        if all(os.path.exists(path) for path in frame_paths):
+            stored_dfs = [pd.read_pickle(path) for path in frame_paths]
+        else:
+            # The stored DataFrames are missing, so every game is downloaded again.
+            stored_dfs = None
+            previous_entries = {}
+
+        # Only games that are new, or that weren't finished
+        # the last time the season was synced, are downloaded.
+        games_to_fetch = [
+            game for game in games
+            if game not in previous_entries
+            or not _au_sync_entry_is_final(previous_entries[game])
+        ]
+
+        if stored_dfs is not None and len(games_to_fetch) == 0 \
+                and len(games) == len(entries):
+            return tuple(stored_dfs)
+
+        # The rows of every game already stored, by game.
+        stored_games = {}
+        if stored_dfs is not None:
+            offsets = [0] * len(names)
+
+            for entry in entries:
+                stored_games[entry["game"]] = tuple(
+                    df.iloc[offset:offset + rows]
+                    for df, offset, rows in zip(stored_dfs, offsets, entry["rows"])
+                )
+                offsets = [
+                    offset + rows for offset, rows in zip(offsets, entry["rows"])
+                ]
+
+        fetched_at = time.time()
+        new_entries = {}
+        load_game = _au_sync_game_loader(sport, season, season_id, dataset)
+
+        for game, (json_data, dfs) in zip(
+                games_to_fetch,
+                au_imap_games(
+                    load_game, games_to_fetch, max_workers,
+                    sport=sport, season=season)):
+            data_since = _au_game_data_since(
+                endpoint,
+                json_data,
+                previous_entries.get(game, {}).get("data_since"),
+                fetched_at
+            )
+
+            new_entries[game] = {
+                "game": game,
+                "final": _au_game_is_final(
+                    (api_sport, endpoint, season_id, game), data_since, fetched_at),
+                "data_since": data_since,
+                "digest": _au_json_digest(json_data),
+                "fetched_at": fetched_at,
+                "rows": [len(df) for df in dfs],
+            }
+            stored_games[game] = dfs
+
+        # Rebuild every DataFrame in game order,
+        # with the rows of downloaded games replacing their stored rows.
+        season_entries = []
+        for game in games:
+            entry = new_entries.get(game, previous_entries.get(game))
+            if entry is not None:
+                season_entries.append(entry)
+
+        season_dfs = tuple(
+            au_concat_games(
+                stored_games[entry["game"]][k] for entry in season_entries)
+            for k in range(len(names))
+        )
+
+        for path, df in zip(frame_paths, season_dfs):
+            _au_atomic_write(path, lambda temp_path: df.to_pickle(temp_path))
+
+        manifest["season_id"] = season_id
+        manifest["datasets"][dataset] = {
+            "synced_at": fetched_at,
+            "games": season_entries,
+        }
+
+        def write_manifest(temp_path):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=4)
+
+        _au_atomic_write(
+            _au_sync_manifest_path(sync_dir, sport, season), write_manifest)
+
+        return season_dfs
+
+
+def sync_au_season_box(
+        sport: str,
+        season: int,
+        sync_dir: str,
+        max_workers: int = 1,
+        output: str = "pandas") -> tuple:
+    """
+    Incrementally syncs the player and team box scores of a season
+    into a folder, and returns them.
+
+    The first time a season is synced, every game is downloaded.
+    After that, only games that are new (according to the seasons catalog),
+    or that weren't finished the last time the season was synced,
+    are downloaded, and their rows are added to (or replace their rows in)
+    the stored box scores.
+    A nightly job during a live season only downloads
+    the games played since the last sync.
+
+    A game is finished once it's downloaded after it's over,
+    the same way as in the on-disk cache (see `configure_au_cache()`):
+    games that haven't started yet are never finished,
+    and are downloaded again until they have been played.
+
+    Stored box scores are pickled pandas DataFrames,
+    and should only be loaded from folders you trust.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season you want box scores from.
+
+    `sync_dir` (str, mandatory):
+        The folder synced seasons are stored in.
+        Every season is stored in `<sync_dir>/<sport>/<season>/`.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in.
+        If set to `"pandas"`, pandas DataFrames are returned.
+        If set to `"compact"`, pandas DataFrames with compact types for this sport are returned
+        (see `au_to_compact()`).
+        If set to `"arrow"`, `pyarrow.Table`s with a fixed schema for this sport are returned
+        (see `get_au_schema()`).
+
+    Returns
+    ----------
+    A tuple containing two pandas DataFrames (or two `pyarrow.Table`s).
+    The first contains player box score stats, and the second contains team box score stats from the season.
+    """
+    _au_check_output(output)
+    season_player_df, season_team_df = _au_sync_season(
+        sport, season, sync_dir, "box", max_workers=max_workers)
+
+    return (
+        _au_season_output(season_player_df, sport, "player_box", output),
+        _au_season_output(season_team_df, sport, "team_box", output)
+    )
+
+
+def sync_au_season_pbp(
+        sport: str,
+        season: int,
+        sync_dir: str,
+        max_workers: int = 1,
+        output: str = "pandas") -> pd.DataFrame:
+    """
+    Same as `sync_au_season_box()`, but for the play-by-play (PBP) data of a season.
+
+    Parameters
+    ----------
+    `sport` (str, mandatory):
+        The sport of the season (`basketball`, `lacrosse`, `softball`,
+        `aux_softball` or `volleyball`).
+
+    `season` (int, mandatory):
+        The season you want PBP data from.
+
+    `sync_dir` (str, mandatory):
+        The folder synced seasons are stored in.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+
+    `output` (str, optional) = "pandas":
+        The format the data is returned in (`"pandas"`, `"compact"` or `"arrow"`).
+
+    Returns
+    ----------
+    A pandas DataFrame (or a `pyarrow.Table`) containing PBP data from the season.
+    """
+    _au_check_output(output)
+    season_pbp_df, = _au_sync_season(
+        sport, season, sync_dir, "pbp", max_workers=max_workers)
+
+    return _au_season_output(season_pbp_df, sport, "pbp", output)
@@ -1,3 +1,14 @@
+import itertools
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from athetes_unlimited_py.progress import _au_track_game, get_au_progress
+
+
 def raise_html_status_code(status_code:int):
     match status_code:
         case 200:
@@ -26,11 +37,477 @@ def raise_html_status_code(status_code:int):
             raise ConnectionRefusedError('HTTP 511 Network Authentication Required:\n\tTo use this functtion, and by extension the internet, you need to authenticate your access to this internet connection.')
         case default:
             raise Exception(f'Unhandled HTTP Status code. Code: {status_code}')
-        
+
 # def fix_wierd_strings(string_fixer:str):
 #     try:
 #         string_fixer.replace('\u2019','\'')
 #         return string_fixer
 #     except Exception as e:
 #         print(e)
-#         return string_fixer
\ No newline at end of file
+#         return string_fixer
+
+
+# Matches the API paths used by this package, e.g.
+# `/api/stats/v2/basketball/1/by-game/3?statTypes=basketball`,
+# `/api/play-by-play/softball/v1/event/14/game/1` and `api/seasons/lacrosse/v1`.
+_AU_REQUEST_PATTERNS = (
+    re.compile(r"api/stats/(?:v\d+/)?(?P<sport>\w+)/(?:v\d+/)?(?P<season_id>\d+)/(?P<endpoint>by-game)/(?P<game>\d+)"),
+    re.compile(r"api/(?P<endpoint>play-by-play)/(?P<sport>\w+)/v\d+/event/(?P<season_id>\d+)/game/(?P<game>\d+)"),
+    re.compile(r"api/(?P<endpoint>seasons)/(?P<sport>\w+)/v\d+"),
+)
+
+
+def _au_parse_request(request: str) -> dict | None:
+    """
+    Returns the `sport`, `endpoint` (`by-game`, `play-by-play` or `seasons`),
+    `season_id` and `game` of an API path,
+    or `None` if it isn't one of the API paths used by this package.
+    `season_id` and `game` are `None` for the seasons catalog.
+    """
+    for pattern in _AU_REQUEST_PATTERNS:
+        match = pattern.search(request)
+        if match is not None:
+            groups = match.groupdict()
+            return {
+                "sport": groups["sport"],
+                "endpoint": groups["endpoint"],
+                "season_id": int(groups["season_id"]) if groups.get("season_id") else None,
+                "game": int(groups["game"]) if groups.get("game") else None,
+            }
+
+    return None
+
+
+def au_imap_games(get_game, games, max_workers: int = 1, sport: str = None, season: int = None):
+    """
+    Same as `au_map_games()`, but yields the result of every game
+    as soon as it (and every game before it) is done,
+    instead of returning a list.
+    Results that have been yielded are not kept in memory by this function.
+    """
+    games = list(games)
+
+    if max_workers is None:
+        max_workers = 1
+    elif max_workers < 1:
+        raise ValueError('`max_workers` cannot be less than 1.')
+
+    progress = get_au_progress()
+    if progress is None:
+        yield from _au_imap_games(get_game, games, max_workers)
+        return
+
+    progress.season_started(sport, season, len(games))
+    try:
+        yield from _au_imap_games(
+            _au_track_game(get_game, progress, sport, season),
+            games,
+            max_workers
+        )
+    finally:
+        progress.season_finished(sport, season)
+
+
+def _au_imap_games(get_game, games: list, max_workers: int):
+    if max_workers == 1 or len(games) <= 1:
+        for g in games:
+            yield get_game(g)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(games))) as executor:
+        # Only `2 * max_workers` games are submitted ahead of the one being yielded,
+        # so results don't pile up in memory when the caller is slower than the downloads,
+        # and few downloads are left to finish if the caller stops early.
+        # Results are yielded in the order of `games`, no matter which game finishes first.
+        games = iter(games)
+        pending = deque(
+            executor.submit(get_game, g)
+            for g in itertools.islice(games, 2 * max_workers)
+        )
+
+        try:
+            while len(pending) > 0:
+                future = pending.popleft()
+
+                for g in itertools.islice(games, 1):
+                    pending.append(executor.submit(get_game, g))
+
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def au_map_games(get_game, games, max_workers: int = 1, sport: str = None, season: int = None) -> list:
+    """
+    Calls `get_game()` once for every item in `games`,
+    and returns the results in the same order as `games`.
+
+    Parameters
+    ----------
+    `get_game` (callable, mandatory):
+        A function that takes one item of `games`,
+        and returns the data for that game.
+
+    `games` (iterable, mandatory):
+        The games (game IDs, game numbers, etc.) to get data for.
+
+    `max_workers` (int, optional) = 1:
+        The maximum number of games that will be downloaded and parsed at the same time.
+        If set to 1, games will be downloaded one at a time.
+        A `ValueError` will be raised if `max_workers` is set to less than 1.
+
+    `sport` (str, optional) = None:
+        The sport of `games`, sent with every progress event (see `set_au_progress()`).
+
+    `season` (int, optional) = None:
+        The season of `games`, sent with every progress event.
+
+    Returns
+    ----------
+    A list containing the result of `get_game()` for every item in `games`,
+    in the order of `games`.
+    """
+    return list(au_imap_games(get_game, games, max_workers, sport=sport, season=season))
+
+
+def au_chunk_games(game_dfs, chunk_size: int = 1) -> Iterator[pd.DataFrame]:
+    """
+    Combines every `chunk_size` games of `game_dfs` into one DataFrame,
+    and yields it as soon as its last game arrives.
+
+    Parameters
+    ----------
+    `game_dfs` (iterable, mandatory):
+        The pandas DataFrames of every game, in order.
+        Can be a generator (like `au_imap_games()`).
+
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every DataFrame.
+        The last DataFrame may have fewer games.
+        A `ValueError` will be raised if `chunk_size` is set to less than 1.
+
+    Returns
+    ----------
+    A generator of pandas DataFrames.
+    """
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
+
+    return _au_chunk_games(game_dfs, chunk_size)
+
+
+def _au_chunk_games(game_dfs, chunk_size: int):
+    pending_dfs = []
+
+    for game_df in game_dfs:
+        pending_dfs.append(game_df)
+
+        if len(pending_dfs) >= chunk_size:
+            yield pd.concat(pending_dfs, ignore_index=True)
+            pending_dfs = []
+
+    if len(pending_dfs) > 0:
+        yield pd.concat(pending_dfs, ignore_index=True)
+
+
+def au_chunk_game_pairs(game_pairs, chunk_size: int = 1) -> Iterator[tuple]:
+    """
+    Like `au_chunk_games()`, but for games that return
+    a `(player_df, team_df)` tuple.
+
+    Parameters
+    ----------
+    `game_pairs` (iterable, mandatory):
+        A `(player_df, team_df)` tuple for every game, in order.
+        Can be a generator (like `au_imap_games()`).
+
+    `chunk_size` (int, optional) = 1:
+        The number of games combined into every tuple.
+        A `ValueError` will be raised if `chunk_size` is set to less than 1.
+
+    Returns
+    ----------
+    A generator of `(player_df, team_df)` tuples.
+    """
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
+
+    return _au_chunk_game_pairs(game_pairs, chunk_size)
+
+
+def _au_chunk_game_pairs(game_pairs, chunk_size: int):
+    pending_player_dfs = []
+    pending_team_dfs = []
+
+    for player_df, team_df in game_pairs:
+        pending_player_dfs.append(player_df)
+        pending_team_dfs.append(team_df)
+
+        if len(pending_player_dfs) >= chunk_size:
+            yield au_concat_games(pending_player_dfs), au_concat_games(pending_team_dfs)
+            pending_player_dfs = []
+            pending_team_dfs = []
+
+    if len(pending_player_dfs) > 0:
+        yield au_concat_games(pending_player_dfs), au_concat_games(pending_team_dfs)
+
+
+def au_concat_games(game_dfs, chunk_size: int = None) -> pd.DataFrame:
+    """
+    Combines the DataFrames of multiple games into one DataFrame,
+    copying the data of each game only once.
+
+    Parameters
+    ----------
+    `game_dfs` (iterable, mandatory):
+        The pandas DataFrames of every game, in order.
+        Can be a generator (like `au_imap_games()`),
+        in which case games are combined as they arrive.
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined into one DataFrame
+        as soon as they arrive, and the DataFrames of those games are released.
+        The chunks are combined once, after the last game arrives,
+        so each game is copied twice.
+        If not set, every game is kept until the end,
+        and combined in one step.
+        The combined DataFrame always holds every game,
+        so to only hold `chunk_size` games in memory at once,
+        use `au_chunk_games()` (or the `iter_au_*_season_*()` functions) instead.
+        A `ValueError` will be raised if `chunk_size` is set to less than 1.
+
+    Returns
+    ----------
+    A pandas DataFrame containing the data of every game in `game_dfs`.
+    If `game_dfs` is empty, an empty DataFrame is returned.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
+
+    if chunk_size is None:
+        game_dfs = list(game_dfs)
+    else:
+        game_dfs = list(_au_chunk_games(game_dfs, chunk_size))
+
+    if len(game_dfs) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(game_dfs, ignore_index=True)
+
+
+def au_concat_game_pairs(game_pairs, chunk_size: int = None) -> tuple:
+    """
+    Like `au_concat_games()`, but for games that return
+    a `(player_df, team_df)` tuple,
+    so that the player and team box scores of a season
+    can be built from one download of every game.
+
+    Parameters
+    ----------
+    `game_pairs` (iterable, mandatory):
+        A `(player_df, team_df)` tuple for every game, in order.
+        Can be a generator (like `au_imap_games()`).
+
+    `chunk_size` (int, optional) = None:
+        If set, every `chunk_size` games are combined
+        as soon as they arrive (see `au_concat_games()`).
+        To only hold `chunk_size` games in memory at once,
+        use `au_chunk_game_pairs()` (or the `iter_au_*_season_box()` functions) instead.
+        A `ValueError` will be raised if `chunk_size` is set to less than 1.
+
+    Returns
+    ----------
+    A tuple containing two pandas DataFrames.
+    The first contains the player data of every game,
+    and the second contains the team data of every game.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('`chunk_size` cannot be less than 1.')
+
+    if chunk_size is not None:
+        game_pairs = _au_chunk_game_pairs(game_pairs, chunk_size)
+
+    player_dfs = []
+    team_dfs = []
+
+    for player_df, team_df in game_pairs:
+        player_dfs.append(player_df)
+        team_dfs.append(team_df)
+
+    return au_concat_games(player_dfs), au_concat_games(team_dfs)
+
+
+def au_select_game_stats(
+        player_stats_df,
+        team_stats_df,
+        get_team_stats: bool = False,
+        get_player_and_team_stats: bool = False):
+    """
+    Picks which game stats to return from a `get_au_*_game_stats()` function.
+
+    Parameters
+    ----------
+    `player_stats_df` (pandas.DataFrame, mandatory):
+        The player game stats of a game.
+
+    `team_stats_df` (pandas.DataFrame, mandatory):
+        The team game stats of a game.
+
+    `get_team_stats` (bool, optional) = False:
+        If set to `True`, `team_stats_df` will be returned.
+
+    `get_player_and_team_stats` (bool, optional) = False:
+        If set to `True`, `player_stats_df` and `team_stats_df`
+        will be combined into one pandas DataFrame.
+        Overrides `get_team_stats`.
+
+    Returns
+    ----------
+    A pandas DataFrame containing the requested game stats.
+    """
+    if get_player_and_team_stats == True:
+        return pd.concat([player_stats_df, team_stats_df], ignore_index=True)
+    elif get_team_stats == True:
+        return team_stats_df
+    else:
+        return player_stats_df
+
+
+def au_parse_game_roster(json_data: dict, season: int, game_id: int) -> pd.DataFrame:
+    """
+    Parses the rosters (participation data) found in the JSON
+    of an Athletes Unlimited (AU) play-by-play (PBP) API response.
+    The PBP API returns rosters in the same format for every sport.
+
+    Parameters
+    ----------
+    `json_data` (dict, mandatory):
+        The JSON of a `play-by-play` API response.
+
+    `season` (int, mandatory):
+        The season this game was played in.
+
+    `game_id` (int, mandatory):
+        The game ID of this game.
+
+    Returns
+    ----------
+    A pandas DataFrame containing roster data for this game.
+    """
+    players = []
+
+    for i in json_data['data'][0]['competitors']:
+        competitor_color = i['color']
+        competitor_name = i['name']
+
+        for j in i['players']:
+            players.append({
+                'season': season,
+                'game_id': game_id,
+                'competitor_id': j['competitorId'],
+                'competitor_color': competitor_color,
+                'competitor_name': competitor_name,
+                'player_id': j['playerId'],
+                'captain_flag': j['captainFlg'],
+                'display_name': j['displayName'],
+                'first_name': j['firstName'],
+                'last_name': j['lastName'],
+                'current_roster_status_description': j['currentRosterStatus']['description'],
+                'current_rosterStatus_comments': j['currentRosterStatus']['comments'],
+                'current_rosterStatus_transactionType': j['currentRosterStatus']['transactionType'],
+                'current_rosterStatus_rosterStatusLk': j['currentRosterStatus']['rosterStatusLk'],
+                'is_voting_flg': j['isVotingFlg'],
+                'can_be_voted_for_flg': j['canBeVotedForFlg'],
+                'has_voted_flag': j['hasVotedFlg'],
+                'uniform_number': str(j['uniformNumber']),
+                'is_nominated_flag': j['isNominatedFlg'],
+                'nominated_flag': j['nominatedFlg'],
+                'player_url': j['resourceUrl'],
+                'image_url': j['imageResource']['imageUrl'],
+            })
+
+    return pd.DataFrame(players)
+
+
+AU_OUTPUTS = ("pandas", "compact", "arrow")
+
+
+def _au_check_output(output: str) -> None:
+    """
+    Raises a `ValueError` if `output` is not a supported output format.
+    """
+    if output not in AU_OUTPUTS:
+        raise ValueError(
+            f'`output` must be one of {AU_OUTPUTS}, not `{output}`.')
+
+
+def _au_season_output(df: pd.DataFrame, sport: str, dataset: str, output: str = "pandas"):
+    """
+    Returns the result of a season-level or game-level function in the requested `output` format.
+    `df` is consumed if it is converted to Arrow or compact types.
+    `athetes_unlimited_py.schemas` (and `pyarrow`) is only imported
+    if Arrow or compact output is requested.
+    """
+    _au_check_output(output)
+
+    if output == "arrow":
+        from athetes_unlimited_py.schemas import _au_frame_to_arrow, get_au_schema
+
+        return _au_frame_to_arrow(
+            df, get_au_schema(sport, dataset), consume=True)
+    elif output == "compact":
+        from athetes_unlimited_py.schemas import _au_frame_to_compact, get_au_schema
+
+        return _au_frame_to_compact(
+            df, get_au_schema(sport, dataset), consume=True)
+
+    return df
+
+
+def _au_game_stats_output(
+        player_stats_df,
+        team_stats_df,
+        sport: str,
+        get_team_stats: bool = False,
+        get_player_and_team_stats: bool = False,
+        output: str = "pandas"):
+    """
+    Picks which game stats to return from a `get_au_*_game_stats()` function
+    (see `au_select_game_stats()`), in the requested `output` format.
+    Player and team stats in one DataFrame use the `box` schema of `sport`.
+    """
+    _au_check_output(output)
+
+    if get_player_and_team_stats == True:
+        dataset = "box"
+    elif get_team_stats == True:
+        dataset = "team_box"
+    else:
+        dataset = "player_box"
+
+    game_stats_df = au_select_game_stats(
+        player_stats_df,
+        team_stats_df,
+        get_team_stats=get_team_stats,
+        get_player_and_team_stats=get_player_and_team_stats
+    )
+    return _au_season_output(game_stats_df, sport, dataset, output)
+
+
+def _au_game_pbp_output(pbp, sport: str, output: str = "pandas"):
+    """
+    Returns the result of a `get_au_*_pbp()` function in the requested `output` format.
+    `pbp` is the PBP DataFrame of a game,
+    or a `(pbp_df, roster_df)` tuple if participation data was requested.
+    """
+    _au_check_output(output)
+
+    if isinstance(pbp, tuple):
+        pbp_df, roster_df = pbp
+        return (
+            _au_season_output(pbp_df, sport, "pbp", output),
+            _au_season_output(roster_df, sport, "roster", output),
+        )
+
+    return _au_season_output(pbp, sport, "pbp", output)
@@ -0,0 +1,100 @@
+"""
+Shared by `record_payloads.py` and `bench_parsers.py`.
+
+Recorded payloads are stored with the same layout as
+`configure_au_replay()` (see `athetes_unlimited_py.replay`),
+so they can also be replayed, or served by `AUStandInServer`:
+
+    <payload_dir>/manifest.json
+    <payload_dir>/<api_sport>/seasons.json
+    <payload_dir>/<api_sport>/by-game/<season_id>/<game_num>.json
+    <payload_dir>/<api_sport>/play-by-play/<season_id>/<game_id>.json
+"""
+
+import json
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.dirname(BENCHMARKS_DIR)
+DEFAULT_PAYLOAD_DIR = os.path.join(BENCHMARKS_DIR, "payloads")
+
+# Benchmark the package in this tree, not an installed copy.
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+# sport -> the sport used by the API
+AU_BENCHMARK_SPORTS = {
+    "basketball": "basketball",
+    "lacrosse": "lacrosse",
+    "softball": "softball",
+    "aux_softball": "softball",
+    "volleyball": "volleyball",
+}
+
+from athetes_unlimited_py.replay import au_payload_path
+
+
+def payload_path(payload_dir: str, api_sport: str, endpoint: str, season_id: int, game: int) -> str:
+    """
+    Returns the file a recorded payload is stored in.
+    """
+    return au_payload_path(payload_dir, api_sport, endpoint, season_id, game)
+
+
+def catalog_path(payload_dir: str, api_sport: str) -> str:
+    """
+    Returns the file a recorded seasons catalog is stored in.
+    """
+    return au_payload_path(payload_dir, api_sport, "seasons")
+
+
+def manifest_path(payload_dir: str) -> str:
+    return os.path.join(payload_dir, "manifest.json")
+
+
+def write_json(path: str, json_data: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(json_data, f)
+
+
+def read_json(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_manifest(payload_dir: str) -> dict:
+    """
+    Returns the manifest written by `record_payloads.py`,
+    which lists the season (and season ID) recorded for every sport.
+    """
+    path = manifest_path(payload_dir)
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"No recorded payloads were found in `{payload_dir}`.\n"
+            "Record them first (this needs a network connection) with:\n"
+            "\tpython benchmarks/record_payloads.py")
+
+    return read_json(path)
+
+
+def load_season_payloads(payload_dir: str, api_sport: str, endpoint: str, season_id: int) -> list:
+    """
+    Returns a list of `(game, json_data)` tuples for every recorded game
+    of one endpoint and season ID, in game order.
+    """
+    folder = os.path.join(payload_dir, api_sport, endpoint, str(season_id))
+
+    if not os.path.isdir(folder):
+        return []
+
+    games = sorted(
+        int(f[:-len(".json")]) for f in os.listdir(folder) if f.endswith(".json"))
+
+    return [
+        (g, read_json(payload_path(payload_dir, api_sport, endpoint, season_id, g)))
+        for g in games
+    ]
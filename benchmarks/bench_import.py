@@ -0,0 +1,102 @@
+"""
+Import-time benchmark for `athetes_unlimited_py`.
+
+Every measurement is made in a new Python process,
+so that nothing is already imported.
+Exits with a status code of 1 if `import athetes_unlimited_py`
+takes longer than `--budget` seconds (median of `--runs` runs),
+or if it imports any of the packages in `HEAVY_MODULES`.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--budget 0.05]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages that `import athetes_unlimited_py` must not import by itself.
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "requests", "tqdm", "aiohttp")
+
+_TIME_IMPORT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+end = time.perf_counter()
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(end - start, ",".join(heavy))
+"""
+
+
+def time_import(statement: str) -> tuple:
+    """
+    Runs `statement` in a new Python process,
+    and returns how long it took (in seconds),
+    and which of `HEAVY_MODULES` were imported by it.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (PACKAGE_DIR, env.get("PYTHONPATH")) if p)
+
+    result = subprocess.run(
+        [sys.executable, "-c",
+         _TIME_IMPORT.format(statement=statement, heavy=HEAVY_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    seconds, _, heavy = result.stdout.strip().partition(" ")
+    return float(seconds), [m for m in heavy.split(",") if m]
+
+
+def median_import(statement: str, runs: int) -> tuple:
+    """
+    Returns the median time of `runs` runs of `time_import(statement)`,
+    and the heavy modules imported by the last run.
+    """
+    times = []
+    heavy = []
+
+    for _ in range(runs):
+        seconds, heavy = time_import(statement)
+        times.append(seconds)
+
+    return statistics.median(times), heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=0.05)
+    args = parser.parse_args()
+
+    seconds, heavy = median_import("import athetes_unlimited_py", args.runs)
+    print(f"import athetes_unlimited_py: {seconds * 1000:.1f} ms "
+          f"(budget: {args.budget * 1000:.1f} ms)")
+
+    # Not part of the budget, but useful to see what touching one sport costs.
+    for sport in ("basketball", "lacrosse", "softball", "aux_softball", "volleyball"):
+        sport_seconds, _ = median_import(
+            f"import athetes_unlimited_py.{sport}", max(1, args.runs // 2))
+        print(f"import athetes_unlimited_py.{sport}: {sport_seconds * 1000:.1f} ms")
+
+    failed = False
+
+    if seconds > args.budget:
+        print("FAIL: `import athetes_unlimited_py` is over budget.")
+        failed = True
+
+    if len(heavy) > 0:
+        print(f"FAIL: `import athetes_unlimited_py` imported {heavy}.")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
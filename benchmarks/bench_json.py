@@ -0,0 +1,201 @@
+"""
+Offline parity check and benchmark of every installed JSON backend
+(see `configure_au_json()`), run on payloads recorded with `record_payloads.py`.
+
+Every recorded payload of every endpoint (`seasons`, `by-game` and
+`play-by-play`) is decoded from its raw bytes with every installed backend,
+and has to be identical (values *and* types) to what the standard library's
+`json` returns. The script exits with an error if any payload differs.
+
+For every backend and endpoint, this also reports how many MB/sec are decoded,
+compared to `json.loads(bytes.decode())` (what the package used to do).
+
+Usage:
+    python benchmarks/bench_json.py [--repeat 5] [--payloads benchmarks/payloads]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+from _payloads import (
+    DEFAULT_PAYLOAD_DIR,
+    catalog_path,
+    load_manifest,
+)
+
+from athetes_unlimited_py.decode import (
+    AU_JSON_BACKENDS,
+    au_json_loads,
+    configure_au_json,
+)
+
+AU_BENCHMARK_ENDPOINTS = ("seasons", "by-game", "play-by-play")
+
+
+def load_raw_payloads(payload_dir: str) -> dict:
+    """
+    Returns `{endpoint: [(path, raw bytes), ...]}`
+    for every payload recorded for the seasons in the manifest.
+    """
+    manifest = load_manifest(payload_dir)
+    raw_payloads = {endpoint: [] for endpoint in AU_BENCHMARK_ENDPOINTS}
+    seen = set()
+
+    for entry in manifest["seasons"].values():
+        api_sport = entry["api_sport"]
+        paths = [catalog_path(payload_dir, api_sport)]
+
+        for endpoint in ("by-game", "play-by-play"):
+            folder = os.path.join(
+                payload_dir, api_sport, endpoint, str(entry["season_id"]))
+            if os.path.isdir(folder):
+                paths.extend(
+                    os.path.join(folder, f)
+                    for f in sorted(os.listdir(folder)) if f.endswith(".json"))
+
+        for path in paths:
+            if path in seen or not os.path.exists(path):
+                continue
+            seen.add(path)
+
+            if path.endswith("seasons.json"):
+                endpoint = "seasons"
+            else:
+                endpoint = os.path.basename(os.path.dirname(os.path.dirname(path)))
+
+            with open(path, "rb") as f:
+                raw_payloads[endpoint].append((path, f.read()))
+
+    return raw_payloads
+
+
+def first_difference(a, b, path: str = "$") -> str | None:
+    """
+    Returns where `a` and `b` first differ (in value or in type),
+    or `None` if they are identical.
+    """
+    if type(a) is not type(b):
+        return f"{path}: {type(a).__name__} != {type(b).__name__}"
+
+    if isinstance(a, dict):
+        if list(a) != list(b):
+            return f"{path}: keys differ"
+        for key in a:
+            difference = first_difference(a[key], b[key], f"{path}.{key}")
+            if difference is not None:
+                return difference
+        return None
+
+    if isinstance(a, list):
+        if len(a) != len(b):
+            return f"{path}: {len(a)} items != {len(b)} items"
+        for i, (x, y) in enumerate(zip(a, b)):
+            difference = first_difference(x, y, f"{path}[{i}]")
+            if difference is not None:
+                return difference
+        return None
+
+    if a != b and not (a != a and b != b):  # NaN == NaN here.
+        return f"{path}: {a!r} != {b!r}"
+
+    return None
+
+
+def installed_backends() -> list:
+    backends = []
+
+    for backend in AU_JSON_BACKENDS:
+        try:
+            configure_au_json(backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+
+    configure_au_json()
+    return backends
+
+
+def check_parity(backends: list, raw_payloads: dict) -> int:
+    """
+    Returns the number of payloads that decode differently from `json`.
+    """
+    failures = 0
+
+    for backend in backends:
+        configure_au_json(backend)
+
+        for endpoint, payloads in raw_payloads.items():
+            for path, raw in payloads:
+                difference = first_difference(au_json_loads(raw), json.loads(raw))
+                if difference is not None:
+                    failures += 1
+                    print(f"MISMATCH {backend} {path}: {difference}")
+
+    configure_au_json()
+    return failures
+
+
+def best_time(func, repeat: int) -> float:
+    times = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def bench_backends(backends: list, raw_payloads: dict, repeat: int) -> None:
+    for endpoint, payloads in raw_payloads.items():
+        if len(payloads) == 0:
+            continue
+
+        raws = [raw for _, raw in payloads]
+        megabytes = sum(len(raw) for raw in raws) / 1e6
+
+        baseline = best_time(
+            lambda: [json.loads(raw.decode("utf-8")) for raw in raws], repeat)
+        print(f"{endpoint} ({len(raws)} payloads, {megabytes:.2f} MB):")
+        print(f"  {'json (str)':<12}{megabytes / baseline:>10,.1f} MB/sec")
+
+        for backend in backends:
+            configure_au_json(backend)
+            seconds = best_time(lambda: [au_json_loads(raw) for raw in raws], repeat)
+            print(
+                f"  {backend:<12}{megabytes / seconds:>10,.1f} MB/sec"
+                f"  ({baseline / seconds:.2f}x)")
+
+        configure_au_json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOAD_DIR,
+                        help="The folder recorded payloads are read from.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Every benchmark is run this many times, and the fastest run is kept.")
+    args = parser.parse_args()
+
+    raw_payloads = load_raw_payloads(args.payloads)
+    backends = installed_backends()
+    print(f"Installed JSON backends: {', '.join(backends)}")
+
+    failures = check_parity(backends, raw_payloads)
+    checked = sum(len(payloads) for payloads in raw_payloads.values())
+
+    if failures > 0:
+        print(f"{failures} payload(s) decoded differently from `json`.")
+        sys.exit(1)
+
+    print(f"Every backend decoded all {checked} payloads identically to `json`.")
+    bench_backends(backends, raw_payloads, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Offline benchmark of the parsers and season stats of every sport,
+run on payloads recorded with `record_payloads.py` (no network is used).
+
+For every sport, this reports:
+- plays/sec of the PBP parser used by `get_au_*_pbp()`,
+- rows/sec of the box score parser used by `get_au_*_game_stats()`,
+- time and peak memory of the season player and team stats
+  calculated from the box scores of the recorded season.
+
+Results are saved as JSON, so that runs can be compared with `--compare`.
+
+Usage:
+    python benchmarks/bench_parsers.py [--repeat 5] [--output results.json] [--compare old.json]
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+from _payloads import (
+    BENCHMARKS_DIR,
+    DEFAULT_PAYLOAD_DIR,
+    load_manifest,
+    load_season_payloads,
+)
+
+import pandas as pd
+
+from athetes_unlimited_py.season import _AU_TEAM_STATS_FROM_PLAYER_BOX
+from athetes_unlimited_py.utils import au_concat_game_pairs
+
+
+def _module(name: str):
+    return importlib.import_module(f"athetes_unlimited_py.{name}")
+
+
+def best_time(func, repeat: int) -> float:
+    """
+    Returns the fastest of `repeat` calls to `func()`, in seconds.
+    """
+    times = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def peak_memory(func) -> int:
+    """
+    Returns the peak memory (in bytes) allocated by one call to `func()`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def _count_rows(result) -> int:
+    if isinstance(result, tuple):
+        return sum(_count_rows(r) for r in result)
+    return len(result)
+
+
+def bench_pbp(parse_pbp, payloads: list, season: int, repeat: int) -> dict:
+    plays = sum(len(json_data['data'][0]['plays']) for _, json_data in payloads)
+    rows = sum(
+        _count_rows(parse_pbp(json_data, season, game_id))
+        for game_id, json_data in payloads)
+
+    seconds = best_time(
+        lambda: [parse_pbp(json_data, season, game_id)
+                 for game_id, json_data in payloads],
+        repeat)
+
+    return {
+        "games": len(payloads),
+        "plays": plays,
+        "rows": rows,
+        "seconds": seconds,
+        "plays_per_sec": plays / seconds if seconds > 0 else None,
+        "rows_per_sec": rows / seconds if seconds > 0 else None,
+    }
+
+
+def bench_game_stats(parse_game_stats, payloads: list, repeat: int) -> dict:
+    rows = sum(_count_rows(parse_game_stats(json_data)) for _, json_data in payloads)
+
+    seconds = best_time(
+        lambda: [parse_game_stats(json_data) for _, json_data in payloads],
+        repeat)
+
+    return {
+        "games": len(payloads),
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else None,
+    }
+
+
+def bench_season_stats(stats_from_box, box_df: pd.DataFrame, season: int, repeat: int) -> dict:
+    seconds = best_time(lambda: stats_from_box(box_df.copy(), season), repeat)
+    peak = peak_memory(lambda: stats_from_box(box_df.copy(), season))
+
+    return {
+        "input_rows": len(box_df),
+        "rows": len(stats_from_box(box_df.copy(), season)),
+        "seconds": seconds,
+        "peak_memory_bytes": peak,
+    }
+
+
+def build_season_box(sport: str, box_payloads: list) -> tuple:
+    """
+    Builds the player and team box scores of the recorded season,
+    the same way the `get_au_*_season_box()` functions do.
+    """
+    if sport in ("softball", "aux_softball"):
+        softball = _module("softball")
+        player_rows = []
+        team_rows = []
+
+        for _, json_data in box_payloads:
+            game_player_rows, game_team_rows = softball._flatten_au_softball_game_stats(json_data)
+            player_rows.extend(game_player_rows)
+            team_rows.extend(game_team_rows)
+
+        player_df = softball._au_softball_box_from_rows(player_rows, is_player_stats=True)
+        team_df = softball._au_softball_box_from_rows(team_rows, is_player_stats=False)
+
+        if sport == "aux_softball":
+            player_df['sport'] = 'aux_softball'
+            team_df['sport'] = 'aux_softball'
+
+        return player_df, team_df
+
+    parse_game_stats = getattr(_module(sport), f"_parse_au_{sport}_game_stats")
+    return au_concat_game_pairs(
+        parse_game_stats(json_data) for _, json_data in box_payloads)
+
+
+def bench_sport(payload_dir: str, sport: str, entry: dict, repeat: int) -> dict:
+    api_sport = entry["api_sport"]
+    season = entry["season"]
+    season_id = entry["season_id"]
+
+    api_module = _module(api_sport)
+    parse_pbp = getattr(api_module, f"_parse_au_{api_sport}_pbp")
+    parse_game_stats = getattr(api_module, f"_parse_au_{api_sport}_game_stats")
+
+    if sport == "aux_softball":
+        stats_module = _module("aux_softball")
+        prefix = "_aux_softball"
+    else:
+        stats_module = api_module
+        prefix = f"_au_{sport}"
+
+    pbp_payloads = load_season_payloads(payload_dir, api_sport, "play-by-play", season_id)
+    box_payloads = load_season_payloads(payload_dir, api_sport, "by-game", season_id)
+
+    results = {
+        "season": season,
+        "pbp": bench_pbp(parse_pbp, pbp_payloads, season, repeat),
+        "game_stats": bench_game_stats(parse_game_stats, box_payloads, repeat),
+    }
+
+    player_box_df, team_box_df = build_season_box(sport, box_payloads)
+
+    if sport in _AU_TEAM_STATS_FROM_PLAYER_BOX:
+        team_stats_box_df = player_box_df
+    else:
+        team_stats_box_df = team_box_df
+
+    results["player_stats"] = bench_season_stats(
+        getattr(stats_module, f"{prefix}_season_player_stats_from_box"),
+        player_box_df, season, repeat)
+    results["team_stats"] = bench_season_stats(
+        getattr(stats_module, f"{prefix}_season_team_stats_from_box"),
+        team_stats_box_df, season, repeat)
+
+    return results
+
+
+def print_results(results: dict, previous: dict = None) -> None:
+    """
+    Prints every result, and how it compares to `previous` (if set).
+    """
+    columns = (
+        ("pbp", "plays_per_sec"),
+        ("game_stats", "rows_per_sec"),
+        ("player_stats", "seconds"),
+        ("player_stats", "peak_memory_bytes"),
+        ("team_stats", "seconds"),
+        ("team_stats", "peak_memory_bytes"),
+    )
+
+    for sport, sport_results in results["sports"].items():
+        print(f"{sport} {sport_results['season']}:")
+
+        for dataset, key in columns:
+            value = sport_results[dataset][key]
+            line = f"  {dataset:<14}{key:<20}{value or 0:>16,.4f}"
+
+            if previous is not None:
+                old = previous.get("sports", {}).get(sport, {}).get(dataset, {}).get(key)
+                if old and value:
+                    line += f"  ({value / old:.2f}x previous)"
+
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOAD_DIR,
+                        help="The folder recorded payloads are read from.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Every benchmark is run this many times, and the fastest run is kept.")
+    parser.add_argument("--output", default=None,
+                        help="The JSON file results are saved to. "
+                        "Defaults to `benchmarks/results/<time>.json`.")
+    parser.add_argument("--compare", default=None,
+                        help="A JSON file saved by an earlier run, to compare this run to.")
+    parser.add_argument("--sports", nargs="+", default=None)
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.payloads)
+
+    results = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "payloads_recorded_at": manifest.get("recorded_at"),
+        "repeat": args.repeat,
+        "sports": {},
+    }
+
+    for sport, entry in manifest["seasons"].items():
+        if args.sports is not None and sport not in args.sports:
+            continue
+        results["sports"][sport] = bench_sport(args.payloads, sport, entry, args.repeat)
+
+    previous = None
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    print_results(results, previous)
+
+    output = args.output
+    if output is None:
+        output = os.path.join(
+            BENCHMARKS_DIR, "results",
+            time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()) + ".json")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+
+    print(f"Results saved to `{output}`.")
+
+
+if __name__ == "__main__":
+    main()
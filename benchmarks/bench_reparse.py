@@ -0,0 +1,91 @@
+"""
+Offline benchmark of `reparse_au_season_box()` and `reparse_au_season_pbp()`,
+run on payloads recorded with `record_payloads.py` (no network is used).
+
+For every sport, this reports how many games/sec are reparsed
+with 1, 2, 4, ... worker processes (up to `--max-workers`),
+so that you can check that reparsing scales with the number of cores.
+
+Usage:
+    python benchmarks/bench_reparse.py [--repeat 3] [--max-workers 8] [--payloads benchmarks/payloads]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from _payloads import DEFAULT_PAYLOAD_DIR, load_manifest
+
+from athetes_unlimited_py.reparse import (
+    reparse_au_season_box,
+    reparse_au_season_pbp,
+)
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = []
+    count = 1
+
+    while count < max_workers:
+        counts.append(count)
+        count *= 2
+
+    counts.append(max_workers)
+    return counts
+
+
+def bench_reparse(payload_dir: str, sport: str, season: int, games: int, max_workers: int, repeat: int) -> dict:
+    results = {}
+
+    # The pool is started before timing, so that only parsing is measured.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(abs, range(max_workers)))
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            reparse_au_season_box(sport, season, payload_dir=payload_dir, executor=executor)
+            reparse_au_season_pbp(sport, season, payload_dir=payload_dir, executor=executor)
+            times.append(time.perf_counter() - start)
+
+    seconds = min(times)
+    results["seconds"] = seconds
+    results["games_per_sec"] = 2 * games / seconds if seconds > 0 else None
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOAD_DIR,
+                        help="The folder recorded payloads are read from.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Every benchmark is run this many times, and the fastest run is kept.")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sports", nargs="+", default=None)
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.payloads)
+    print(f"{os.cpu_count()} cores")
+
+    for sport, entry in manifest["seasons"].items():
+        if args.sports is not None and sport not in args.sports:
+            continue
+
+        print(f"{sport} {entry['season']} ({entry['games']} games):")
+        baseline = None
+
+        for count in worker_counts(args.max_workers):
+            result = bench_reparse(
+                args.payloads, sport, entry["season"], entry["games"], count, args.repeat)
+
+            if baseline is None:
+                baseline = result["seconds"]
+
+            print(
+                f"  {count:>3} workers{result['games_per_sec'] or 0:>12,.1f} games/sec"
+                f"  ({baseline / result['seconds']:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
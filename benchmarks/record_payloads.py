@@ -0,0 +1,104 @@
+"""
+Records the `seasons`, `by-game` and `play-by-play` API payloads
+of one season of every sport, for `bench_parsers.py` to run on with no network.
+
+This is the only benchmark script that needs a network connection.
+
+Usage:
+    python benchmarks/record_payloads.py [--season 2023] [--games 10] [--sports lacrosse softball]
+"""
+
+import argparse
+import importlib
+import time
+
+from _payloads import (
+    AU_BENCHMARK_SPORTS,
+    DEFAULT_PAYLOAD_DIR,
+    catalog_path,
+    manifest_path,
+    payload_path,
+    write_json,
+)
+
+from athetes_unlimited_py.client import get_au_season_catalog
+
+
+def _sport_function(api_sport: str, name: str):
+    module = importlib.import_module(f"athetes_unlimited_py.{api_sport}")
+    return getattr(module, name)
+
+
+def get_season_id(sport: str, season: int) -> int:
+    if sport == "aux_softball":
+        return _sport_function("aux_softball", "get_aux_softball_season_id")(season)
+
+    return _sport_function(sport, f"get_au_{sport}_season_id")(season)
+
+
+def record_sport(payload_dir: str, sport: str, season: int, num_games: int = None) -> dict:
+    """
+    Records one season of `sport`, and returns its manifest entry.
+    """
+    api_sport = AU_BENCHMARK_SPORTS[sport]
+    season_id = get_season_id(sport, season)
+
+    catalog = get_au_season_catalog(api_sport, refresh=True)
+    write_json(catalog_path(payload_dir, api_sport), catalog)
+
+    game_ids = []
+    for i in catalog['data']:
+        if i['seasonId'] == season_id:
+            game_ids = i['gameIds']
+
+    if num_games is not None:
+        game_ids = game_ids[:num_games]
+
+    get_pbp_json = _sport_function(api_sport, f"_get_au_{api_sport}_pbp_json")
+    get_box_json = _sport_function(api_sport, f"_get_au_{api_sport}_game_stats_json")
+
+    for game_id in game_ids:
+        write_json(
+            payload_path(payload_dir, api_sport, "play-by-play", season_id, game_id),
+            get_pbp_json(season_id, game_id))
+
+    for game_num in range(1, len(game_ids) + 1):
+        write_json(
+            payload_path(payload_dir, api_sport, "by-game", season_id, game_num),
+            get_box_json(season_id, game_num))
+
+    print(f"{sport} {season}: recorded {len(game_ids)} games.")
+
+    return {
+        "season": season,
+        "season_id": season_id,
+        "api_sport": api_sport,
+        "games": len(game_ids),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOAD_DIR,
+                        help="The folder payloads are recorded to.")
+    parser.add_argument("--season", type=int, default=2023)
+    parser.add_argument("--games", type=int, default=None,
+                        help="Only record the first N games of every season.")
+    parser.add_argument("--sports", nargs="+", default=list(AU_BENCHMARK_SPORTS),
+                        choices=list(AU_BENCHMARK_SPORTS))
+    args = parser.parse_args()
+
+    manifest = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "seasons": {},
+    }
+
+    for sport in args.sports:
+        manifest["seasons"][sport] = record_sport(
+            args.payloads, sport, args.season, num_games=args.games)
+
+    write_json(manifest_path(args.payloads), manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Offline parity tests for `au_json_loads()`.
+
+Every backend must decode the committed fixtures (a seasons catalog,
+a by-game box score and a play-by-play response) to the same Python objects
+as `json.loads(response.text)`, which is what this package used before
+`au_json_loads()` was added.
+"""
+
+import json
+import math
+import pathlib
+
+import pytest
+import requests
+
+from athetes_unlimited_py.decode import (
+    AU_JSON_BACKENDS,
+    au_json_loads,
+    configure_au_json,
+    get_au_json_backend,
+)
+
+FIXTURE_DIR = pathlib.Path(__file__).parent / "fixtures"
+FIXTURES = (
+    "seasons_basketball.json",
+    "by_game_basketball.json",
+    "play_by_play_volleyball.json",
+)
+
+
+def _au_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    response._content = content
+    return response
+
+
+@pytest.fixture(params=AU_JSON_BACKENDS)
+def backend(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+
+    configure_au_json(request.param)
+    yield request.param
+    configure_au_json(None)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_au_json_loads_matches_json(backend, fixture):
+    response = _au_response((FIXTURE_DIR / fixture).read_bytes())
+    expected = json.loads(response.text)
+
+    assert get_au_json_backend() == backend
+    assert au_json_loads(response.content) == expected
+    assert au_json_loads(response.text) == expected
+
+
+def test_au_json_loads_falls_back_to_json_on_nan(backend):
+    decoded = au_json_loads(b'{"ERA": NaN, "WHIP": Infinity}')
+
+    assert math.isnan(decoded["ERA"])
+    assert decoded["WHIP"] == math.inf
+
+
+def test_au_json_loads_falls_back_to_json_on_wide_integers(backend):
+    content = b'{"playerId": 123456789012345678901234567890}'
+
+    assert au_json_loads(content) == json.loads(content)
+
+
+@pytest.mark.parametrize("content", [
+    b'',
+    b'{"data": [',
+    b'<html>502 Bad Gateway</html>',
+])
+def test_au_json_loads_raises_on_invalid_json(backend, content):
+    with pytest.raises(ValueError):
+        au_json_loads(content)
+
+
+def test_configure_au_json_picks_an_installed_backend():
+    configure_au_json(None)
+
+    assert get_au_json_backend() in AU_JSON_BACKENDS
+
+
+def test_configure_au_json_rejects_unknown_backends():
+    with pytest.raises(ValueError):
+        configure_au_json("ujson")